@@ -0,0 +1,109 @@
+"""
+Benchmark connection-setup overhead of the ticket endpoints.
+
+Runs list_tickets and get_ticket through the full Django request cycle with
+CONN_MAX_AGE=0 (new connection per request) and with persistent connections
+(DB_CONN_MAX_AGE), and reports latency and connections opened.
+
+Run from services/ticket-service/src against a database with some tickets:
+    python ../../../scripts/benchmark_db_connections.py --requests 200
+"""
+import argparse
+import os
+import statistics
+import time
+
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.tickets.models import Ticket
+
+
+def make_token(user):
+    """Access token for an existing local user."""
+    token = AccessToken()
+    token['user_id'] = str(user.id)
+    token['employee_code'] = user.employee_code
+    token['email'] = user.email or ''
+    token['full_name'] = f"{user.first_name} {user.last_name}".strip()
+    return str(token)
+
+
+def run(client, path, token, requests, conn_max_age):
+    """Time `requests` GETs of path with the given CONN_MAX_AGE."""
+    connection.close()
+    connection.settings_dict['CONN_MAX_AGE'] = conn_max_age
+
+    opened = []
+    counter = lambda **kwargs: opened.append(1)
+    connection_created.connect(counter)
+    try:
+        # Warm up caches (JWT user sync, URL resolver) outside the measurement
+        client.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+        opened.clear()
+
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            # The test client skips the request_started/finished connection
+            # handling of the real handlers, so apply it here
+            close_old_connections()
+            response = client.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+            close_old_connections()
+            timings.append((time.perf_counter() - start) * 1000)
+            if response.status_code != 200:
+                raise SystemExit(f"GET {path} returned {response.status_code}")
+    finally:
+        connection_created.disconnect(counter)
+        connection.close()
+
+    timings.sort()
+    return {
+        'mean': statistics.mean(timings),
+        'p50': timings[len(timings) // 2],
+        'p95': timings[int(len(timings) * 0.95) - 1],
+        'connections': len(opened),
+    }
+
+
+def benchmark(requests):
+    """Compare CONN_MAX_AGE=0 with persistent connections for both endpoints."""
+    ticket = Ticket.objects.order_by('-created_at').first()
+    user = get_user_model().objects.first()
+    if ticket is None or user is None:
+        raise SystemExit("No tickets or users found; load some data first")
+    token = make_token(user)
+    persistent_age = settings.DATABASES['default']['CONN_MAX_AGE'] or 60
+
+    client = Client()
+    endpoints = [
+        ('list_tickets', '/api/v1/tickets/'),
+        ('get_ticket', f'/api/v1/tickets/{ticket.id}'),
+    ]
+
+    print(f"{requests} requests per run, host {connection.settings_dict['HOST']}:{connection.settings_dict['PORT']}")
+    print(f"{'endpoint':<14}{'CONN_MAX_AGE':>14}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'connections':>13}")
+    for name, path in endpoints:
+        for conn_max_age in (0, persistent_age):
+            result = run(client, path, token, requests, conn_max_age)
+            print(
+                f"{name:<14}{conn_max_age:>14}{result['mean']:>10.2f}{result['p50']:>10.2f}"
+                f"{result['p95']:>10.2f}{result['connections']:>13}"
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and setting')
+    args = parser.parse_args()
+    benchmark(args.requests)
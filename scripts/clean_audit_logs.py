@@ -1,31 +1,33 @@
 """
 Clean old audit logs (archive after 7 years).
+
+audit_logs is partitioned by month, so archival detaches whole partitions
+instead of updating rows. Also creates the upcoming monthly partitions.
 """
 import os
 import django
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 django.setup()
 
-from apps.audit.models import AuditLog
+from django.conf import settings
+from apps.audit.partitions import archive_partitions, ensure_partitions
 
 
 def archive_old_logs():
-    """Archive audit logs older than 7 years."""
-    seven_years_ago = datetime.now() - timedelta(days=7*365)
-    
-    logs_to_archive = AuditLog.objects.filter(
-        archived_at__isnull=True,
-        timestamp__lt=seven_years_ago
-    )
-    
-    count = logs_to_archive.update(archived_at=datetime.now())
-    print(f"Archived {count} audit logs")
+    """Archive audit log partitions older than the retention period (7 years by default)."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.AUDIT_RETENTION_DAYS)
+    export_dir = settings.AUDIT_ARCHIVE_DIR or None
 
+    created = ensure_partitions()
+    print(f"Created {len(created)} upcoming partitions")
 
-if __name__ == '__main__':
-    archive_old_logs()
+    archived = archive_partitions(cutoff, export_dir=export_dir)
+    destination = f"exported to {export_dir}" if export_dir else "kept as detached tables"
+    print(f"Archived {len(archived)} audit log partitions ({destination})")
 
 
+if __name__ == '__main__':
+    archive_old_logs()
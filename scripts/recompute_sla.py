@@ -0,0 +1,29 @@
+"""
+Recompute the due dates of open tickets from the current SLA templates.
+
+Run after changing SLA templates to apply the new resolution times to
+tickets already in progress (default: only new deadlines use them).
+Deadlines set by hand (PATCH /tickets/{id}/sla) are left unchanged.
+Usage, from services/ticket-service/src:
+
+    python ../../../scripts/recompute_sla.py [department_id]
+"""
+import os
+import sys
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
+
+from apps.tickets.services.sla_policy import SLAPolicyResolver
+
+
+def recompute_sla(department_id=None):
+    """Recompute due dates and report how many changed."""
+    updated = SLAPolicyResolver.recompute(department_id=department_id)
+    print(f"Recomputed due dates of {updated} tickets")
+
+
+if __name__ == '__main__':
+    recompute_sla(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,28 @@
+"""
+Reconcile the ticket dashboard counters (ticket_counters) and the department
+load (departments.active_tickets) with the tickets table.
+
+Both are updated incrementally on every ticket save; this repairs drift from bulk updates, raw SQL or failed writes. Run periodically (e.g.
+hourly from cron) from services/ticket-service/src.
+"""
+import os
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
+
+from apps.tickets.services.department_load import DepartmentLoadService
+from apps.tickets.services.ticket_counters import TicketCounterService
+
+
+def reconcile_counters():
+    """Recount every counter group and report how many were corrected."""
+    corrected = TicketCounterService.reconcile()
+    print(f"Reconciled ticket counters: {corrected} groups corrected")
+    corrected = DepartmentLoadService.recount()
+    print(f"Recounted department load: {corrected} departments corrected")
+
+
+if __name__ == '__main__':
+    reconcile_counters()
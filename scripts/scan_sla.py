@@ -0,0 +1,26 @@
+"""
+Scan open tickets for upcoming and missed SLA deadlines.
+
+Marks the tickets and publishes ticket.sla_warning / ticket.sla_breached
+events, from which the communication service sends reminders and
+escalations. Run every few minutes (e.g. from cron) from
+services/ticket-service/src.
+"""
+import os
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+django.setup()
+
+from apps.tickets.services.sla_scanner import SLAScanner
+
+
+def scan_sla():
+    """Run one SLA scan and report what it found."""
+    result = SLAScanner.scan()
+    print(f"SLA scan: {result['breached']} tickets breached, {result['reminded']} reminded")
+
+
+if __name__ == '__main__':
+    scan_sla()
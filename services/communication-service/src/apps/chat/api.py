@@ -2,23 +2,59 @@
 Chat API endpoints.
 """
 from ninja import Router
-from typing import List
-from apps.chat.schemas import ChatMessageOut, ChatMessageIn
+from ninja.errors import HttpError
+from typing import List, Optional
+from django.conf import settings
+from django.db import transaction
+from apps.chat.schemas import ChatMessageOut, ChatMessagePageOut, ChatMessageIn
 from apps.chat.models import ChatMessage
+from apps.chat.history import ChatHistory
 
 from ninja.security import HttpBearer
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from hdms_core.authentication import RemoteJWTAuthentication
+from hdms_core.db_router import replica_reads
+from hdms_core.pagination import keyset_paginate
 
 router = Router(tags=["chat"], auth=RemoteJWTAuthentication())
 
 
 @router.get("/messages/ticket/{ticket_id}", response=List[ChatMessageOut])
+@replica_reads
 def list_messages(request, ticket_id: str):
     """List chat messages for a ticket."""
     messages = ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
-    return [ChatMessageOut.from_orm(msg) for msg in messages]
+    return ChatMessageOut.from_orm_many(list(messages))
+
+
+@router.get("/messages/ticket/{ticket_id}/paged", response=ChatMessagePageOut)
+@replica_reads
+def list_messages_paged(request, ticket_id: str, cursor: Optional[str] = None, page_size: Optional[int] = None):
+    """List chat messages for a ticket one page at a time (keyset pagination, newest first).
+    
+    Pages are ordered on (created_at, id), a range scan of the (ticket_id,
+    created_at) index. The first page normally comes from the ticket's
+    recent messages in Redis (apps.chat.history) without a query.
+    
+    Args:
+        cursor: next_cursor from the previous page (omit for the newest messages)
+        page_size: Messages per page (defaults to CHAT_PAGE_SIZE, capped at CHAT_MAX_PAGE_SIZE)
+    """
+    page_size = min(max(page_size or settings.CHAT_PAGE_SIZE, 1), settings.CHAT_MAX_PAGE_SIZE)
+    
+    if not cursor:
+        page = ChatHistory.first_page(ticket_id, page_size)
+        if page is not None:
+            items, next_cursor = page
+            return {'items': items, 'next_cursor': next_cursor}
+    
+    queryset = ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
+    try:
+        messages, next_cursor = keyset_paginate(queryset, cursor=cursor, page_size=page_size)
+    except ValueError:
+        raise HttpError(400, "Invalid cursor")
+    return {'items': ChatMessageOut.from_orm_many(messages), 'next_cursor': next_cursor}
 
 
 @router.post("/messages", response=ChatMessageOut)
@@ -29,12 +65,14 @@ def create_message(request, payload: ChatMessageIn):
     sender_id = request.auth.id
     
     print(f"DEBUG: create_message payload: {payload.dict()}, sender: {sender_id}", flush=True)
-    message = ChatMessage.objects.create(
-        ticket_id=payload.ticket_id,
-        sender_id=sender_id,
-        message=payload.message,
-        mentions=payload.mentions or []
-    )
+    # Atomic with its outbox event (apps.chat.signals)
+    with transaction.atomic():
+        message = ChatMessage.objects.create(
+            ticket_id=payload.ticket_id,
+            sender_id=sender_id,
+            message=payload.message,
+            mentions=payload.mentions or []
+        )
     return ChatMessageOut.from_orm(message)
 
 
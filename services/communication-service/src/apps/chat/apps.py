@@ -0,0 +1,13 @@
+"""
+App configuration for Chat app.
+"""
+from django.apps import AppConfig
+
+
+class ChatConfig(AppConfig):
+    name = 'apps.chat'
+    label = 'chat'
+
+    def ready(self):
+        # Register signal receivers
+        from . import signals  # noqa: F401
@@ -2,9 +2,17 @@
 WebSocket consumer for chat.
 """
 import json
+import uuid
+from datetime import datetime
+from urllib.parse import parse_qs
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
-from apps.chat.models import ChatMessage, TicketParticipant
+from django.utils import timezone
+from apps.chat.models import ChatMessage
+from apps.chat.participants import ParticipantCache
+from apps.chat.services import ChatService
+from apps.chat.writer import chat_writer
+from hdms_core.clients.ticket_client import AsyncTicketClient
 
 
 class ChatConsumer(AsyncWebsocketConsumer):
@@ -32,6 +40,15 @@ class ChatConsumer(AsyncWebsocketConsumer):
             return
         
         self.user_id = str(self.user.id)
+        # Stored message id -> id sent by the client, until acknowledged
+        self.client_ids = {}
+        
+        # Reject unknown tickets only: while Ticket Service is unavailable the
+        # chat stays open (async client: no executor thread is held)
+        if await AsyncTicketClient.is_missing(self.ticket_id, token=self.scope.get('token')):
+            print(f"❌ WebSocket rejected: Ticket {self.ticket_id} not found")
+            await self.close()
+            return
         
         # Join room group
         await self.channel_layer.group_add(
@@ -44,6 +61,9 @@ class ChatConsumer(AsyncWebsocketConsumer):
         
         # Add participant
         await self.add_participant()
+        
+        # Resume: send what was missed since the client's last seen message
+        await self.replay_missed()
 
     
     async def disconnect(self, close_code):
@@ -69,16 +89,41 @@ class ChatConsumer(AsyncWebsocketConsumer):
             print(f"⚠️ Ignoring empty/null message from user {self.user_id}")
             return
             
-        # Save message to database
-        chat_message = await self.save_message(message, mentions)
+        # The client's id is only an idempotency key: the stored id is derived from it
+        # and the sender, so a resend maps to the same message and no one can reuse
+        # the id of somebody else's message
+        try:
+            client_id = uuid.UUID(str(data['id'])) if data.get('id') else None
+        except ValueError:
+            print(f"⚠️ Ignoring message with invalid id from user {self.user_id}")
+            return
+        if client_id:
+            message_id = uuid.uuid5(uuid.UUID(self.user_id), str(client_id))
+            self.client_ids[str(message_id)] = str(client_id)
+        else:
+            message_id = uuid.uuid4()
+        chat_message = ChatMessage(
+            id=message_id,
+            ticket_id=self.ticket_id,
+            sender_id=self.user_id,
+            message=message,
+            mentions=mentions or [],
+            created_at=timezone.now(),
+        )
+        
+        # Written in the background (acked to the sender once durable), broadcast right away
+        if chat_writer.enabled:
+            chat_writer.add(chat_message, self.channel_name)
+        else:
+            await self.save_message(chat_message)
         
-        # Broadcast message to room group
         await self.channel_layer.group_send(
             self.room_group_name,
             {
                 'type': 'chat_message',
                 'message': {
                     'id': str(chat_message.id),
+                    'client_id': str(client_id) if client_id else None,
                     'ticket_id': str(chat_message.ticket_id),
                     'sender_id': str(chat_message.sender_id),
                     'sender_name': f"{self.user.first_name} {self.user.last_name}".strip() or self.user.employee_code,
@@ -101,23 +146,70 @@ class ChatConsumer(AsyncWebsocketConsumer):
             'data': message
         }))
     
+    async def chat_ack(self, event):
+        """Receive persistence result of this connection's messages from the chat writer."""
+        # Acknowledged by the id the client sent
+        ids = [self.client_ids.pop(message_id, message_id) for message_id in event['ids']]
+        if event.get('error'):
+            await self.send(text_data=json.dumps({
+                'type': 'nack',
+                'data': {'ids': ids, 'error': event['error']}
+            }))
+        else:
+            await self.send(text_data=json.dumps({
+                'type': 'ack',
+                'data': {'ids': ids}
+            }))
     
-    @database_sync_to_async
-    def save_message(self, message, mentions):
-        """Save chat message to database."""
-        return ChatMessage.objects.create(
-            ticket_id=self.ticket_id,
-            sender_id=self.user_id,
-            message=message,
-            mentions=mentions or []
+    async def ticket_event(self, event):
+        """Receive ticket update (status change, assignment) from room group."""
+        await self.send(text_data=json.dumps({
+            'type': 'ticket_event',
+            'event': event['event'],
+            'data': event['data']
+        }))
+    
+    
+    async def replay_missed(self):
+        """
+        Replay messages missed while disconnected.
+        
+        The client passes ?last_seen=<message id> (or ?since=<created_at>) of
+        the newest message it has. Messages sent while replaying may arrive
+        both live and replayed; clients drop duplicates by id.
+        """
+        query_params = parse_qs(self.scope.get('query_string', b'').decode())
+        last_seen = query_params.get('last_seen', [None])[0]
+        since = query_params.get('since', [None])[0]
+        if not last_seen and not since:
+            return
+        try:
+            last_seen = uuid.UUID(last_seen) if last_seen else None
+            since = datetime.fromisoformat(since) if since else None
+        except ValueError:
+            print(f"⚠️ Ignoring invalid resume position from user {self.user_id}")
+            return
+        if since is not None and timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        
+        messages, cursor = await database_sync_to_async(ChatService.get_missed_messages)(
+            self.ticket_id, last_seen_id=last_seen, since=since
         )
+        await self.send(text_data=json.dumps({
+            'type': 'replay',
+            'data': {'messages': messages, 'cursor': cursor}
+        }))
     
     @database_sync_to_async
-    def add_participant(self):
+    def save_message(self, chat_message):
+        """Save chat message to database and ack it (CHAT_WRITE_BEHIND disabled)."""
+        chat_writer.write(chat_message, self.channel_name)
+    
+    async def add_participant(self):
         """Add user as ticket participant."""
-        TicketParticipant.objects.get_or_create(
-            ticket_id=self.ticket_id,
-            user_id=self.user_id
-        )
+        # Reconnect of a known participant: no thread hop, no query
+        if ParticipantCache.is_known_member(self.ticket_id, self.user_id):
+            return
+        await database_sync_to_async(ParticipantCache.add)(self.ticket_id, self.user_id)
 
 
@@ -0,0 +1,27 @@
+"""
+Event bus handlers for Chat app (see events.consumer).
+"""
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+from events.consumer import event_handler
+
+
+@event_handler('ticket.status_changed', 'ticket.assigned')
+def push_ticket_update(event):
+    """Show status changes and assignments live in the ticket's chat room."""
+    payload = event.payload
+    group = f"chat_{payload['id']}"
+    message = {
+        'type': 'ticket_event',
+        'event': event.type,
+        'data': {
+            'ticket_id': payload['id'],
+            'status': payload['status'],
+            'old_status': payload.get('old_status'),
+            'assignee_id': payload['assignee_id'],
+            'occurred_at': event.occurred_at,
+        },
+    }
+    # Pushed once the event is recorded as processed (no repeats on redelivery)
+    transaction.on_commit(lambda: async_to_sync(get_channel_layer().group_send)(group, message))
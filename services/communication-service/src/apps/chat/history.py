@@ -0,0 +1,185 @@
+"""
+Recent chat messages of each ticket, kept in Redis.
+
+The newest CHAT_RECENT_MESSAGES messages of a ticket are held in a sorted
+set (member: serialized ChatMessageOut, score: created_at), so opening a
+chat - the first page of its history - does not query Postgres. Messages
+are added once committed (apps.chat.signals, apps.chat.writer). Adding is
+idempotent and order-independent, so a message committed while the set is
+being filled from the database is never lost.
+
+The set only answers a page once it has been filled (marker key, valid for
+CHAT_RECENT_TTL seconds and then refilled); until then, older pages, and
+whenever Redis is unavailable, history is read from the database.
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from hdms_core.pagination import encode_cursor
+
+from .models import ChatMessage
+from .schemas import ChatMessageOut
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'hdms:chat:recent:'
+
+# Marker values: the set holds the ticket's whole history, or only its newest messages
+COMPLETE = 'complete'
+PARTIAL = 'partial'
+
+_redis = None
+
+
+def get_redis():
+    """Redis client of the cache database (REDIS_URL)."""
+    global _redis
+    if _redis is None:
+        import redis
+        _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _redis
+
+
+def _position(item: dict) -> Tuple[datetime, str]:
+    """Sort key of a serialized message: (created_at, id), the keyset pagination order."""
+    return datetime.fromisoformat(item['created_at']), item['id']
+
+
+class ChatHistory:
+    """Per-ticket ring buffer of the newest chat messages."""
+
+    @staticmethod
+    def cache_key(ticket_id) -> str:
+        return f'{CACHE_PREFIX}{ticket_id}'
+
+    @staticmethod
+    def marker_key(ticket_id) -> str:
+        return f'{CACHE_PREFIX}{ticket_id}:filled'
+
+    @staticmethod
+    def size() -> int:
+        return getattr(settings, 'CHAT_RECENT_MESSAGES', 50)
+
+    @staticmethod
+    def ttl() -> int:
+        return getattr(settings, 'CHAT_RECENT_TTL', 3600)
+
+    @classmethod
+    def _add(cls, pipe, ticket_id, items: List[ChatMessageOut]):
+        """Queue adding messages to a ticket's set, trimmed to its size."""
+        key = cls.cache_key(ticket_id)
+        # Full microsecond precision: cursors built from these must match the database
+        pipe.zadd(key, {item.model_dump_json(): item.created_at.timestamp() for item in items})
+        pipe.zremrangebyrank(key, 0, -cls.size() - 1)
+        pipe.expire(key, cls.ttl())
+
+    @classmethod
+    def push(cls, messages: Iterable[ChatMessage]):
+        """Add committed messages to the recent messages of their tickets."""
+        by_ticket = {}
+        for item in ChatMessageOut.from_orm_many(list(messages)):
+            by_ticket.setdefault(item.ticket_id, []).append(item)
+        if not by_ticket:
+            return
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for ticket_id, items in by_ticket.items():
+                cls._add(pipe, ticket_id, items)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not add chat messages to recent history, dropping it: {e}")
+            cls.invalidate(*by_ticket)
+
+    @classmethod
+    def fill(cls, ticket_id) -> str:
+        """Load the newest messages of a ticket from the database; returns the marker set."""
+        size = cls.size()
+        messages = list(
+            ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
+            .order_by('-created_at', '-id')[:size]
+        )
+        marker = COMPLETE if len(messages) < size else PARTIAL
+        pipe = get_redis().pipeline(transaction=True)
+        if messages:
+            cls._add(pipe, ticket_id, ChatMessageOut.from_orm_many(messages))
+        pipe.set(cls.marker_key(ticket_id), marker, ex=cls.ttl())
+        pipe.execute()
+        return marker
+
+    @classmethod
+    def _load(cls, ticket_id) -> Tuple[List[dict], bool]:
+        """
+        Recent messages of a ticket, newest first, filling the set if needed.
+
+        Returns:
+            (items, complete): complete if items are the ticket's whole history
+        """
+        client = get_redis()
+        marker = client.get(cls.marker_key(ticket_id)) or cls.fill(ticket_id)
+        entries = client.zrevrange(cls.cache_key(ticket_id), 0, -1)
+
+        items = {}
+        for entry in entries:
+            item = json.loads(entry)
+            # A message serialized twice (e.g. sender renamed in between) counts once
+            items.setdefault(item['id'], item)
+        items = sorted(items.values(), key=_position, reverse=True)
+        # Never trimmed since filled with the whole history
+        return items, marker == COMPLETE and len(entries) < cls.size()
+
+    @classmethod
+    def first_page(cls, ticket_id, page_size: int) -> Optional[Tuple[List[dict], Optional[str]]]:
+        """
+        Newest page of a ticket's history, from Redis.
+
+        Returns:
+            (items, next_cursor) like keyset_paginate(), or None if the page must be read from the database
+        """
+        try:
+            items, complete = cls._load(ticket_id)
+        except Exception as e:
+            logger.warning(f"Recent chat history of ticket {ticket_id} unavailable: {e}")
+            return None
+
+        if len(items) > page_size:
+            return items[:page_size], encode_cursor(*_position(items[page_size - 1]))
+        if complete:
+            return items, None
+        return None
+
+    @classmethod
+    def since(cls, ticket_id, last_seen_id=None, since: datetime = None) -> Optional[List[dict]]:
+        """
+        Messages newer than the given one (or timestamp), oldest first, from Redis.
+
+        Returns:
+            The messages, or None if they reach back beyond the recent messages
+        """
+        try:
+            items, complete = cls._load(ticket_id)
+        except Exception as e:
+            logger.warning(f"Recent chat history of ticket {ticket_id} unavailable: {e}")
+            return None
+
+        if last_seen_id is not None:
+            last_seen = next((item for item in items if item['id'] == str(last_seen_id)), None)
+            if last_seen is None:
+                return None
+            position = _position(last_seen)
+        else:
+            # Messages at exactly `since` count as seen, whatever their id
+            position = (since, 'ffffffff-ffff-ffff-ffff-ffffffffffff')
+            if not complete and (not items or position < _position(items[-1])):
+                return None
+        return [item for item in reversed(items) if _position(item) > position]
+
+    @classmethod
+    def invalidate(cls, *ticket_ids):
+        """Drop the recent messages of tickets (next read refills them from the database)."""
+        try:
+            get_redis().delete(*(key for ticket_id in ticket_ids for key in (cls.marker_key(ticket_id), cls.cache_key(ticket_id))))
+        except Exception as e:
+            logger.error(f"Could not drop recent chat history of tickets {', '.join(map(str, ticket_ids))}: {e}")
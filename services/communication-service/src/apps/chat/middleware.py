@@ -46,6 +46,7 @@ class JWTAuthMiddleware(BaseMiddleware):
                         scope['user'] = user
                         scope['user_id'] = str(user.id)
                         scope['token_validated'] = True
+                        scope['token'] = token  # Forwarded on inter-service calls
                         print(f"✅ JWT validated & JIT synced for user: {user.employee_code} (UUID: {user.id})")
                     else:
                         scope['user'] = None
@@ -0,0 +1,120 @@
+"""
+Cached ticket chat membership (ticket_participants).
+
+The participants of a ticket are cached as one set per ticket, in two tiers:
+a per-process LRU (hdms_core.cache.LocalTTLCache, CLIENT_CACHE_LOCAL_TTL
+seconds) in front of the shared Django cache (CHAT_PARTICIPANT_CACHE_TTL
+seconds). Reconnects of known participants are answered from the cache;
+only new participants are written to ticket_participants, after which the
+shared set is dropped and rebuilt by the next lookup.
+
+The shared set is stored under a per-ticket version that invalidate()
+bumps, so a lookup that read the database before a new participant was
+committed can only store its stale set under the version nobody reads any
+more.
+"""
+import logging
+import time
+from typing import FrozenSet
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from hdms_core.cache import LocalTTLCache, MISSING
+
+from .models import TicketParticipant
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = 'hdms:chat:participants:'
+
+
+class ParticipantCache:
+    """Membership of ticket chats, answered from the cache where possible."""
+
+    local = LocalTTLCache(maxsize=5000)
+
+    @staticmethod
+    def cache_key(ticket_id, version) -> str:
+        return f'{CACHE_PREFIX}{ticket_id}:{version}'
+
+    @staticmethod
+    def version_key(ticket_id) -> str:
+        return f'{CACHE_PREFIX}{ticket_id}:version'
+
+    @classmethod
+    def _shared_ttl(cls) -> int:
+        return getattr(settings, 'CHAT_PARTICIPANT_CACHE_TTL', 3600)
+
+    @classmethod
+    def _version(cls, ticket_id: str) -> int:
+        version = cache.get(cls.version_key(ticket_id))
+        if version is None:
+            # Never a version used before the key expired or was evicted
+            cache.add(cls.version_key(ticket_id), time.time_ns(), cls._shared_ttl())
+            version = cache.get(cls.version_key(ticket_id))
+        return version
+
+    @classmethod
+    def _local_ttl(cls) -> int:
+        return getattr(settings, 'CLIENT_CACHE_LOCAL_TTL', 10)
+
+    @classmethod
+    def members(cls, ticket_id) -> FrozenSet[str]:
+        """User ids (as strings) of the participants of a ticket's chat."""
+        ticket_id = str(ticket_id)
+        members = cls.local.get(ticket_id)
+        if members is not MISSING:
+            return members
+
+        # Read before the database, so an invalidation in between is not overwritten
+        key = cls.cache_key(ticket_id, cls._version(ticket_id))
+        members = cache.get(key)
+        if members is None:
+            members = frozenset(
+                str(user_id) for user_id in
+                TicketParticipant.objects.filter(ticket_id=ticket_id).values_list('user_id', flat=True)
+            )
+            cache.set(key, members, cls._shared_ttl())
+        cls.local.set(ticket_id, members, cls._local_ttl())
+        return members
+
+    @classmethod
+    def is_member(cls, ticket_id, user_id) -> bool:
+        """Whether the user takes part in the ticket's chat."""
+        return str(user_id) in cls.members(ticket_id)
+
+    @classmethod
+    def is_known_member(cls, ticket_id, user_id) -> bool:
+        """is_member() from this process's tier only (no I/O, safe in the event loop)."""
+        members = cls.local.get(str(ticket_id))
+        return members is not MISSING and str(user_id) in members
+
+    @classmethod
+    def add(cls, ticket_id, user_id) -> bool:
+        """
+        Make the user a participant of the ticket's chat.
+
+        Returns:
+            True if the user was not a participant before
+        """
+        ticket_id, user_id = str(ticket_id), str(user_id)
+        if cls.is_member(ticket_id, user_id):
+            return False
+
+        _, created = TicketParticipant.objects.get_or_create(ticket_id=ticket_id, user_id=user_id)
+        # Also when not created: a cached set without an existing participant is stale
+        transaction.on_commit(lambda: cls.invalidate(ticket_id))
+        if created:
+            logger.debug(f"User {user_id} joined the chat of ticket {ticket_id}")
+        return created
+
+    @classmethod
+    def invalidate(cls, ticket_id):
+        """Drop the cached participants of a ticket (this process and shared)."""
+        try:
+            cache.incr(cls.version_key(ticket_id))
+        except ValueError:
+            # Expired or evicted: the next lookup starts a new version
+            pass
+        cls.local.delete(str(ticket_id))
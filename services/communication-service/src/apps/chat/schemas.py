@@ -2,7 +2,7 @@
 Pydantic schemas for Chat Service.
 """
 from ninja import Schema
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -52,6 +52,39 @@ class ChatMessageOut(Schema):
         )
 
 
+    @staticmethod
+    def from_orm_many(messages) -> List['ChatMessageOut']:
+        """Serialize messages with one query for all their senders."""
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+        
+        senders = {
+            str(sender.id): sender
+            for sender in User.objects.filter(id__in={str(msg.sender_id) for msg in messages})
+        }
+        result = []
+        for msg in messages:
+            sender = senders.get(str(msg.sender_id))
+            result.append(ChatMessageOut(
+                id=msg.id,
+                ticket_id=msg.ticket_id,
+                sender_id=msg.sender_id,
+                sender_name=(f"{sender.first_name} {sender.last_name}".strip() or sender.employee_code) if sender else "Unknown",
+                sender_role=sender.role if sender else "user",
+                employee_code=sender.employee_code if sender else "",
+                message=msg.message,
+                mentions=msg.mentions,
+                created_at=msg.created_at
+            ))
+        return result
+
+
+class ChatMessagePageOut(Schema):
+    """Cursor-paginated chat history output schema (newest first)."""
+    items: List[ChatMessageOut]
+    next_cursor: Optional[str] = None
+
+
 class ChatMessageIn(Schema):
     """Chat message input schema."""
     ticket_id: str
@@ -1,9 +1,16 @@
 """
 Business logic services for Chat app.
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
+from django.conf import settings
 from django.db import transaction as db_transaction
-from .models import ChatMessage, TicketParticipant
+from django.db.models import Q
+from hdms_core.pagination import encode_cursor
+from .history import ChatHistory
+from .models import ChatMessage
+from .participants import ParticipantCache
+from .schemas import ChatMessageOut
 # Lazy imports to avoid Django settings access at module level
 
 
@@ -23,6 +30,48 @@ class ChatService:
         
         return queryset.order_by('created_at')
     
+    @staticmethod
+    def get_missed_messages(ticket_id: str, last_seen_id=None, since=None, limit: int = None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Messages a reconnecting client missed, oldest first (serialized like ChatMessageOut).
+        
+        Served from the ticket's recent messages in Redis when they reach back
+        to the client's position, otherwise from the database. An unknown
+        last_seen_id is treated as no position at all.
+        
+        Args:
+            last_seen_id: Id of the newest message the client has
+            since: Or: created_at of the newest message the client has
+            limit: Most messages returned (defaults to CHAT_REPLAY_LIMIT)
+        
+        Returns:
+            (messages, cursor): if more than limit were missed, only the newest
+            limit are returned and cursor continues with the older ones on
+            GET /messages/ticket/{ticket_id}/paged
+        """
+        limit = limit or getattr(settings, 'CHAT_REPLAY_LIMIT', 100)
+        messages = ChatHistory.since(ticket_id, last_seen_id=last_seen_id, since=since)
+        
+        if messages is None:
+            queryset = ChatMessage.objects.filter(ticket_id=ticket_id, is_deleted=False)
+            created_at = None
+            if last_seen_id is not None:
+                created_at = queryset.filter(id=last_seen_id).values_list('created_at', flat=True).first()
+            if created_at is not None:
+                queryset = queryset.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=last_seen_id))
+            elif since is not None and last_seen_id is None:
+                queryset = queryset.filter(created_at__gt=since)
+            # Newest first, so that a long absence replays the latest messages
+            rows = list(queryset.order_by('-created_at', '-id')[:limit + 1])
+            rows.reverse()
+            messages = [item.model_dump(mode='json') for item in ChatMessageOut.from_orm_many(rows)]
+        
+        if len(messages) <= limit:
+            return messages, None
+        messages = messages[-limit:]
+        first = messages[0]
+        return messages, encode_cursor(datetime.fromisoformat(first['created_at']), first['id'])
+    
     @staticmethod
     @db_transaction.atomic
     def send_message(ticket_id: str, sender_id: str, message: str, mentions: List[str] = None) -> ChatMessage:
@@ -50,8 +99,5 @@ class ChatService:
     @staticmethod
     def add_participant(ticket_id: str, user_id: str):
         """Add participant to ticket chat."""
-        TicketParticipant.objects.get_or_create(
-            ticket_id=ticket_id,
-            user_id=user_id
-        )
+        ParticipantCache.add(ticket_id, user_id)
 
@@ -2,15 +2,31 @@
 Signals for Chat app.
 """
 from django.db.models.signals import post_save
+from django.db import transaction
 from django.dispatch import receiver
+from events.services import EventOutbox
+from .history import ChatHistory
 from .models import ChatMessage
 
+# Chat event types
+CHAT_MESSAGE_CREATED = 'chat.message_created'
+
+
+def message_payload(message: ChatMessage) -> dict:
+    """Message fields carried by chat.message_created."""
+    return {
+        'id': message.id,
+        'ticket_id': message.ticket_id,
+        'sender_id': message.sender_id,
+        'message': message.message[:200],
+        'mentions': message.mentions,
+    }
+
 
 @receiver(post_save, sender=ChatMessage)
 def message_saved(sender, instance, created, **kwargs):
     """Handle message save signal."""
     if created:
-        # Send WebSocket notification or create notification
-        pass
-
-
+        # Notifications (mentions, participants) are created from the event
+        EventOutbox.publish(CHAT_MESSAGE_CREATED, message_payload(instance), aggregate_id=instance.ticket_id)
+        transaction.on_commit(lambda: ChatHistory.push([instance]))
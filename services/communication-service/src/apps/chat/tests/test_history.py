@@ -0,0 +1,98 @@
+"""
+Resume from the recent chat messages in Redis (ChatHistory.since).
+
+Needs the Redis server of REDIS_URL; skipped when it is unreachable.
+"""
+import unittest
+import uuid
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.chat.history import ChatHistory, get_redis
+from apps.chat.models import ChatMessage
+
+RECENT_MESSAGES = 5
+
+
+@override_settings(CHAT_RECENT_MESSAGES=RECENT_MESSAGES)
+class ChatHistorySinceTests(TestCase):
+    """Messages after a resume position, oldest first, or None when Redis cannot answer."""
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            get_redis().ping()
+        except Exception as e:
+            raise unittest.SkipTest(f"Redis unavailable: {e}")
+        super().setUpClass()
+
+    def setUp(self):
+        self.ticket_id = uuid.uuid4()
+        self.start = timezone.now() - timedelta(hours=1)
+        self.addCleanup(ChatHistory.invalidate, self.ticket_id)
+
+    def create_messages(self, count, first=0):
+        """Messages one minute apart, oldest first."""
+        messages = []
+        for number in range(first, first + count):
+            message = ChatMessage.objects.create(
+                ticket_id=self.ticket_id, sender_id=uuid.uuid4(), message=f'Message {number}',
+            )
+            # created_at is auto_now_add: spread the messages out
+            message.created_at = self.start + timedelta(minutes=number)
+            ChatMessage.objects.filter(pk=message.pk).update(created_at=message.created_at)
+            messages.append(message)
+        return messages
+
+    def texts(self, items):
+        return [item['message'] for item in items]
+
+    def test_since_last_seen_message(self):
+        messages = self.create_messages(4)
+
+        items = ChatHistory.since(self.ticket_id, last_seen_id=messages[1].id)
+
+        self.assertEqual(self.texts(items), ['Message 2', 'Message 3'])
+
+    def test_since_newest_message_is_empty(self):
+        messages = self.create_messages(3)
+
+        self.assertEqual(ChatHistory.since(self.ticket_id, last_seen_id=messages[-1].id), [])
+
+    def test_since_timestamp(self):
+        self.create_messages(4)
+
+        # A message at exactly the timestamp counts as seen
+        items = ChatHistory.since(self.ticket_id, since=self.start + timedelta(minutes=1))
+
+        self.assertEqual(self.texts(items), ['Message 2', 'Message 3'])
+
+    def test_since_before_complete_history(self):
+        self.create_messages(3)
+
+        items = ChatHistory.since(self.ticket_id, since=self.start - timedelta(days=1))
+
+        self.assertEqual(self.texts(items), ['Message 0', 'Message 1', 'Message 2'])
+
+    def test_beyond_recent_messages(self):
+        messages = self.create_messages(RECENT_MESSAGES + 2)
+
+        # Only the newest messages are in Redis: older positions must be read from the database
+        self.assertIsNone(ChatHistory.since(self.ticket_id, last_seen_id=messages[0].id))
+        self.assertIsNone(ChatHistory.since(self.ticket_id, since=self.start))
+        self.assertEqual(
+            self.texts(ChatHistory.since(self.ticket_id, last_seen_id=messages[-3].id)),
+            [f'Message {RECENT_MESSAGES}', f'Message {RECENT_MESSAGES + 1}'],
+        )
+
+    def test_pushed_messages_are_included(self):
+        messages = self.create_messages(2)
+        ChatHistory.since(self.ticket_id, last_seen_id=messages[0].id)
+
+        # Committed after the set was filled (apps.chat.signals pushes on commit)
+        new = self.create_messages(1, first=2)
+        ChatHistory.push(new)
+
+        self.assertEqual(self.texts(ChatHistory.since(self.ticket_id, last_seen_id=messages[1].id)), ['Message 2'])
@@ -0,0 +1,172 @@
+"""
+Write-behind persistence of chat messages sent over WebSocket.
+"""
+import atexit
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.db.models import Case, DateTimeField, Value, When
+from events.services import EventOutbox
+from hdms_core.db_router import pin_to_primary
+from hdms_core.write_behind import WriteBehindWriter
+
+from .history import ChatHistory
+from .models import ChatMessage
+from .signals import CHAT_MESSAGE_CREATED, message_payload
+
+logger = logging.getLogger(__name__)
+
+
+class ChatMessageWriter(WriteBehindWriter):
+    """
+    Buffered, batched writer for ChatMessage rows (see hdms_core.write_behind).
+
+    - Messages get their id (derived from the sender and the id the client
+      sent, or uuid4) and timestamp when received and are broadcast right away; a background thread writes
+      them with bulk_create, together with their chat.message_created
+      events, when CHAT_BATCH_SIZE messages are waiting or every
+      CHAT_FLUSH_INTERVAL seconds.
+    - Once a message is durable, its sender's connection gets an "ack" with
+      its id: written to the database, or saved as a JSON lines file in
+      CHAT_SPOOL_DIR (replayed by the next flush of any worker, or moved to
+      its quarantine subdirectory if that fails) when the database is
+      unavailable. A message that could not be kept gets a "nack" instead.
+    - Senders keep unacknowledged messages and resend them with the same id
+      (e.g. after reconnecting); ids already stored by the same sender are
+      acknowledged without a second row. Consumers acknowledge by the id the
+      client sent.
+    - Whatever is still buffered is flushed at interpreter exit.
+    """
+
+    name = 'chat message'
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'CHAT_WRITE_BEHIND', True)
+
+    @property
+    def batch_size(self) -> int:
+        return getattr(settings, 'CHAT_BATCH_SIZE', 100)
+
+    @property
+    def flush_interval(self) -> float:
+        return getattr(settings, 'CHAT_FLUSH_INTERVAL', 0.05)
+
+    @property
+    def spool_dir(self) -> Path:
+        return Path(getattr(settings, 'CHAT_SPOOL_DIR', settings.BASE_DIR / 'chat_spool'))
+
+    def add(self, message: ChatMessage, reply_channel: Optional[str] = None):
+        """
+        Queue a message for writing without blocking the caller on the INSERT.
+
+        Args:
+            message: Unsaved message with id and created_at assigned
+            reply_channel: Channel of the sender's connection, acknowledged once durable
+        """
+        self._enqueue((message, reply_channel))
+
+    def write(self, message: ChatMessage, reply_channel: Optional[str] = None):
+        """Write and acknowledge a message immediately (CHAT_WRITE_BEHIND disabled)."""
+        with self._flush_lock:
+            self._persist([(message, reply_channel)])
+
+    def _persist(self, batch: List[Tuple[ChatMessage, Optional[str]]]) -> int:
+        try:
+            created, rejected = self._insert(batch)
+        except Exception as e:
+            logger.error(f"Chat message bulk insert of {len(batch)} messages failed, spooling: {e}")
+            if self._write_spool(message for message, _ in batch):
+                self._acknowledge(batch)
+            else:
+                self._acknowledge(batch, error='Message could not be stored, please resend')
+            return 0
+
+        self._written(created)
+        rejected_ids = {message.id for message, _ in rejected}
+        self._acknowledge([entry for entry in batch if entry[0].id not in rejected_ids])
+        self._acknowledge(rejected, error='Message id already in use')
+        return len(created)
+
+    def _replay(self, messages: List[ChatMessage]) -> int:
+        # Spooled messages were acknowledged when spooled
+        created, rejected = self._insert([(message, None) for message in messages])
+        if rejected:
+            logger.warning(f"Dropped {len(rejected)} spooled chat messages whose id belongs to another sender")
+        self._written(created)
+        return len(created)
+
+    def _written(self, created: List[Tuple[ChatMessage, Optional[str]]]):
+        """Make newly written messages visible to their senders and the recent history."""
+        for sender_id in {str(message.sender_id) for message, _ in created}:
+            # The sender's next history fetch must include these messages
+            pin_to_primary(sender_id)
+        if created:
+            ChatHistory.push(message for message, _ in created)
+
+    def _insert(self, pending):
+        """
+        Insert new messages and their events in one transaction.
+
+        Returns:
+            (created, rejected): entries written now, entries whose id belongs to another sender's message
+        """
+        entries = {}
+        for message, reply_channel in pending:
+            # Resent while the first copy was still buffered
+            entries.setdefault(message.id, (message, reply_channel))
+
+        with db_transaction.atomic():
+            existing = dict(
+                ChatMessage.objects.with_deleted()
+                .filter(id__in=list(entries)).values_list('id', 'sender_id')
+            )
+            created = [entry for entry in entries.values() if entry[0].id not in existing]
+            rejected = [
+                entry for entry in entries.values()
+                if entry[0].id in existing and str(existing[entry[0].id]) != str(entry[0].sender_id)
+            ]
+            messages = [message for message, _ in created]
+            sent_at = {message.id: message.created_at for message in messages}
+            # bulk_create skips post_save, so the events of apps.chat.signals are published here
+            ChatMessage.objects.bulk_create(messages, ignore_conflicts=True)
+            if messages:
+                # auto_now_add stamped the insert time: keep the time the message was sent
+                ChatMessage.objects.with_deleted().filter(id__in=list(sent_at)).update(created_at=Case(
+                    *(When(id=message_id, then=Value(timestamp)) for message_id, timestamp in sent_at.items()),
+                    output_field=DateTimeField(),
+                ))
+                for message in messages:
+                    message.created_at = sent_at[message.id]
+            EventOutbox.publish_many(
+                CHAT_MESSAGE_CREATED, ((message.ticket_id, message_payload(message)) for message, _ in created)
+            )
+        return created, rejected
+
+    def _acknowledge(self, entries: Iterable[Tuple[ChatMessage, Optional[str]]], error: str = None):
+        """Tell each sender's connection which of its messages are durable (or lost)."""
+        by_channel = defaultdict(list)
+        for message, reply_channel in entries:
+            if reply_channel:
+                by_channel[reply_channel].append(str(message.id))
+        if not by_channel:
+            return
+        channel_layer = get_channel_layer()
+        for reply_channel, ids in by_channel.items():
+            event = {'type': 'chat_ack', 'ids': ids}
+            if error:
+                event['error'] = error
+            try:
+                async_to_sync(channel_layer.send)(reply_channel, event)
+            except Exception as e:
+                logger.warning(f"Could not acknowledge {len(ids)} chat messages to {reply_channel}: {e}")
+
+
+chat_writer = ChatMessageWriter()
+atexit.register(chat_writer.flush)
@@ -5,13 +5,18 @@ from ninja import Router
 from typing import List
 from apps.notifications.schemas import NotificationOut
 from apps.notifications.models import Notification
+from apps.notifications.services import NotificationService
+from hdms_core.db_router import pin_to_primary, reads_for_user, replica_reads
 
 router = Router(tags=["notifications"])
 
 
 @router.get("/", response=List[NotificationOut])
+@replica_reads
 def list_notifications(request, user_id: str, unread_only: bool = False):
     """List notifications for a user."""
+    # Unauthenticated: the user's own recent writes are found by the user_id
+    reads_for_user(user_id)
     queryset = Notification.objects.filter(user_id=user_id, is_deleted=False)
     
     if unread_only:
@@ -23,8 +28,9 @@ def list_notifications(request, user_id: str, unread_only: bool = False):
 @router.post("/{notification_id}/read", response=NotificationOut)
 def mark_as_read(request, notification_id: str):
     """Mark notification as read."""
-    notification = Notification.objects.get(id=notification_id, is_deleted=False)
-    notification.mark_as_read()
+    notification = NotificationService.mark_as_read(notification_id)
+    # The user's next list must not come from a replica still missing the change
+    pin_to_primary(notification.user_id)
     return NotificationOut.from_orm(notification)
 
 
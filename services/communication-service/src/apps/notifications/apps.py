@@ -0,0 +1,13 @@
+"""
+App configuration for Notification app.
+"""
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    name = 'apps.notifications'
+    label = 'notifications'
+
+    def ready(self):
+        # Register signal receivers
+        from . import signals  # noqa: F401
@@ -0,0 +1,97 @@
+"""
+WebSocket consumer for notifications.
+"""
+import asyncio
+import json
+from channels.generic.websocket import AsyncWebsocketConsumer
+from channels.db import database_sync_to_async
+from django.conf import settings
+from apps.notifications.models import Notification
+from apps.notifications.push import user_group
+
+
+class NotificationConsumer(AsyncWebsocketConsumer):
+    """WebSocket consumer for a user's notifications (replaces polling GET /notifications/)."""
+
+    async def connect(self):
+        """
+        Handle WebSocket connection.
+        Authentication is handled by JWTAuthMiddleware.
+        """
+        self.user = self.scope.get('user')
+        if not self.scope.get('token_validated') or not self.user:
+            print(f"❌ Notification WebSocket rejected: Token not validated by middleware")
+            await self.close()
+            return
+
+        self.user_id = str(self.user.id)
+        self.group_name = user_group(self.user_id)
+        self.pending = []
+        self.flush_task = None
+
+        # Join before reading: pushes committed in between are queued, and
+        # applying them to the id set is a no-op if the read already saw them
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+        count, newest_ids = await self.get_unread()
+        # Ids of the newest unread notifications (oldest first), plus how many older ones are unread
+        self.unread = dict.fromkeys(reversed(newest_ids))
+        self.untracked = count - len(self.unread)
+        self.sent_count = count
+        # Starting point for the unread_delta of later frames
+        await self.send(text_data=json.dumps({
+            'type': 'unread_count',
+            'data': {'count': self.sent_count}
+        }))
+
+    async def disconnect(self, close_code):
+        """Handle WebSocket disconnection."""
+        if not hasattr(self, 'group_name'):
+            return
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def notification_push(self, event):
+        """Receive new notifications / notifications marked read from the user's group."""
+        for item in event['items']:
+            if not item['is_read']:
+                self.unread[item['id']] = None
+        for notification_id in event['read_ids']:
+            if notification_id in self.unread:
+                del self.unread[notification_id]
+            elif self.untracked:
+                # Only pushed when it was unread: one of the older notifications
+                self.untracked -= 1
+        tracked = getattr(settings, 'NOTIFICATION_UNREAD_TRACKED', 500)
+        while len(self.unread) > tracked:
+            del self.unread[next(iter(self.unread))]
+            self.untracked += 1
+        self.pending.extend(event['items'])
+        # A burst (e.g. one ticket event notifying several times) goes out as one frame
+        if self.flush_task is None:
+            self.flush_task = asyncio.ensure_future(self.flush_later())
+
+    async def flush_later(self):
+        """Send what arrived within the coalescing window as one frame."""
+        await asyncio.sleep(getattr(settings, 'NOTIFICATION_COALESCE_MS', 250) / 1000)
+        unread_count = len(self.unread) + self.untracked
+        items, unread_delta = self.pending, unread_count - self.sent_count
+        self.pending, self.sent_count, self.flush_task = [], unread_count, None
+        if not items and not unread_delta:
+            return
+        await self.send(text_data=json.dumps({
+            'type': 'notifications',
+            'data': {'items': items, 'unread_delta': unread_delta}
+        }))
+
+    @database_sync_to_async
+    def get_unread(self):
+        """Number of the user's unread notifications and the ids of the newest NOTIFICATION_UNREAD_TRACKED, newest first."""
+        unread = Notification.objects.filter(user_id=self.user_id, is_read=False, is_deleted=False)
+        newest_ids = [
+            str(notification_id) for notification_id in
+            unread.order_by('-created_at').values_list('id', flat=True)[:getattr(settings, 'NOTIFICATION_UNREAD_TRACKED', 500)]
+        ]
+        return unread.count(), newest_ids
@@ -0,0 +1,127 @@
+"""
+Event bus handlers for Notification app (see events.consumer).
+
+Run in the consumer's transaction: the notifications are created exactly
+once per event even if the bus delivers it again.
+"""
+import uuid
+
+from apps.chat.participants import ParticipantCache
+from departments.models import Department
+from events.consumer import event_handler
+from .models import NotificationType
+from .services import NotificationService
+
+# Status changes with a notification type of their own
+STATUS_NOTIFICATION_TYPES = {
+    'reopened': NotificationType.TICKET_REOPENED,
+    'postponed': NotificationType.TICKET_POSTPONED,
+}
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _department_heads(ticket: dict) -> list:
+    if not ticket.get('department_id'):
+        return []
+    return list(Department.objects.filter(id=ticket['department_id'], head_id__isnull=False).values_list('head_id', flat=True))
+
+
+def _label(ticket: dict) -> str:
+    return ticket.get('ticket_id') or ticket['title']
+
+
+@event_handler('ticket.assigned')
+def notify_assignee(event):
+    """Tell the new assignee about the ticket."""
+    ticket = event.payload
+    NotificationService.notify_users(
+        [ticket['assignee_id']],
+        NotificationType.TICKET_ASSIGNED,
+        title=f"Ticket {_label(ticket)} assigned to you",
+        message=ticket['title'],
+        ticket_id=ticket['id'],
+        metadata={'event_id': event.event_id},
+    )
+
+
+@event_handler('ticket.status_changed')
+def notify_status_change(event):
+    """Tell the requestor about a status change (and the assignee about a reopen)."""
+    ticket = event.payload
+    if ticket['old_status'] == 'draft':
+        # Submission: nothing the requestor does not know yet
+        return
+    recipients = [ticket['requestor_id']]
+    if ticket['status'] == 'reopened':
+        recipients.append(ticket['assignee_id'])
+    status = ticket['status'].replace('_', ' ')
+    NotificationService.notify_users(
+        recipients,
+        STATUS_NOTIFICATION_TYPES.get(ticket['status'], NotificationType.TICKET_STATUS_CHANGED),
+        title=f"Ticket {_label(ticket)} is now {status}",
+        message=ticket['title'],
+        ticket_id=ticket['id'],
+        metadata={'event_id': event.event_id, 'old_status': ticket['old_status'], 'status': ticket['status']},
+    )
+
+
+@event_handler('chat.message_created')
+def notify_chat_message(event):
+    """Notify mentioned users, and the other participants of the ticket chat."""
+    message = event.payload
+    sender_id = str(message['sender_id'])
+    mentioned = [user_id for user_id in map(str, message['mentions']) if _is_uuid(user_id) and user_id != sender_id]
+    metadata = {'event_id': event.event_id, 'message_id': message['id']}
+    NotificationService.notify_users(
+        mentioned,
+        NotificationType.TICKET_MENTIONED,
+        title="You were mentioned in a ticket chat",
+        message=message['message'],
+        ticket_id=message['ticket_id'],
+        metadata=metadata,
+    )
+    participants = ParticipantCache.members(message['ticket_id']) - {sender_id, *mentioned}
+    NotificationService.notify_users(
+        participants,
+        NotificationType.MESSAGE_RECEIVED,
+        title="New message in a ticket chat",
+        message=message['message'],
+        ticket_id=message['ticket_id'],
+        metadata=metadata,
+    )
+
+
+@event_handler('ticket.sla_warning')
+def notify_sla_warning(event):
+    """Remind the assignee (or the department head, if unassigned) of an upcoming deadline."""
+    ticket = event.payload
+    recipients = [ticket['assignee_id']] if ticket['assignee_id'] else _department_heads(ticket)
+    NotificationService.notify_users(
+        recipients,
+        NotificationType.TICKET_REMINDER,
+        title=f"Ticket {_label(ticket)} is due soon",
+        message=ticket['title'],
+        ticket_id=ticket['id'],
+        metadata={'event_id': event.event_id, 'sla': 'warning', 'due_at': ticket['due_at']},
+    )
+
+
+@event_handler('ticket.sla_breached')
+def escalate_sla_breach(event):
+    """Escalate a missed deadline to the assignee and the department head."""
+    ticket = event.payload
+    NotificationService.notify_users(
+        [ticket['assignee_id'], *_department_heads(ticket)],
+        NotificationType.TICKET_REMINDER,
+        title=f"Ticket {_label(ticket)} missed its SLA deadline",
+        message=ticket['title'],
+        ticket_id=ticket['id'],
+        metadata={'event_id': event.event_id, 'sla': 'breached', 'due_at': ticket['due_at']},
+    )
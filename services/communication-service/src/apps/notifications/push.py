@@ -0,0 +1,67 @@
+"""
+Real-time notification delivery to WebSocket clients.
+
+Every user's connections join the channel group notifications_<user_id>
+(NotificationConsumer). Committed notifications are sent to the group of
+their recipient, one message per recipient however many notifications a
+transaction created; marking a notification read sends its id. Connections
+track the ids of the newest unread notifications (NOTIFICATION_UNREAD_TRACKED)
+and count the older ones, so a message is counted once even if its change
+was already in the count taken at connect, and coalesce
+what arrives within NOTIFICATION_COALESCE_MS into one frame.
+"""
+import logging
+from collections import defaultdict
+from typing import Iterable
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction as db_transaction
+
+from .models import Notification
+from .schemas import NotificationOut
+
+logger = logging.getLogger(__name__)
+
+
+def user_group(user_id) -> str:
+    """Channel group of a user's notification connections."""
+    return f'notifications_{user_id}'
+
+
+class NotificationPush:
+    """Sends notifications and unread count changes to users' connections."""
+
+    @staticmethod
+    def _send(user_id, items: list, read_ids: list):
+        try:
+            async_to_sync(get_channel_layer().group_send)(user_group(user_id), {
+                'type': 'notification_push',
+                'items': items,
+                'read_ids': read_ids,
+            })
+        except Exception as e:
+            # Clients still see it on their next GET /notifications/
+            logger.warning(f"Could not push notifications to user {user_id}: {e}")
+
+    @classmethod
+    def created(cls, notifications: Iterable[Notification]):
+        """Push new notifications to their recipients once the transaction commits."""
+        by_user = defaultdict(list)
+        for notification in notifications:
+            by_user[str(notification.user_id)].append(
+                NotificationOut.from_orm(notification).model_dump(mode='json')
+            )
+
+        def send():
+            for user_id, items in by_user.items():
+                cls._send(user_id, items, [])
+
+        if by_user:
+            db_transaction.on_commit(send)
+
+    @classmethod
+    def read(cls, notification: Notification):
+        """Push a notification marked read once the transaction commits."""
+        user_id, notification_id = str(notification.user_id), str(notification.id)
+        db_transaction.on_commit(lambda: cls._send(user_id, [], [notification_id]))
@@ -4,13 +4,14 @@ Pydantic schemas for Notification Service.
 from ninja import Schema
 from typing import Optional, Dict
 from datetime import datetime
+from uuid import UUID
 
 
 class NotificationOut(Schema):
     """Notification output schema."""
-    id: str
-    user_id: str
-    ticket_id: Optional[str]
+    id: UUID
+    user_id: UUID
+    ticket_id: Optional[UUID]
     type: str
     title: str
     message: str
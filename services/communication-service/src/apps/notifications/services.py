@@ -1,9 +1,11 @@
 """
 Business logic services for Notification app.
 """
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from django.db import transaction as db_transaction
+from django.utils import timezone
 from .models import Notification, NotificationType
+from .push import NotificationPush
 # Lazy imports to avoid Django settings access at module level
 
 
@@ -35,7 +37,7 @@ class NotificationService:
     ) -> Notification:
         """Create a new notification."""
         # Lazy import to avoid Django settings access at module level
-        from core.clients.user_client import UserClient
+        from hdms_core.clients.user_client import UserClient
         
         # Validate user exists
         if not UserClient.validate_user(user_id):
@@ -51,10 +53,40 @@ class NotificationService:
         )
         return notification
     
+    @staticmethod
+    def notify_users(
+        user_ids: Iterable[str],
+        notification_type: str,
+        title: str,
+        message: str,
+        ticket_id: str = None,
+        metadata: dict = None
+    ) -> List[Notification]:
+        """Create one notification per recipient (no user validation: for IDs from trusted events)."""
+        notifications = Notification.objects.bulk_create([
+            Notification(
+                user_id=user_id,
+                type=notification_type,
+                title=title,
+                message=message,
+                ticket_id=ticket_id,
+                metadata=metadata or {}
+            )
+            for user_id in dict.fromkeys(str(user_id) for user_id in user_ids if user_id)
+        ])
+        # bulk_create skips post_save (apps.notifications.signals)
+        NotificationPush.created(notifications)
+        return notifications
+    
     @staticmethod
     @db_transaction.atomic
-    def mark_as_read(notification_id: str):
-        """Mark notification as read."""
-        notification = Notification.objects.get(id=notification_id)
-        notification.mark_as_read()
+    def mark_as_read(notification_id: str) -> Notification:
+        """Mark notification as read; only the request that marks it pushes the change."""
+        marked = Notification.objects.filter(id=notification_id, is_read=False, is_deleted=False).update(
+            is_read=True, read_at=timezone.now()
+        )
+        notification = Notification.objects.get(id=notification_id, is_deleted=False)
+        if marked:
+            NotificationPush.read(notification)
+        return notification
 
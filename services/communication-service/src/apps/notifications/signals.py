@@ -4,6 +4,7 @@ Signals for Notification app.
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from .models import Notification
+from .push import NotificationPush
 
 
 @receiver(post_save, sender=Notification)
@@ -11,6 +12,6 @@ def notification_saved(sender, instance, created, **kwargs):
     """Handle notification save signal."""
     if created:
         # Send WebSocket push notification
-        pass
+        NotificationPush.created([instance])
 
 
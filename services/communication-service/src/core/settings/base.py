@@ -74,6 +74,7 @@ INSTALLED_APPS = [
     # Shared apps
     'users',  # Shared User model
     'departments',  # Referenced by User model
+    'events',  # Transactional outbox and event bus
     # Local apps
     'apps.chat',
     'apps.notifications',
@@ -89,6 +90,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'hdms_core.db_router.ReplicaRoutingMiddleware',
 ]
 
 CORS_ALLOW_ALL_ORIGINS = True  # Enable CORS for all origins in development
@@ -121,7 +123,13 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
         'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
         'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
+        # 0 closes the connection after every request. Under daphne/ASGI each
+        # sync_to_async call may run on another thread and every thread keeps
+        # its own connection, so persistent connections pile up at PgBouncer
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=0, cast=int),
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        # Transaction pooling: server-side cursors cannot span transactions
+        'DISABLE_SERVER_SIDE_CURSORS': True,
         'OPTIONS': {
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
@@ -129,6 +137,24 @@ DATABASES = {
     }
 }
 
+# Read replicas (hdms_core.db_router): comma-separated host[:port] list serving
+# the same database with the same credentials. Empty = everything uses the primary.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, config('DB_REPLICA_HOSTS', default='').split(',')), start=1):
+    host, _, port = replica.strip().partition(':')
+    alias = f'replica{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['hdms_core.db_router.ReadReplicaRouter']
+REPLICA_MAX_LAG = config('DB_REPLICA_MAX_LAG', default=5.0, cast=float)  # seconds
+REPLICA_LAG_CHECK_INTERVAL = config('DB_REPLICA_LAG_CHECK_INTERVAL', default=5.0, cast=float)  # seconds
+REPLICA_STICKY_SECONDS = config('DB_REPLICA_STICKY_SECONDS', default=10, cast=int)
+
 # Cache Configuration (Redis)
 REDIS_PASSWORD = config('REDIS_PASSWORD', default='')
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@redis:6379/0" if REDIS_PASSWORD else "redis://redis:6379/0"
@@ -185,6 +211,11 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# RemoteJWTAuthentication caches (hdms_core.authentication)
+JWT_USER_CACHE_TTL = config('JWT_USER_CACHE_TTL', default=60, cast=int)  # seconds
+JWT_USER_CACHE_SIZE = config('JWT_USER_CACHE_SIZE', default=10000, cast=int)
+JWT_TOKEN_CACHE_SIZE = config('JWT_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -221,6 +252,55 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Inter-service client cache (hdms_core.clients.cache), in seconds
+CLIENT_CACHE_TTLS = {
+    'user': config('CLIENT_CACHE_USER_TTL', default=300, cast=int),
+    'ticket': config('CLIENT_CACHE_TICKET_TTL', default=60, cast=int),
+}
+CLIENT_CACHE_NEGATIVE_TTL = config('CLIENT_CACHE_NEGATIVE_TTL', default=30, cast=int)
+CLIENT_CACHE_LOCAL_TTL = config('CLIENT_CACHE_LOCAL_TTL', default=10, cast=int)
+CLIENT_CACHE_STALE_TTL = config('CLIENT_CACHE_STALE_TTL', default=86400, cast=int)
+
+# Inter-service HTTP connection pools (hdms_core.clients.HTTPClient)
+HTTP_CLIENT_POOL_CONNECTIONS = config('HTTP_CLIENT_POOL_CONNECTIONS', default=10, cast=int)
+HTTP_CLIENT_POOL_MAXSIZE = config('HTTP_CLIENT_POOL_MAXSIZE', default=10, cast=int)
+
+# Per-target circuit breaker and bulkhead (hdms_core.clients.resilience)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = config('CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = config('CIRCUIT_BREAKER_RECOVERY_TIMEOUT', default=30, cast=int)  # seconds
+BULKHEAD_MAX_CONCURRENT = config('BULKHEAD_MAX_CONCURRENT', default=20, cast=int)
+
+# Bearer token for /internal/stats/ (hdms_core.metrics); the endpoint is disabled while empty
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Event bus (events app): this service's consumer group on the Redis streams
+EVENT_BUS_URL = config('EVENT_BUS_URL', default=REDIS_URL)
+EVENT_CONSUMER_GROUP = config('EVENT_CONSUMER_GROUP', default='communication-service')
+EVENT_BATCH_SIZE = config('EVENT_BATCH_SIZE', default=50, cast=int)
+EVENT_BLOCK_MS = config('EVENT_BLOCK_MS', default=5000, cast=int)
+EVENT_CLAIM_IDLE_MS = config('EVENT_CLAIM_IDLE_MS', default=60000, cast=int)
+EVENT_MAX_DELIVERIES = config('EVENT_MAX_DELIVERIES', default=5, cast=int)
+
+# Chat messages sent over WebSocket (apps.chat.writer): written behind the broadcast in batches
+CHAT_WRITE_BEHIND = config('CHAT_WRITE_BEHIND', default=True, cast=bool)
+CHAT_BATCH_SIZE = config('CHAT_BATCH_SIZE', default=100, cast=int)
+CHAT_FLUSH_INTERVAL = config('CHAT_FLUSH_INTERVAL', default=0.05, cast=float)  # seconds
+CHAT_SPOOL_DIR = config('CHAT_SPOOL_DIR', default=str(BASE_DIR / 'chat_spool'))
+# Ticket chat participants (apps.chat.participants): shared cache lifetime of a ticket's set
+CHAT_PARTICIPANT_CACHE_TTL = config('CHAT_PARTICIPANT_CACHE_TTL', default=3600, cast=int)  # seconds
+# Chat history (GET /api/v1/chat/messages/ticket/{id}/paged, apps.chat.history)
+CHAT_PAGE_SIZE = config('CHAT_PAGE_SIZE', default=50, cast=int)
+CHAT_MAX_PAGE_SIZE = config('CHAT_MAX_PAGE_SIZE', default=200, cast=int)
+CHAT_RECENT_MESSAGES = config('CHAT_RECENT_MESSAGES', default=100, cast=int)  # newest messages per ticket kept in Redis
+CHAT_RECENT_TTL = config('CHAT_RECENT_TTL', default=3600, cast=int)  # seconds
+# Messages replayed to a reconnecting chat WebSocket (?last_seen= / ?since=), newest kept
+CHAT_REPLAY_LIMIT = config('CHAT_REPLAY_LIMIT', default=100, cast=int)
+
+# Notification WebSocket (ws/notifications/): pushes arriving within this window share one frame
+NOTIFICATION_COALESCE_MS = config('NOTIFICATION_COALESCE_MS', default=250, cast=int)
+# Unread notification ids a connection tracks (newest); older unread ones are only counted
+NOTIFICATION_UNREAD_TRACKED = config('NOTIFICATION_UNREAD_TRACKED', default=500, cast=int)
+
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
 
@@ -0,0 +1,12 @@
+"""
+Event bus handlers for File app (see events.consumer).
+"""
+from django.utils import timezone
+from events.consumer import event_handler
+from .models import Attachment
+
+
+@event_handler('ticket.deleted')
+def delete_ticket_attachments(event):
+    """Soft-delete the attachments of a deleted ticket."""
+    Attachment.objects.filter(ticket_id=event.payload['id']).update(is_deleted=True, deleted_at=timezone.now())
@@ -73,6 +73,7 @@ INSTALLED_APPS = [
     # Shared apps
     'users',  # Shared User model
     'departments',  # Referenced by User model
+    'events',  # Transactional outbox and event bus
     # Local apps
     'apps.files',
 ]
@@ -114,7 +115,11 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
         'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
         'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
+        # Persistent connections to PgBouncer (0 closes the connection after every request)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        # Transaction pooling: server-side cursors cannot span transactions
+        'DISABLE_SERVER_SIDE_CURSORS': True,
         'OPTIONS': {
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
@@ -176,6 +181,14 @@ else:
     CELERY_BROKER_URL = "redis://redis:6379/2"
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 
+# Event bus (events app): this service's consumer group on the Redis streams
+EVENT_BUS_URL = config('EVENT_BUS_URL', default=REDIS_URL)
+EVENT_CONSUMER_GROUP = config('EVENT_CONSUMER_GROUP', default='file-service')
+EVENT_BATCH_SIZE = config('EVENT_BATCH_SIZE', default=50, cast=int)
+EVENT_BLOCK_MS = config('EVENT_BLOCK_MS', default=5000, cast=int)
+EVENT_CLAIM_IDLE_MS = config('EVENT_CLAIM_IDLE_MS', default=60000, cast=int)
+EVENT_MAX_DELIVERIES = config('EVENT_MAX_DELIVERIES', default=5, cast=int)
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=config('ACCESS_TOKEN_LIFETIME', default=60, cast=int)),
     'REFRESH_TOKEN_LIFETIME': timedelta(minutes=config('REFRESH_TOKEN_LIFETIME', default=1440, cast=int)),
@@ -185,6 +198,11 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# RemoteJWTAuthentication caches (hdms_core.authentication)
+JWT_USER_CACHE_TTL = config('JWT_USER_CACHE_TTL', default=60, cast=int)  # seconds
+JWT_USER_CACHE_SIZE = config('JWT_USER_CACHE_SIZE', default=10000, cast=int)
+JWT_TOKEN_CACHE_SIZE = config('JWT_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -200,6 +218,27 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Inter-service client cache (hdms_core.clients.cache), in seconds
+CLIENT_CACHE_TTLS = {
+    'user': config('CLIENT_CACHE_USER_TTL', default=300, cast=int),
+    'ticket': config('CLIENT_CACHE_TICKET_TTL', default=60, cast=int),
+}
+CLIENT_CACHE_NEGATIVE_TTL = config('CLIENT_CACHE_NEGATIVE_TTL', default=30, cast=int)
+CLIENT_CACHE_LOCAL_TTL = config('CLIENT_CACHE_LOCAL_TTL', default=10, cast=int)
+CLIENT_CACHE_STALE_TTL = config('CLIENT_CACHE_STALE_TTL', default=86400, cast=int)
+
+# Inter-service HTTP connection pools (hdms_core.clients.HTTPClient)
+HTTP_CLIENT_POOL_CONNECTIONS = config('HTTP_CLIENT_POOL_CONNECTIONS', default=10, cast=int)
+HTTP_CLIENT_POOL_MAXSIZE = config('HTTP_CLIENT_POOL_MAXSIZE', default=10, cast=int)
+
+# Per-target circuit breaker and bulkhead (hdms_core.clients.resilience)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = config('CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = config('CIRCUIT_BREAKER_RECOVERY_TIMEOUT', default=30, cast=int)  # seconds
+BULKHEAD_MAX_CONCURRENT = config('BULKHEAD_MAX_CONCURRENT', default=20, cast=int)
+
+# Bearer token for /internal/stats/ (hdms_core.metrics); the endpoint is disabled while empty
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
 # File Upload Settings
 MAX_FILE_SIZE = config('MAX_FILE_SIZE', default=524288000, cast=int)  # 500MB
 ALLOWED_IMAGE_TYPES = config('ALLOWED_IMAGE_TYPES', default='image/jpeg,image/png,image/gif').split(',')
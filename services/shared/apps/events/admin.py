@@ -0,0 +1,15 @@
+"""
+Django admin configuration for Events app.
+"""
+from django.contrib import admin
+from .models import OutboxEvent
+
+
+@admin.register(OutboxEvent)
+class OutboxEventAdmin(admin.ModelAdmin):
+    """Admin interface for OutboxEvent model."""
+    list_display = ['id', 'event_type', 'aggregate_id', 'created_at', 'published_at', 'attempts']
+    list_filter = ['event_type']
+    search_fields = ['event_id', 'aggregate_id']
+    readonly_fields = ['event_id', 'event_type', 'stream', 'aggregate_id', 'payload', 'created_at', 'published_at', 'attempts', 'last_error']
+    ordering = ['-id']
@@ -0,0 +1,9 @@
+"""
+App configuration for Events app.
+"""
+from django.apps import AppConfig
+
+
+class EventsConfig(AppConfig):
+    name = 'events'
+    label = 'events'
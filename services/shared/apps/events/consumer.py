@@ -0,0 +1,190 @@
+"""
+Event consumer: delivers events from Redis Streams to registered handlers.
+
+Each service reads the streams it has handlers for as one consumer group
+(EVENT_CONSUMER_GROUP), so every service sees every event once while the
+processes of one service share the work. Handlers are registered with
+@event_handler in the event_handlers module of an app and run inside one
+transaction together with the ProcessedEvent record, so a redelivered event
+has no effect. Side effects outside the database (WebSocket pushes) belong in
+transaction.on_commit().
+
+A message is acknowledged once handled; a failed one stays pending and is
+claimed again after EVENT_CLAIM_IDLE_MS, up to EVENT_MAX_DELIVERIES times,
+after which it is moved to <stream>:dead.
+"""
+import json
+import logging
+import os
+import socket
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, NamedTuple
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, router, transaction
+from django.utils.module_loading import autodiscover_modules
+
+from .models import ProcessedEvent
+from .services import get_redis, stream_name
+
+logger = logging.getLogger(__name__)
+
+
+class Event(NamedTuple):
+    """An event as delivered to handlers."""
+    event_id: str
+    type: str
+    aggregate_id: str
+    payload: dict
+    occurred_at: str
+
+
+_handlers: Dict[str, List[Callable[[Event], None]]] = defaultdict(list)
+
+
+def event_handler(*event_types: str):
+    """Register the decorated function as handler for the given event types."""
+    def decorator(func):
+        for event_type in event_types:
+            _handlers[event_type].append(func)
+        return func
+    return decorator
+
+
+def discover_handlers() -> Dict[str, List[Callable[[Event], None]]]:
+    """Import the event_handlers module of every installed app."""
+    autodiscover_modules('event_handlers')
+    return _handlers
+
+
+class EventConsumer:
+    """Reads the event streams as one member of a consumer group."""
+
+    def __init__(self, group: str = None, streams: Iterable[str] = None, consumer: str = None):
+        self.group = group or settings.EVENT_CONSUMER_GROUP
+        self.streams = sorted(streams or {stream_name(event_type) for event_type in discover_handlers()})
+        self.consumer = consumer or f'{socket.gethostname()}-{os.getpid()}'
+        self.batch_size = getattr(settings, 'EVENT_BATCH_SIZE', 50)
+        self.block_ms = getattr(settings, 'EVENT_BLOCK_MS', 5000)
+        self.claim_idle_ms = getattr(settings, 'EVENT_CLAIM_IDLE_MS', 60000)
+        self.max_deliveries = getattr(settings, 'EVENT_MAX_DELIVERIES', 5)
+        self.using = router.db_for_write(ProcessedEvent)
+        self._last_claim = 0.0
+
+    def setup(self):
+        """Create the consumer group on each stream (from its beginning) if missing."""
+        import redis
+        for stream in self.streams:
+            try:
+                get_redis().xgroup_create(stream, self.group, id='0', mkstream=True)
+                logger.info(f"Created consumer group {self.group} on {stream}")
+            except redis.ResponseError as e:
+                if 'BUSYGROUP' not in str(e):
+                    raise
+
+    def handle(self, fields: dict) -> bool:
+        """
+        Run the handlers of one stream entry.
+
+        Returns:
+            True if the entry is done with (handled now, before, or not ours)
+        """
+        event = Event(
+            event_id=fields['event_id'],
+            type=fields['type'],
+            aggregate_id=fields.get('aggregate_id', ''),
+            payload=json.loads(fields.get('payload') or '{}'),
+            occurred_at=fields.get('occurred_at', ''),
+        )
+        handlers = _handlers.get(event.type)
+        if not handlers:
+            return True
+
+        processed = ProcessedEvent.objects.using(self.using).filter(consumer_group=self.group, event_id=event.event_id)
+        try:
+            with transaction.atomic(using=self.using):
+                if processed.exists():
+                    logger.debug(f"Event {event.event_id} already processed by {self.group}")
+                    return True
+                for handler in handlers:
+                    handler(event)
+                ProcessedEvent.objects.using(self.using).create(consumer_group=self.group, event_id=event.event_id)
+        except IntegrityError:
+            # A handler's own integrity error is a failure like any other (retried, then dead-lettered)
+            if not processed.exists():
+                raise
+            # Processed concurrently by another member of the group: its run committed, ours rolled back
+            logger.debug(f"Event {event.event_id} processed concurrently by {self.group}")
+        return True
+
+    def process(self, stream: str, messages) -> int:
+        """Handle stream entries and acknowledge the ones that are done with."""
+        done = []
+        for message_id, fields in messages:
+            if fields is None:
+                # Trimmed from the stream before it could be handled
+                done.append(message_id)
+                continue
+            try:
+                if self.handle(fields):
+                    done.append(message_id)
+            except Exception:
+                logger.exception(f"Handling {fields.get('type')} event {fields.get('event_id')} from {stream} failed")
+        if done:
+            get_redis().xack(stream, self.group, *done)
+        return len(done)
+
+    def claim_stale(self) -> int:
+        """Retry messages left pending by failed handlers or dead consumers."""
+        client = get_redis()
+        handled = 0
+        for stream in self.streams:
+            pending = client.xpending_range(
+                stream, self.group, min='-', max='+', count=self.batch_size, idle=self.claim_idle_ms
+            )
+            if not pending:
+                continue
+            dead = [entry['message_id'] for entry in pending if entry['times_delivered'] >= self.max_deliveries]
+            retry = [entry['message_id'] for entry in pending if entry['times_delivered'] < self.max_deliveries]
+
+            if dead:
+                for message_id, fields in client.xclaim(stream, self.group, self.consumer, self.claim_idle_ms, dead):
+                    if fields is not None:
+                        client.xadd(f'{stream}:dead', {**fields, 'group': self.group, 'message_id': message_id})
+                    logger.error(f"Event {message_id} on {stream} failed {self.max_deliveries} times, moved to {stream}:dead")
+                client.xack(stream, self.group, *dead)
+            if retry:
+                handled += self.process(stream, client.xclaim(stream, self.group, self.consumer, self.claim_idle_ms, retry))
+        return handled
+
+    def poll(self) -> int:
+        """Handle one batch of new messages (waiting up to block_ms for them)."""
+        response = get_redis().xreadgroup(
+            self.group, self.consumer, {stream: '>' for stream in self.streams},
+            count=self.batch_size, block=self.block_ms,
+        )
+        return sum(self.process(stream, messages) for stream, messages in response or [])
+
+    def run(self, once: bool = False):
+        """Consume until interrupted."""
+        if not self.streams:
+            logger.warning(f"No event handlers registered for {self.group}, nothing to consume")
+            return
+        self.setup()
+        logger.info(f"Consumer {self.consumer} of {self.group} reading {', '.join(self.streams)}")
+        backoff = 1.0
+        while True:
+            close_old_connections()
+            try:
+                if time.monotonic() - self._last_claim > self.claim_idle_ms / 1000:
+                    self._last_claim = time.monotonic()
+                    self.claim_stale()
+                self.poll()
+                backoff = 1.0
+            except Exception:
+                logger.exception(f"Event consumer {self.consumer} iteration failed")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            if once:
+                return
@@ -0,0 +1,19 @@
+"""
+Consume events from the event bus with this service's handlers.
+
+    python manage.py consume_events [--group GROUP] [--once]
+"""
+from django.core.management.base import BaseCommand
+
+from events.consumer import EventConsumer
+
+
+class Command(BaseCommand):
+    help = 'Deliver events from Redis Streams to the event_handlers of installed apps'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--group', default=None, help='Consumer group (default: EVENT_CONSUMER_GROUP)')
+        parser.add_argument('--once', action='store_true', help='Handle one batch and exit')
+
+    def handle(self, *args, **options):
+        EventConsumer(group=options['group']).run(once=options['once'])
@@ -0,0 +1,19 @@
+"""
+Publish outbox events to the event bus.
+
+    python manage.py relay_events [--once]
+"""
+from django.core.management.base import BaseCommand
+
+from events.relay import OutboxRelay
+
+
+class Command(BaseCommand):
+    help = 'Publish committed outbox events to Redis Streams'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Publish one batch and exit')
+        parser.add_argument('--batch-size', type=int, default=None)
+
+    def handle(self, *args, **options):
+        OutboxRelay(batch_size=options['batch_size']).run(once=options['once'])
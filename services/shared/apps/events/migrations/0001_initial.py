@@ -0,0 +1,55 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:49
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('event_id', models.UUIDField(unique=True)),
+                ('event_type', models.CharField(max_length=100)),
+                ('stream', models.CharField(max_length=100)),
+                ('aggregate_id', models.UUIDField(blank=True, null=True)),
+                ('payload', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('published_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+            ],
+            options={
+                'verbose_name': 'Outbox Event',
+                'verbose_name_plural': 'Outbox Events',
+                'db_table': 'event_outbox',
+                'indexes': [models.Index(condition=models.Q(('published_at__isnull', True)), fields=['id'], name='event_outbox_pending_idx'), models.Index(fields=['published_at'], name='event_outbo_publish_380514_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProcessedEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('consumer_group', models.CharField(max_length=100)),
+                ('event_id', models.UUIDField()),
+                ('processed_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Processed Event',
+                'verbose_name_plural': 'Processed Events',
+                'db_table': 'event_inbox',
+                'indexes': [models.Index(fields=['processed_at'], name='event_inbox_process_ab98ea_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='processedevent',
+            constraint=models.UniqueConstraint(fields=('consumer_group', 'event_id'), name='event_inbox_group_event_uniq'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+"""
+Event models shared by the HDMS services.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class OutboxEvent(models.Model):
+    """
+    Domain event waiting to be published to the event bus (transactional outbox).
+
+    Written in the same transaction as the change it describes, so an event
+    exists if and only if the change committed. The relay publishes pending
+    events to Redis Streams in id order and marks them published.
+    """
+    id = models.BigAutoField(primary_key=True)
+    event_id = models.UUIDField(unique=True)
+    event_type = models.CharField(max_length=100)
+    stream = models.CharField(max_length=100)
+    aggregate_id = models.UUIDField(null=True, blank=True)
+    payload = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    published_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'event_outbox'
+        verbose_name = 'Outbox Event'
+        verbose_name_plural = 'Outbox Events'
+        indexes = [
+            # The relay only ever scans pending events
+            models.Index(fields=['id'], condition=models.Q(published_at__isnull=True), name='event_outbox_pending_idx'),
+            models.Index(fields=['published_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id}"
+
+
+class ProcessedEvent(models.Model):
+    """
+    Event already handled by a consumer group (inbox).
+
+    Recorded in the same transaction as the handler's writes, so an event
+    delivered again (the bus delivers at least once) has no further effect.
+    """
+    consumer_group = models.CharField(max_length=100)
+    event_id = models.UUIDField()
+    processed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'event_inbox'
+        verbose_name = 'Processed Event'
+        verbose_name_plural = 'Processed Events'
+        constraints = [
+            models.UniqueConstraint(fields=['consumer_group', 'event_id'], name='event_inbox_group_event_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['processed_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.consumer_group}: {self.event_id}"
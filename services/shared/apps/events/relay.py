@@ -0,0 +1,125 @@
+"""
+Outbox relay: publishes committed outbox events to Redis Streams.
+
+Pending events are locked (FOR UPDATE SKIP LOCKED), added to their streams
+in one pipeline and marked published in the same transaction. If Redis
+fails they stay pending and are retried; if the commit fails after the
+publish they are published again - delivery is at least once, consumers
+deduplicate on event_id (ProcessedEvent). Events of one aggregate are
+published in commit order; run one relay per database to keep that order
+across batches (additional relays are safe but may interleave batches).
+"""
+import json
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxEvent, ProcessedEvent
+from .services import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def event_fields(event: OutboxEvent) -> dict:
+    """Stream entry fields of an outbox event."""
+    return {
+        'event_id': str(event.event_id),
+        'type': event.event_type,
+        'aggregate_id': str(event.aggregate_id) if event.aggregate_id else '',
+        'payload': json.dumps(event.payload),
+        'occurred_at': event.created_at.isoformat(),
+    }
+
+
+class OutboxRelay:
+    """Moves outbox events to the event bus."""
+
+    def __init__(self, batch_size: int = None, poll_interval: float = None):
+        self.batch_size = batch_size or getattr(settings, 'OUTBOX_BATCH_SIZE', 100)
+        self.poll_interval = poll_interval if poll_interval is not None else getattr(settings, 'OUTBOX_POLL_INTERVAL', 0.5)
+        self.maxlen = getattr(settings, 'EVENT_STREAM_MAXLEN', 100000)
+        self.retention = timedelta(hours=getattr(settings, 'EVENT_RETENTION_HOURS', 168))
+        self.using = router.db_for_write(OutboxEvent)
+        self._last_purge = 0.0
+
+    def publish_pending(self) -> int:
+        """
+        Publish one batch of pending events.
+
+        Returns:
+            Number of events published
+
+        Raises:
+            redis.RedisError: If the bus is unavailable (events stay pending)
+        """
+        with transaction.atomic(using=self.using):
+            events = list(
+                OutboxEvent.objects.using(self.using)
+                .select_for_update(skip_locked=True)
+                .filter(published_at__isnull=True)
+                .order_by('id')[:self.batch_size]
+            )
+            if not events:
+                return 0
+            ids = [event.id for event in events]
+
+            try:
+                pipe = get_redis().pipeline(transaction=False)
+                for event in events:
+                    pipe.xadd(event.stream, event_fields(event), maxlen=self.maxlen, approximate=True)
+                pipe.execute()
+            except Exception as e:
+                error = e
+                OutboxEvent.objects.using(self.using).filter(id__in=ids).update(
+                    attempts=F('attempts') + 1, last_error=str(e)[:1000]
+                )
+            else:
+                error = None
+                OutboxEvent.objects.using(self.using).filter(id__in=ids).update(
+                    published_at=timezone.now(), attempts=F('attempts') + 1, last_error=''
+                )
+
+        if error is not None:
+            logger.error(f"Publishing {len(ids)} outbox events failed: {error}")
+            raise error
+        logger.debug(f"Published {len(ids)} outbox events")
+        return len(ids)
+
+    def purge(self) -> int:
+        """Delete published events and inbox records older than EVENT_RETENTION_HOURS."""
+        cutoff = timezone.now() - self.retention
+        deleted, _ = OutboxEvent.objects.using(self.using).filter(published_at__lt=cutoff).delete()
+        processed, _ = ProcessedEvent.objects.using(self.using).filter(processed_at__lt=cutoff).delete()
+        if deleted or processed:
+            logger.info(f"Purged {deleted} published outbox events and {processed} processed events")
+        return deleted + processed
+
+    def run(self, once: bool = False):
+        """Publish until interrupted, sleeping poll_interval whenever the outbox is drained."""
+        backoff = self.poll_interval
+        while True:
+            close_old_connections()
+            try:
+                published = self.publish_pending()
+                backoff = self.poll_interval
+            except Exception:
+                logger.exception("Outbox relay iteration failed")
+                published = 0
+                backoff = min(max(backoff, 0.5) * 2, 30.0)
+
+            if time.monotonic() - self._last_purge > 3600:
+                self._last_purge = time.monotonic()
+                try:
+                    self.purge()
+                except Exception:
+                    logger.exception("Outbox purge failed")
+
+            if once:
+                return
+            if published < self.batch_size:
+                time.sleep(backoff)
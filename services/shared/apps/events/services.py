@@ -0,0 +1,86 @@
+"""
+Business logic services for Events app.
+
+Services publish domain events with EventOutbox.publish() inside the
+transaction that makes the change; OutboxRelay (relay_events command) moves
+them to one Redis stream per aggregate type (hdms:events:ticket, ...), and
+EventConsumer (consume_events command) delivers them to the event_handlers
+modules of the consuming service through a Redis consumer group.
+"""
+import logging
+import uuid
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import router, transaction
+
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+STREAM_PREFIX = 'hdms:events:'
+
+_redis = None
+
+
+def stream_name(event_type: str) -> str:
+    """Stream of an event type: one per aggregate ("ticket.assigned" -> hdms:events:ticket)."""
+    return f"{STREAM_PREFIX}{event_type.split('.', 1)[0]}"
+
+
+def get_redis():
+    """Redis client of the event bus (EVENT_BUS_URL, defaults to REDIS_URL)."""
+    global _redis
+    if _redis is None:
+        import redis
+        url = getattr(settings, 'EVENT_BUS_URL', None) or settings.REDIS_URL
+        _redis = redis.Redis.from_url(url, decode_responses=True)
+    return _redis
+
+
+class EventOutbox:
+    """Writes domain events to the outbox table."""
+
+    @staticmethod
+    def publish(event_type: str, payload: dict, aggregate_id: Optional[str] = None) -> OutboxEvent:
+        """
+        Record an event for publishing once the current transaction commits.
+
+        Args:
+            event_type: "<aggregate>.<event>", e.g. "ticket.status_changed"
+            payload: JSON-serialisable event data
+            aggregate_id: ID of the changed object
+        """
+        using = router.db_for_write(OutboxEvent)
+        if not transaction.get_connection(using).in_atomic_block:
+            # Still recorded, but not atomically with the change it describes
+            logger.warning(f"Event {event_type} for {aggregate_id} published outside a transaction")
+        return OutboxEvent.objects.using(using).create(
+            event_id=uuid.uuid4(),
+            event_type=event_type,
+            stream=stream_name(event_type),
+            aggregate_id=aggregate_id,
+            payload=payload,
+        )
+
+    @staticmethod
+    def publish_many(event_type: str, events: Iterable[Tuple[Optional[str], dict]]) -> List[OutboxEvent]:
+        """
+        Record many events of one type with a single insert.
+
+        Args:
+            event_type: "<aggregate>.<event>"
+            events: (aggregate_id, payload) pairs
+        """
+        using = router.db_for_write(OutboxEvent)
+        stream = stream_name(event_type)
+        return OutboxEvent.objects.using(using).bulk_create([
+            OutboxEvent(
+                event_id=uuid.uuid4(),
+                event_type=event_type,
+                stream=stream,
+                aggregate_id=aggregate_id,
+                payload=payload,
+            )
+            for aggregate_id, payload in events
+        ])
@@ -0,0 +1,93 @@
+"""
+Idempotent event handling (EventConsumer.handle).
+
+Handlers run in one transaction with the ProcessedEvent record of their
+consumer group, so a redelivered event has no effect.
+"""
+import json
+import uuid
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from events.consumer import EventConsumer, _handlers
+from events.models import ProcessedEvent
+
+EVENT_TYPE = 'test.happened'
+
+
+class EventConsumerHandleTests(TestCase):
+    """Each consumer group runs the handlers of an event once."""
+
+    def setUp(self):
+        self.calls = []
+        self.fail_with = None
+        _handlers[EVENT_TYPE].append(self.handler)
+        self.addCleanup(_handlers.pop, EVENT_TYPE)
+        self.consumer = EventConsumer(group='test-group', streams=['events:test'])
+
+    def handler(self, event):
+        if self.fail_with:
+            raise self.fail_with
+        self.calls.append(event)
+        # Database side effect of the handler, committed or rolled back with the event
+        ProcessedEvent.objects.create(consumer_group='test-side-effect', event_id=uuid.uuid4())
+
+    def fields(self, event_id=None, event_type=EVENT_TYPE):
+        return {
+            'event_id': event_id or str(uuid.uuid4()),
+            'type': event_type,
+            'aggregate_id': str(uuid.uuid4()),
+            'payload': json.dumps({'title': 'Printer on fire'}),
+            'occurred_at': '2025-01-01T00:00:00+00:00',
+        }
+
+    def test_handles_event(self):
+        fields = self.fields()
+
+        self.assertTrue(self.consumer.handle(fields))
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.calls[0].event_id, fields['event_id'])
+        self.assertEqual(self.calls[0].payload, {'title': 'Printer on fire'})
+        self.assertTrue(ProcessedEvent.objects.filter(consumer_group='test-group', event_id=fields['event_id']).exists())
+
+    def test_redelivered_event_is_skipped(self):
+        fields = self.fields()
+        self.consumer.handle(fields)
+
+        self.assertTrue(self.consumer.handle(fields))
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(ProcessedEvent.objects.filter(event_id=fields['event_id']).count(), 1)
+
+    def test_each_group_handles_event(self):
+        fields = self.fields()
+        self.consumer.handle(fields)
+
+        EventConsumer(group='other-group', streams=['events:test']).handle(fields)
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_failed_handler_is_retried(self):
+        fields = self.fields()
+        self.fail_with = RuntimeError('Database down')
+
+        with self.assertRaises(RuntimeError):
+            self.consumer.handle(fields)
+        self.assertFalse(ProcessedEvent.objects.exists())
+
+        self.fail_with = None
+        self.assertTrue(self.consumer.handle(fields))
+        self.assertEqual(len(self.calls), 1)
+
+    def test_handler_integrity_error_is_not_swallowed(self):
+        self.fail_with = IntegrityError('duplicate key value')
+
+        with self.assertRaises(IntegrityError):
+            self.consumer.handle(self.fields())
+
+    def test_event_without_handlers_is_done(self):
+        self.assertTrue(self.consumer.handle(self.fields(event_type='test.unknown')))
+
+        self.assertFalse(ProcessedEvent.objects.exists())
@@ -2,20 +2,21 @@
 Pydantic schemas for User Service.
 """
 from ninja import Schema
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from uuid import UUID
 
 
 class UserOut(Schema):
     """User output schema."""
-    id: str
+    id: UUID
     employee_code: str
     email: Optional[str]
     first_name: str
     last_name: str
     role: str
     is_ceo: bool
-    department_id: Optional[str]
+    department_id: Optional[UUID]
     created_at: datetime
 
 
@@ -48,3 +49,12 @@ class UserImportIn(Schema):
     file_data: str  # Base64 encoded CSV/Excel
 
 
+class UserBatchIn(Schema):
+    """Batch user lookup input schema."""
+    ids: List[str]
+
+
+class UserBatchOut(Schema):
+    """Batch user lookup output schema."""
+    users: Dict[str, UserOut]  # Keyed by user id
+    missing: List[str]  # Requested ids with no active user
@@ -3,8 +3,11 @@ Shared core components for HDMS microservices.
 
 This package provides:
 - BaseModel: Abstract Django model with UUID primary key, soft delete, and timestamps
-- HTTPClient: Generic HTTP client for inter-service communication
+- HTTPClient / AsyncHTTPClient: Generic HTTP clients for inter-service communication (sync and asyncio)
 - Logging configuration: Standardized logging setup for all services
+- Keyset pagination: Cursor helpers for (created_at, id) ordered listings
+- LocalTTLCache: Thread-safe in-process LRU cache with expiry
+- ReadReplicaRouter: Read-replica routing for list and history endpoints
 """
 
 __version__ = '1.0.0'
@@ -1,20 +1,128 @@
+import copy
+import hashlib
+import json
 import logging
+import time
 import uuid
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
 from django.db import transaction
 
+from .cache import LocalTTLCache, MISSING
+
 logger = logging.getLogger(__name__)
 
+USER_CACHE_PREFIX = 'hdms:jwt_user:'
+
+
 class RemoteJWTAuthentication(JWTAuthentication):
     """
     Custom JWT Authentication that:
     1. Validates the token signature (using shared secret)
     2. Extracts user data from the token payload
     3. JIT (Just-In-Time) syncs the user to the local database
+
+    Both steps are short-circuited by caches:
+    - Validated tokens are kept in a per-process LRU (never past their exp).
+    - Synced users are cached by a hash of the user claims, in a per-process
+      LRU in front of the Django cache (Redis). A repeat request with the same
+      claims skips the database; the users row is only written when the
+      claims differ from what is stored.
+    Hit/miss counters are available from cache_stats().
     """
 
+    token_cache = LocalTTLCache(
+        maxsize=getattr(settings, 'JWT_TOKEN_CACHE_SIZE', 10000),
+        ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 60),
+    )
+    user_cache = LocalTTLCache(
+        maxsize=getattr(settings, 'JWT_USER_CACHE_SIZE', 10000),
+        ttl=getattr(settings, 'JWT_USER_CACHE_TTL', 60),
+    )
+    @classmethod
+    def cache_stats(cls):
+        """Hit/miss counters of the token and user caches (per process)."""
+        return {
+            'token': cls.token_cache.stats(),
+            'user': cls.user_cache.stats(),
+            **{counter: 0 for counter in ('redis_hits', 'redis_misses', 'db_syncs', 'db_writes')},
+            # Counted under the user cache's lock
+            **cls.user_cache.counters(),
+        }
+
+    def get_validated_token(self, raw_token):
+        """
+        Validate the token, reusing a previous validation of the same raw token.
+        """
+        key = hashlib.sha256(raw_token if isinstance(raw_token, bytes) else raw_token.encode()).hexdigest()
+        validated_token = self.token_cache.get(key)
+        if validated_token is not MISSING:
+            return validated_token
+
+        validated_token = super().get_validated_token(raw_token)
+        # Never serve a token from cache beyond its own expiry
+        exp = validated_token.get('exp')
+        ttl = self.token_cache.ttl if exp is None else min(self.token_cache.ttl, exp - time.time())
+        self.token_cache.set(key, validated_token, ttl=ttl)
+        return validated_token
+
+    @staticmethod
+    def _claims_key(user_id, defaults):
+        claims = json.dumps({'id': str(user_id), **defaults}, sort_keys=True, default=str)
+        return USER_CACHE_PREFIX + hashlib.sha256(claims.encode()).hexdigest()
+
+    @classmethod
+    def _get_cached_user(cls, key):
+        user = cls.user_cache.get(key)
+        if user is MISSING:
+            try:
+                user = cache.get(key, MISSING)
+            except Exception as e:
+                # Redis being unavailable must not break authentication
+                logger.warning(f"JWT user cache unavailable: {e}")
+                user = MISSING
+            if user is MISSING:
+                cls.user_cache.count('redis_misses')
+                return None
+            cls.user_cache.count('redis_hits')
+            cls.user_cache.set(key, user)
+        # Callers get their own instance; the cached one is shared between threads
+        return copy.copy(user)
+
+    @classmethod
+    def _set_cached_user(cls, key, user):
+        cls.user_cache.set(key, user)
+        try:
+            cache.set(key, user, timeout=cls.user_cache.ttl)
+        except Exception as e:
+            logger.warning(f"JWT user cache unavailable: {e}")
+
+    @classmethod
+    def _sync_user(cls, User, user_id, defaults):
+        """
+        Create the user, or update only the fields whose claims changed.
+
+        Returns:
+            (user, created)
+        """
+        cls.user_cache.count('db_syncs')
+        try:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            cls.user_cache.count('db_writes')
+            return User.objects.create(id=user_id, **defaults), True
+
+        changed = [field for field, value in defaults.items() if getattr(user, field) != value]
+        if changed:
+            for field in changed:
+                setattr(user, field, defaults[field])
+            cls.user_cache.count('db_writes')
+            user.save(update_fields=changed + ['updated_at'])
+        return user, False
+
     def get_user(self, validated_token):
         """
         Returns a User instance from the validated token, creating it if necessary.
@@ -69,16 +177,21 @@ class RemoteJWTAuthentication(JWTAuthentication):
         if not defaults['employee_code']:
             logger.warning(f"Token for user {user_id} missing employee_code")
 
-        # 3. JIT Sync (Get or Create/Update)
+        # 3. Short-circuit: same claims as a recent request
+        cache_key = self._claims_key(user_id, defaults)
+        user = self._get_cached_user(cache_key)
+        if user is not None:
+            return user
+
+        # 4. JIT Sync (Get or Create/Update)
         try:
-            user, created = User.objects.update_or_create(
-                id=user_id,
-                defaults=defaults
-            )
+            with transaction.atomic():
+                user, created = self._sync_user(User, user_id, defaults)
             
             if created:
                 logger.info(f"JIT Created User: {user.employee_code} ({user.id})")
             
+            self._set_cached_user(cache_key, user)
             return user
 
         except Exception as e:
@@ -89,10 +202,9 @@ class RemoteJWTAuthentication(JWTAuthentication):
                 try:
                     # Mangle email to resolve conflict
                     defaults['email'] = f"{user_id}_{defaults['email']}"
-                    user, created = User.objects.update_or_create(
-                        id=user_id,
-                        defaults=defaults
-                    )
+                    with transaction.atomic():
+                        user, created = self._sync_user(User, user_id, defaults)
+                    self._set_cached_user(cache_key, user)
                     return user
                 except Exception as retry_e:
                     logger.error(f"JIT Retry Failed for {user_id}: {str(retry_e)}")
@@ -0,0 +1,92 @@
+"""
+In-process caching helpers shared by HDMS services.
+
+LocalTTLCache is a small thread-safe LRU whose entries also expire after a
+TTL. It is meant as a first level in front of the Redis-backed Django cache
+(CACHES['default']) for values that are read on every request.
+"""
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Hashable, Optional
+
+# Returned by LocalTTLCache.get() so that None can be cached as a value
+MISSING = object()
+
+
+class LocalTTLCache:
+    """
+    Thread-safe LRU cache with per-entry expiry.
+
+    Entries are evicted least recently used first once maxsize is reached,
+    and are dropped on access once their TTL has passed.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Counters of the cache's owner (e.g. shared-tier hits), see count()
+        self._counters = defaultdict(int)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if absent or expired."""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store value under key for ttl seconds (defaults to the cache TTL)."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a named counter, under the cache's lock like hits and misses."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def counters(self) -> Dict[str, int]:
+        """Current values of the named counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
@@ -5,40 +5,60 @@ Provides a generic HTTP client with authentication, timeout, retry logic,
 and error handling for consistent inter-service communication.
 """
 import json
+import threading
 from typing import Optional, Dict, Any, Union
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 import requests
 
+from .resilience import ServiceUnavailableError, get_bulkhead, get_circuit_breaker
+from .singleflight import SingleFlight
 
-class HTTPClient:
+# Default for the fallback argument: no fallback, errors propagate
+NO_FALLBACK = object()
+
+
+class BaseHTTPClient:
     """
-    Generic HTTP client for inter-service communication.
-    
-    Features:
-    - Default timeout: 5 seconds
-    - Default retry attempts: 3 with exponential backoff
-    - Automatic token retrieval from settings
-    - Consistent error handling
+    Defaults, pool sizing and authentication helpers shared by HTTPClient
+    and AsyncHTTPClient.
     """
     
     default_timeout = 5
     default_retry_attempts = 3
     default_backoff_factor = 0.5
+    default_pool_connections = 10  # Hosts with a cached connection pool
+    default_pool_maxsize = 10  # Keep-alive connections per host
+    retry_status_codes = (500, 502, 503, 504)  # Retry on server errors
+    transport_errors = (requests.RequestException,)  # Errors that mean the target is unreachable or failing
+    
+    def __init__(self, pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None):
+        """
+        Initialize client.
+        
+        Args:
+            pool_connections: Hosts to keep connection pools for (overrides settings)
+            pool_maxsize: Connections kept alive per host (overrides settings)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
     
-    def __init__(self):
-        """Initialize HTTP client with retry adapter."""
-        self.session = requests.Session()
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.default_retry_attempts,
-            backoff_factor=self.default_backoff_factor,
-            status_forcelist=[500, 502, 503, 504],  # Retry on server errors
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    def _get_pool_sizes(self) -> tuple:
+        pool_connections = self.pool_connections
+        pool_maxsize = self.pool_maxsize
+        try:
+            from django.conf import settings
+            if pool_connections is None:
+                pool_connections = getattr(settings, 'HTTP_CLIENT_POOL_CONNECTIONS', None)
+            if pool_maxsize is None:
+                pool_maxsize = getattr(settings, 'HTTP_CLIENT_POOL_MAXSIZE', None)
+        except Exception:
+            # Django not configured yet
+            pass
+        return (
+            pool_connections or self.default_pool_connections,
+            pool_maxsize or self.default_pool_maxsize,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
     
     def _get_token(self, token: Optional[str] = None) -> Optional[str]:
         """
@@ -81,6 +101,96 @@ class HTTPClient:
         
         return headers
     
+    def _is_unavailable(self, exc: Exception) -> bool:
+        """Whether an error means the target is down (rejected locally, unreachable or 5xx)."""
+        if isinstance(exc, ServiceUnavailableError):
+            return True
+        status = getattr(getattr(exc, 'response', None), 'status_code', None)
+        return isinstance(exc, self.transport_errors) and (status is None or status >= 500)
+    
+    def _apply_fallback(self, exc: Exception, fallback: Any) -> Any:
+        """
+        Resolve a fallback for a failed call.
+        
+        Only availability errors are replaced; 4xx responses and other errors
+        are re-raised. A callable fallback is called with the exception.
+        """
+        if fallback is NO_FALLBACK or not self._is_unavailable(exc):
+            raise exc
+        return fallback(exc) if callable(fallback) else fallback
+    
+    def _flight_key(self, url: str, token: Optional[str], kwargs: Dict[str, Any]) -> tuple:
+        """Key identifying identical GET requests (same URL, credentials and options)."""
+        return (url, self._get_token(token), repr(sorted(kwargs.items())))
+
+
+class HTTPClient(BaseHTTPClient):
+    """
+    Generic HTTP client for inter-service communication.
+    
+    Features:
+    - Default timeout: 5 seconds
+    - Default retry attempts: 3 with exponential backoff
+    - Automatic token retrieval from settings
+    - Consistent error handling
+    - Pooled keep-alive connections: one session per retry policy, shared by
+      all clients in the process (pool sizes from HTTP_CLIENT_POOL_CONNECTIONS
+      and HTTP_CLIENT_POOL_MAXSIZE)
+    - Per-target circuit breaker and bulkhead (see .resilience); get_json and
+      post_json accept a fallback used when the target is unavailable
+    - Concurrent identical get_json calls from different threads share one
+      request (see .singleflight)
+    """
+    
+    # Sessions shared per process, keyed by (retries, backoff, pool_connections, pool_maxsize)
+    _sessions: Dict[tuple, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+    
+    # In-flight get_json calls shared per process
+    _single_flight = SingleFlight()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Shared session using the default retry policy."""
+        return self._get_session(self.default_retry_attempts)
+    
+    def _get_session(self, retry_attempts: int) -> requests.Session:
+        """
+        Get the shared session for a retry policy, building it on first use.
+        
+        Args:
+            retry_attempts: Number of retry attempts
+            
+        Returns:
+            requests.Session with a pooled retry adapter mounted
+        """
+        pool_connections, pool_maxsize = self._get_pool_sizes()
+        key = (retry_attempts, self.default_backoff_factor, pool_connections, pool_maxsize)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+        
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is None:
+                # Configure retry strategy
+                retry_strategy = Retry(
+                    total=retry_attempts,
+                    backoff_factor=self.default_backoff_factor,
+                    status_forcelist=list(self.retry_status_codes),
+                    allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+                )
+                adapter = HTTPAdapter(
+                    max_retries=retry_strategy,
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[key] = session
+        return session
+    
     def _make_request(
         self,
         method: str,
@@ -106,37 +216,41 @@ class HTTPClient:
             
         Raises:
             requests.RequestException: On request failure after retries
+            ServiceUnavailableError: If the circuit is open or the bulkhead is full
         """
         # Use provided timeout or default
         request_timeout = timeout if timeout is not None else self.default_timeout
         
-        # Override retry attempts if provided
-        if retry_attempts is not None:
-            retry_strategy = Retry(
-                total=retry_attempts,
-                backoff_factor=self.default_backoff_factor,
-                status_forcelist=[500, 502, 503, 504],
-                allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-            )
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            temp_session = requests.Session()
-            temp_session.mount("http://", adapter)
-            temp_session.mount("https://", adapter)
-            session = temp_session
-        else:
-            session = self.session
+        # Shared session for the requested retry policy (keeps connections alive)
+        session = self._get_session(
+            retry_attempts if retry_attempts is not None else self.default_retry_attempts
+        )
         
         # Build headers with authentication
         headers = self._get_headers(token, **kwargs)
         kwargs['headers'] = headers
         
-        # Make request
-        response = session.request(
-            method=method.upper(),
-            url=url,
-            timeout=request_timeout,
-            **kwargs
-        )
+        # Fail fast when the target is failing or saturated
+        with get_bulkhead(url):
+            breaker = get_circuit_breaker(url)
+            breaker.before_call()
+            
+            # Make request
+            try:
+                response = session.request(
+                    method=method.upper(),
+                    url=url,
+                    timeout=request_timeout,
+                    **kwargs
+                )
+            except Exception:
+                breaker.record_failure()
+                raise
+            
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
         
         # Raise exception for HTTP errors
         response.raise_for_status()
@@ -288,6 +402,7 @@ class HTTPClient:
         token: Optional[str] = None,
         timeout: Optional[Union[int, float]] = None,
         retry_attempts: Optional[int] = None,
+        fallback: Any = NO_FALLBACK,
         **kwargs
     ) -> Union[Dict[str, Any], list]:
         """
@@ -298,6 +413,8 @@ class HTTPClient:
             token: Optional authentication token
             timeout: Request timeout in seconds
             retry_attempts: Number of retry attempts
+            fallback: Value (or callable taking the exception) returned instead
+                of raising when the target is unavailable
             **kwargs: Additional arguments for requests.get()
             
         Returns:
@@ -307,8 +424,13 @@ class HTTPClient:
             ValueError: If response is not valid JSON
             requests.RequestException: On HTTP failure after retries
         """
-        response = self.get(url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
-        return response.json()
+        try:
+            return self._single_flight.do(
+                self._flight_key(url, token, kwargs),
+                lambda: self.get(url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs).json()
+            )
+        except Exception as e:
+            return self._apply_fallback(e, fallback)
     
     def post_json(
         self,
@@ -318,6 +440,7 @@ class HTTPClient:
         token: Optional[str] = None,
         timeout: Optional[Union[int, float]] = None,
         retry_attempts: Optional[int] = None,
+        fallback: Any = NO_FALLBACK,
         **kwargs
     ) -> Union[Dict[str, Any], list]:
         """
@@ -330,6 +453,8 @@ class HTTPClient:
             token: Optional authentication token
             timeout: Request timeout in seconds
             retry_attempts: Number of retry attempts
+            fallback: Value (or callable taking the exception) returned instead
+                of raising when the target is unavailable
             **kwargs: Additional arguments for requests.post()
             
         Returns:
@@ -341,6 +466,9 @@ class HTTPClient:
         """
         # Use json parameter if provided, otherwise use data
         json_data = json if json is not None else data
-        response = self.post(url, json=json_data, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+        try:
+            response = self.post(url, json=json_data, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+        except Exception as e:
+            return self._apply_fallback(e, fallback)
         return response.json()
 
@@ -0,0 +1,259 @@
+"""
+Async HTTP client for inter-service communication from ASGI code paths
+(Channels consumers, async views).
+
+Same surface as HTTPClient (get_json, post_json, retries, token handling),
+built on httpx. Each event loop gets one shared httpx.AsyncClient, so
+connections are pooled and kept alive across calls without blocking the
+loop or tying up executor threads. httpx is only needed by services that
+use this module.
+"""
+import asyncio
+import weakref
+from typing import Optional, Dict, Any, Union
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from . import BaseHTTPClient, NO_FALLBACK
+from .resilience import get_bulkhead, get_circuit_breaker
+from .singleflight import AsyncSingleFlight
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    """
+    Async counterpart of HTTPClient.
+
+    Features:
+    - Default timeout: 5 seconds
+    - Default retry attempts: 3, on connection errors and 5xx responses, with
+      the same backoff schedule as HTTPClient
+    - Automatic token retrieval from settings
+    - Raises httpx.HTTPStatusError for HTTP errors (.response.status_code as with requests)
+    - Shares the per-target circuit breakers and bulkheads of HTTPClient
+    - Concurrent identical get_json calls on one event loop share one request
+    """
+
+    transport_errors = (httpx.HTTPError,) if httpx else ()
+
+    # Pooled clients per event loop (connections cannot be shared across loops)
+    _clients = weakref.WeakKeyDictionary()
+
+    # In-flight get_json calls shared per event loop
+    _single_flight = AsyncSingleFlight()
+
+    def _get_client(self) -> 'httpx.AsyncClient':
+        """Get the shared AsyncClient of the running event loop, creating it on first use."""
+        if httpx is None:
+            raise ImportError("AsyncHTTPClient requires httpx")
+
+        pool_connections, pool_maxsize = self._get_pool_sizes()
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get((pool_connections, pool_maxsize))
+        if client is None or client.is_closed:
+            max_connections = pool_connections * pool_maxsize
+            client = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ))
+            clients[(pool_connections, pool_maxsize)] = client
+        return client
+
+    @classmethod
+    async def aclose(cls):
+        """Close the pooled clients of the running event loop (e.g. on shutdown)."""
+        clients = cls._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    def _get_backoff(self, retry_number: int) -> float:
+        """Seconds to wait before a retry (no wait before the first one, like urllib3)."""
+        if retry_number <= 1:
+            return 0
+        return self.default_backoff_factor * (2 ** (retry_number - 1))
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """
+        Make HTTP request with retry logic and error handling.
+
+        Args:
+            method: HTTP method (get, post, put, delete, patch)
+            url: Target URL
+            token: Optional authentication token
+            timeout: Request timeout in seconds
+            retry_attempts: Number of retry attempts (overrides default)
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            httpx.HTTPError: On request failure after retries
+            ServiceUnavailableError: If the circuit is open or the bulkhead is full
+        """
+        request_timeout = timeout if timeout is not None else self.default_timeout
+        retries = retry_attempts if retry_attempts is not None else self.default_retry_attempts
+
+        # Build headers with authentication
+        kwargs['headers'] = self._get_headers(token, **kwargs)
+        client = self._get_client()
+
+        # Fail fast when the target is failing or saturated
+        with get_bulkhead(url):
+            breaker = get_circuit_breaker(url)
+            breaker.before_call()
+            try:
+                response = await self._request_with_retries(client, method, url, request_timeout, retries, **kwargs)
+            except asyncio.CancelledError:
+                # Says nothing about the target, but a half-open trial must not stay pending
+                breaker.release()
+                raise
+            except Exception:
+                breaker.record_failure()
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        # Raise exception for HTTP errors
+        response.raise_for_status()
+        return response
+
+    async def _request_with_retries(self, client, method, url, timeout, retries, **kwargs) -> 'httpx.Response':
+        retry_number = 0
+        while True:
+            try:
+                response = await client.request(method.upper(), url, timeout=timeout, **kwargs)
+            except httpx.TransportError:
+                if retry_number >= retries:
+                    raise
+            else:
+                if response.status_code not in self.retry_status_codes or retry_number >= retries:
+                    return response
+
+            retry_number += 1
+            await asyncio.sleep(self._get_backoff(retry_number))
+
+    async def get(
+        self,
+        url: str,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """Perform GET request."""
+        return await self._make_request('GET', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """Perform POST request."""
+        if json is not None:
+            kwargs['json'] = json
+        if data is not None:
+            kwargs['data'] = data
+        return await self._make_request('POST', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def put(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """Perform PUT request."""
+        if json is not None:
+            kwargs['json'] = json
+        if data is not None:
+            kwargs['data'] = data
+        return await self._make_request('PUT', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def delete(
+        self,
+        url: str,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """Perform DELETE request."""
+        return await self._make_request('DELETE', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def patch(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        **kwargs
+    ) -> 'httpx.Response':
+        """Perform PATCH request."""
+        if json is not None:
+            kwargs['json'] = json
+        if data is not None:
+            kwargs['data'] = data
+        return await self._make_request('PATCH', url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+
+    async def get_json(
+        self,
+        url: str,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        fallback: Any = NO_FALLBACK,
+        **kwargs
+    ) -> Union[Dict[str, Any], list]:
+        """Perform GET request and return parsed JSON response (see HTTPClient.get_json)."""
+        async def fetch():
+            response = await self.get(url, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+            return response.json()
+
+        try:
+            return await self._single_flight.do(self._flight_key(url, token, kwargs), fetch)
+        except Exception as e:
+            return self._apply_fallback(e, fallback)
+
+    async def post_json(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None,
+        timeout: Optional[Union[int, float]] = None,
+        retry_attempts: Optional[int] = None,
+        fallback: Any = NO_FALLBACK,
+        **kwargs
+    ) -> Union[Dict[str, Any], list]:
+        """Perform POST request with JSON data and return parsed JSON response (see HTTPClient.post_json)."""
+        # Use json parameter if provided, otherwise use data
+        json_data = json if json is not None else data
+        try:
+            response = await self.post(url, json=json_data, token=token, timeout=timeout, retry_attempts=retry_attempts, **kwargs)
+        except Exception as e:
+            return self._apply_fallback(e, fallback)
+        return response.json()
@@ -0,0 +1,291 @@
+"""
+Read-through cache for inter-service client lookups.
+
+Each resource (user, ticket, ...) gets a ResourceCache with two tiers:
+- a per-process LRU (hdms_core.cache.LocalTTLCache), held for at most
+  CLIENT_CACHE_LOCAL_TTL seconds so that other processes pick up
+  invalidations quickly;
+- the Django cache (Redis database 0, shared by all services), held for the
+  resource TTL from CLIENT_CACHE_TTLS.
+
+404 responses are cached as well (for CLIENT_CACHE_NEGATIVE_TTL seconds) so
+repeated lookups of unknown ids do not hit the owning service. Other errors
+are never cached. Owning services call invalidate() when a resource changes.
+
+Every value also gets a "last known good" copy in the shared cache (kept for
+CLIENT_CACHE_STALE_TTL seconds). When the owning service is unavailable
+(e.g. its circuit breaker is open), get_or_fetch() falls back to that copy.
+"""
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..cache import LocalTTLCache, MISSING
+
+logger = logging.getLogger(__name__)
+
+# Returned by ResourceCache.get() for ids the owning service reported as missing
+NOT_FOUND = object()
+
+# How NOT_FOUND is stored in the shared cache
+_NOT_FOUND_MARKER = '__hdms_not_found__'
+
+
+def _is_not_found(exc: Exception) -> bool:
+    """Whether a client error is a 404 (requests.HTTPError or httpx.HTTPStatusError)."""
+    response = getattr(exc, 'response', None)
+    return getattr(response, 'status_code', None) == 404
+
+
+class ResourceCache:
+    """Two-tier (process LRU + Redis) cache for one remote resource type."""
+
+    # All resource caches in this process, by resource name
+    registry = {}
+
+    def __init__(self, resource: str, default_ttl: int, maxsize: int = 5000):
+        self.resource = resource
+        self.default_ttl = default_ttl
+        self.local = LocalTTLCache(maxsize=maxsize, ttl=default_ttl)
+        ResourceCache.registry[resource] = self
+
+    @property
+    def ttl(self) -> int:
+        return getattr(settings, 'CLIENT_CACHE_TTLS', {}).get(self.resource, self.default_ttl)
+
+    @property
+    def negative_ttl(self) -> int:
+        return getattr(settings, 'CLIENT_CACHE_NEGATIVE_TTL', 30)
+
+    @property
+    def local_ttl(self) -> int:
+        return getattr(settings, 'CLIENT_CACHE_LOCAL_TTL', 10)
+
+    @property
+    def stale_ttl(self) -> int:
+        return getattr(settings, 'CLIENT_CACHE_STALE_TTL', 24 * 60 * 60)
+
+    def _key(self, key) -> str:
+        return f'hdms:client:{self.resource}:{key}'
+
+    def _stale_key(self, key) -> str:
+        return f'hdms:client:{self.resource}:{key}:stale'
+
+    def _from_shared(self, key: str, value: Any) -> Any:
+        """Count a shared-cache lookup and copy a hit into the local tier."""
+        if value is MISSING:
+            self.local.count('redis_misses')
+            return MISSING
+        self.local.count('redis_hits')
+        if value == _NOT_FOUND_MARKER:
+            value = NOT_FOUND
+        self.local.set(key, value, ttl=min(self.local_ttl, self.ttl))
+        return value
+
+    def get(self, key) -> Any:
+        """
+        Look up a cached value.
+
+        Returns:
+            The value, NOT_FOUND for cached 404s, or MISSING if not cached
+        """
+        key = str(key)
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+
+        try:
+            value = cache.get(self._key(key), MISSING)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            value = MISSING
+        return self._from_shared(key, value)
+
+    async def aget(self, key) -> Any:
+        """Async variant of get() for ASGI code paths."""
+        key = str(key)
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+
+        try:
+            value = await cache.aget(self._key(key), MISSING)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            value = MISSING
+        return self._from_shared(key, value)
+
+    def _get_many_local(self, keys: Iterable) -> tuple:
+        """Split keys into local hits and keys to look up in the shared cache."""
+        found = {}
+        remote_keys = []
+        for key in map(str, keys):
+            value = self.local.get(key)
+            if value is MISSING:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+        return found, remote_keys
+
+    def _merge_shared(self, found: Dict[str, Any], remote_keys: list, remote: Dict[str, Any]) -> Dict[str, Any]:
+        for key in remote_keys:
+            value = self._from_shared(key, remote.get(self._key(key), MISSING))
+            if value is not MISSING:
+                found[key] = value
+        return found
+
+    def get_many(self, keys: Iterable) -> Dict[str, Any]:
+        """Look up several keys; only cached keys (values or NOT_FOUND) are returned."""
+        found, remote_keys = self._get_many_local(keys)
+        if not remote_keys:
+            return found
+        try:
+            remote = cache.get_many([self._key(key) for key in remote_keys])
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            remote = {}
+        return self._merge_shared(found, remote_keys, remote)
+
+    async def aget_many(self, keys: Iterable) -> Dict[str, Any]:
+        """Async variant of get_many()."""
+        found, remote_keys = self._get_many_local(keys)
+        if not remote_keys:
+            return found
+        try:
+            remote = await cache.aget_many([self._key(key) for key in remote_keys])
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            remote = {}
+        return self._merge_shared(found, remote_keys, remote)
+
+    def _store(self, key, value, ttl: int):
+        key = str(key)
+        self.local.set(key, value, ttl=min(self.local_ttl, ttl))
+        try:
+            if value is NOT_FOUND:
+                cache.set(self._key(key), _NOT_FOUND_MARKER, timeout=ttl)
+            else:
+                cache.set(self._key(key), value, timeout=ttl)
+                cache.set(self._stale_key(key), value, timeout=self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+
+    async def _astore(self, key, value, ttl: int):
+        key = str(key)
+        self.local.set(key, value, ttl=min(self.local_ttl, ttl))
+        try:
+            if value is NOT_FOUND:
+                await cache.aset(self._key(key), _NOT_FOUND_MARKER, timeout=ttl)
+            else:
+                await cache.aset(self._key(key), value, timeout=ttl)
+                await cache.aset(self._stale_key(key), value, timeout=self.stale_ttl)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+
+    def get_stale(self, key) -> Any:
+        """Last known good value for key (possibly expired), or MISSING."""
+        try:
+            return cache.get(self._stale_key(key), MISSING)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            return MISSING
+
+    async def aget_stale(self, key) -> Any:
+        """Async variant of get_stale()."""
+        try:
+            return await cache.aget(self._stale_key(key), MISSING)
+        except Exception as e:
+            logger.warning(f"Client cache unavailable for {self.resource}: {e}")
+            return MISSING
+
+    def set(self, key, value):
+        self._store(key, value, self.ttl)
+
+    def set_not_found(self, key):
+        self._store(key, NOT_FOUND, self.negative_ttl)
+
+    async def aset(self, key, value):
+        await self._astore(key, value, self.ttl)
+
+    async def aset_not_found(self, key):
+        await self._astore(key, NOT_FOUND, self.negative_ttl)
+
+    def invalidate(self, key):
+        """Drop a key from the local tier and the shared cache."""
+        key = str(key)
+        self.local.delete(key)
+        try:
+            cache.delete_many([self._key(key), self._stale_key(key)])
+        except Exception as e:
+            logger.warning(f"Could not invalidate {self.resource} {key}: {e}")
+
+    def get_or_fetch(self, key, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling fetch() on a miss.
+
+        A 404 from fetch() is cached and returned as None. On any other
+        error the last known good value is returned if there is one;
+        otherwise the exception propagates. Errors are never cached.
+        """
+        value = self.get(key)
+        if value is NOT_FOUND:
+            return None
+        if value is not MISSING:
+            return value
+
+        try:
+            value = fetch()
+        except Exception as e:
+            if _is_not_found(e):
+                self.set_not_found(key)
+                return None
+            stale = self.get_stale(key)
+            if stale is MISSING:
+                raise
+            logger.warning(f"Serving stale {self.resource} {key}: {e}")
+            return stale
+        self.set(key, value)
+        return value
+
+    async def aget_or_fetch(self, key, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async variant of get_or_fetch(); fetch() returns an awaitable."""
+        value = await self.aget(key)
+        if value is NOT_FOUND:
+            return None
+        if value is not MISSING:
+            return value
+
+        try:
+            value = await fetch()
+        except Exception as e:
+            if _is_not_found(e):
+                await self.aset_not_found(key)
+                return None
+            stale = await self.aget_stale(key)
+            if stale is MISSING:
+                raise
+            logger.warning(f"Serving stale {self.resource} {key}: {e}")
+            return stale
+        await self.aset(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for both tiers."""
+        local = self.local.stats()
+        counters = self.local.counters()
+        redis_hits, redis_misses = counters.get('redis_hits', 0), counters.get('redis_misses', 0)
+        hits = local['hits'] + redis_hits
+        total = hits + redis_misses
+        return {
+            'local': local,
+            'redis_hits': redis_hits,
+            'redis_misses': redis_misses,
+            'hit_rate': round(hits / total, 4) if total else 0.0,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit-rate metrics of every client resource cache in this process."""
+    return {resource: resource_cache.stats() for resource, resource_cache in ResourceCache.registry.items()}
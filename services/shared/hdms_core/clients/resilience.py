@@ -0,0 +1,189 @@
+"""
+Circuit breakers and bulkheads for inter-service calls.
+
+Both are kept per target (host:port) and per process, and are applied by
+HTTPClient and AsyncHTTPClient to every request:
+
+- CircuitBreaker: after CIRCUIT_BREAKER_FAILURE_THRESHOLD consecutive
+  failures (connection errors, timeouts, 5xx after retries) the circuit
+  opens and calls fail immediately with CircuitOpenError. After
+  CIRCUIT_BREAKER_RECOVERY_TIMEOUT seconds one trial call is let through
+  (half-open); its outcome closes or re-opens the circuit.
+- Bulkhead: at most BULKHEAD_MAX_CONCURRENT calls to a target are in flight
+  at once; further calls fail immediately with BulkheadFullError instead of
+  queueing, so a slow dependency cannot tie up every worker thread.
+
+Neither waits or blocks, so they are safe to use from threads and from
+asyncio tasks alike.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceUnavailableError(Exception):
+    """A call was rejected locally without contacting the target service."""
+
+
+class CircuitOpenError(ServiceUnavailableError):
+    """The target's circuit breaker is open."""
+
+
+class BulkheadFullError(ServiceUnavailableError):
+    """Too many calls to the target are already in flight."""
+
+
+def _setting(name: str, default):
+    try:
+        from django.conf import settings
+        return getattr(settings, name, default)
+    except Exception:
+        # Django not configured yet
+        return default
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one target."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, target: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.target = target
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Admit or reject a call.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open trial is running)
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+                logger.info(f"Circuit for {self.target} half-open, sending a trial call")
+
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+            self.rejected += 1
+        raise CircuitOpenError(f"Circuit open for {self.target}")
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit for {self.target} closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit for {self.target} opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End an admitted call without an outcome (cancelled): frees a half-open trial slot."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {'state': self.state, 'failures': self.failures, 'rejected': self.rejected}
+
+
+class Bulkhead:
+    """Non-blocking limit on concurrent calls to one target."""
+
+    def __init__(self, target: str, max_concurrent: int = 20):
+        self.target = target
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            if self.in_flight >= self.max_concurrent:
+                self.rejected += 1
+                raise BulkheadFullError(f"{self.in_flight} calls to {self.target} already in flight")
+            self.in_flight += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        with self._lock:
+            self.in_flight -= 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {'in_flight': self.in_flight, 'max_concurrent': self.max_concurrent, 'rejected': self.rejected}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_bulkheads: Dict[str, Bulkhead] = {}
+_registry_lock = threading.Lock()
+
+
+def get_target(url: str) -> str:
+    """Target key of a URL (host:port)."""
+    return urlsplit(url).netloc
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Circuit breaker shared by all calls to the URL's target."""
+    target = get_target(url)
+    breaker = _breakers.get(target)
+    if breaker is None:
+        with _registry_lock:
+            breaker = _breakers.setdefault(target, CircuitBreaker(
+                target,
+                failure_threshold=_setting('CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5),
+                recovery_timeout=_setting('CIRCUIT_BREAKER_RECOVERY_TIMEOUT', 30),
+            ))
+    return breaker
+
+
+def get_bulkhead(url: str) -> Bulkhead:
+    """Bulkhead shared by all calls to the URL's target."""
+    target = get_target(url)
+    bulkhead = _bulkheads.get(target)
+    if bulkhead is None:
+        with _registry_lock:
+            bulkhead = _bulkheads.setdefault(target, Bulkhead(
+                target,
+                max_concurrent=_setting('BULKHEAD_MAX_CONCURRENT', 20),
+            ))
+    return bulkhead
+
+
+def resilience_stats() -> Dict[str, Dict[str, Any]]:
+    """Circuit and bulkhead state per target in this process."""
+    targets = set(_breakers) | set(_bulkheads)
+    return {
+        target: {
+            'circuit': _breakers[target].stats() if target in _breakers else None,
+            'bulkhead': _bulkheads[target].stats() if target in _bulkheads else None,
+        }
+        for target in sorted(targets)
+    }
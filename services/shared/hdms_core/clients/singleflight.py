@@ -0,0 +1,84 @@
+"""
+Request coalescing ("single-flight") for identical concurrent lookups.
+
+While a call for a key is in flight, further callers with the same key wait
+for it and share its result (or exception) instead of making their own.
+SingleFlight coordinates threads of one process; AsyncSingleFlight does the
+same for tasks on an asyncio event loop. Nothing is cached once the call
+completes.
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-level single-flight."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run fn() unless a call for key is already in flight; share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio single-flight (one set of in-flight calls per event loop)."""
+
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fn() unless a call for key is already in flight; share its outcome."""
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        task = calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            calls[key] = task
+            task.add_done_callback(lambda _: calls.pop(key, None))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        # Shield: one caller being cancelled must not cancel the shared call
+        return await asyncio.shield(task)
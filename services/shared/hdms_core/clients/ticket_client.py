@@ -1,8 +1,14 @@
 """
 Ticket Service client for File Service.
 """
+import logging
+
 from django.conf import settings
 from . import HTTPClient
+from .async_client import AsyncHTTPClient
+from .cache import ResourceCache
+
+logger = logging.getLogger(__name__)
 
 
 class TicketClient:
@@ -15,15 +21,18 @@ class TicketClient:
     
     _client = HTTPClient()
     
+    # Read-through cache of ticket details (and unknown ids), keyed by id
+    _cache = ResourceCache('ticket', default_ttl=60)
+    
     @classmethod
     def get_ticket(cls, ticket_id: str, token: str = None):
-        """Get ticket details from Ticket Service."""
+        """Get ticket details from Ticket Service (cached, including 404s)."""
         try:
             base_url = settings.TICKET_SERVICE_URL
-            return cls._client.get_json(
+            return cls._cache.get_or_fetch(ticket_id, lambda: cls._client.get_json(
                 f'{base_url}/api/v1/tickets/{ticket_id}',
                 token=token
-            )
+            ))
         except Exception:
             return None
     
@@ -31,3 +40,53 @@ class TicketClient:
     def validate_ticket(cls, ticket_id: str, token: str = None) -> bool:
         """Validate if ticket exists in Ticket Service."""
         return cls.get_ticket(ticket_id, token) is not None
+    
+    @classmethod
+    def invalidate(cls, ticket_id: str):
+        """Drop cached details of a ticket (call when the ticket changes)."""
+        cls._cache.invalidate(ticket_id)
+
+
+class AsyncTicketClient:
+    """Async client to communicate with Ticket Service (for ASGI code paths)."""
+    
+    _client = AsyncHTTPClient()
+    
+    # Shares the cache with TicketClient
+    _cache = TicketClient._cache
+    
+    @classmethod
+    async def _fetch(cls, ticket_id: str, token: str = None):
+        """Ticket details, None for a 404; raises if Ticket Service cannot answer and no stale copy exists."""
+        base_url = settings.TICKET_SERVICE_URL
+        return await cls._cache.aget_or_fetch(ticket_id, lambda: cls._client.get_json(
+            f'{base_url}/api/v1/tickets/{ticket_id}',
+            token=token
+        ))
+    
+    @classmethod
+    async def get_ticket(cls, ticket_id: str, token: str = None):
+        """Get ticket details from Ticket Service (cached, including 404s)."""
+        try:
+            return await cls._fetch(ticket_id, token)
+        except Exception:
+            return None
+    
+    @classmethod
+    async def validate_ticket(cls, ticket_id: str, token: str = None) -> bool:
+        """Validate if ticket exists in Ticket Service."""
+        return await cls.get_ticket(ticket_id, token) is not None
+    
+    @classmethod
+    async def is_missing(cls, ticket_id: str, token: str = None) -> bool:
+        """
+        Whether Ticket Service reported the ticket as not found (404, possibly cached).
+        
+        False when it could not be asked (unavailable, circuit open): unlike
+        validate_ticket(), an outage does not make existing tickets look missing.
+        """
+        try:
+            return await cls._fetch(ticket_id, token) is None
+        except Exception as e:
+            logger.warning(f"Could not check ticket {ticket_id}, assuming it exists: {e}")
+            return False
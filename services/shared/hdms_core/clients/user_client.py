@@ -1,8 +1,15 @@
 """
 User Service client for Ticket Service.
 """
+import logging
+from typing import Dict, Iterable
+
 from django.conf import settings
 from . import HTTPClient
+from .async_client import AsyncHTTPClient
+from .cache import ResourceCache, NOT_FOUND
+
+logger = logging.getLogger(__name__)
 
 
 class UserClient:
@@ -15,20 +22,66 @@ class UserClient:
     
     _client = HTTPClient()
     
+    # Read-through cache of user details (and unknown ids), keyed by id
+    _cache = ResourceCache('user', default_ttl=300)
+    
     @classmethod
     def get_user(cls, user_id: str, token: str = None):
-        """Get user details from User Service."""
+        """Get user details from User Service (cached, including 404s)."""
         try:
             # Access settings lazily if needed, but here we can't use 'self' 
             # easily in classmethod unless we instantiate or inspect settings directly
             base_url = settings.USER_SERVICE_URL
-            return cls._client.get_json(
+            return cls._cache.get_or_fetch(user_id, lambda: cls._client.get_json(
                 f'{base_url}/api/v1/users/{user_id}',
                 token=token
-            )
+            ))
         except Exception:
             return None
     
+    @classmethod
+    def get_users(cls, user_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """
+        Get several users from User Service in as few calls as possible.
+        
+        Ids are de-duplicated, cached users (and cached unknown ids) are
+        served from the cache and the rest are fetched with
+        POST /api/v1/users/batch (chunked by USER_BATCH_MAX_IDS).
+        
+        Returns:
+            Dict of user id -> user data; unknown ids (or ids that could not
+            be fetched) are absent
+        """
+        ids = list(dict.fromkeys(str(user_id) for user_id in user_ids if user_id))
+        cached = cls._cache.get_many(ids)
+        users = {user_id: user for user_id, user in cached.items() if user is not NOT_FOUND}
+        misses = [user_id for user_id in ids if user_id not in cached]
+        
+        base_url = settings.USER_SERVICE_URL
+        chunk_size = getattr(settings, 'USER_BATCH_MAX_IDS', 100)
+        for start in range(0, len(misses), chunk_size):
+            chunk = misses[start:start + chunk_size]
+            try:
+                data = cls._client.post_json(
+                    f'{base_url}/api/v1/users/batch',
+                    json={'ids': chunk},
+                    token=token
+                )
+            except Exception as e:
+                logger.warning(f"Batch user lookup of {len(chunk)} ids failed: {e}")
+                continue
+            for user_id, user in data.get('users', {}).items():
+                cls._cache.set(user_id, user)
+                users[user_id] = user
+            for user_id in data.get('missing', []):
+                cls._cache.set_not_found(user_id)
+        return users
+    
+    @classmethod
+    def invalidate(cls, user_id: str):
+        """Drop cached details of a user (call when the user changes)."""
+        cls._cache.invalidate(user_id)
+    
     @classmethod
     def validate_user(cls, user_id: str, token: str = None) -> bool:
         """Validate if user exists in User Service."""
@@ -38,3 +91,62 @@ class UserClient:
     def validate_user_exists(cls, user_id: str, token: str = None) -> bool:
         """Alias for validate_user."""
         return cls.validate_user(user_id, token)
+
+
+class AsyncUserClient:
+    """Async client to communicate with User Service (for ASGI code paths)."""
+    
+    _client = AsyncHTTPClient()
+    
+    # Shares the cache with UserClient
+    _cache = UserClient._cache
+    
+    @classmethod
+    async def get_user(cls, user_id: str, token: str = None):
+        """Get user details from User Service (cached, including 404s)."""
+        try:
+            base_url = settings.USER_SERVICE_URL
+            return await cls._cache.aget_or_fetch(user_id, lambda: cls._client.get_json(
+                f'{base_url}/api/v1/users/{user_id}',
+                token=token
+            ))
+        except Exception:
+            return None
+    
+    @classmethod
+    async def get_users(cls, user_ids: Iterable[str], token: str = None) -> Dict[str, dict]:
+        """Async variant of UserClient.get_users()."""
+        ids = list(dict.fromkeys(str(user_id) for user_id in user_ids if user_id))
+        cached = await cls._cache.aget_many(ids)
+        users = {user_id: user for user_id, user in cached.items() if user is not NOT_FOUND}
+        misses = [user_id for user_id in ids if user_id not in cached]
+        
+        base_url = settings.USER_SERVICE_URL
+        chunk_size = getattr(settings, 'USER_BATCH_MAX_IDS', 100)
+        for start in range(0, len(misses), chunk_size):
+            chunk = misses[start:start + chunk_size]
+            try:
+                data = await cls._client.post_json(
+                    f'{base_url}/api/v1/users/batch',
+                    json={'ids': chunk},
+                    token=token
+                )
+            except Exception as e:
+                logger.warning(f"Batch user lookup of {len(chunk)} ids failed: {e}")
+                continue
+            for user_id, user in data.get('users', {}).items():
+                await cls._cache.aset(user_id, user)
+                users[user_id] = user
+            for user_id in data.get('missing', []):
+                await cls._cache.aset_not_found(user_id)
+        return users
+    
+    @classmethod
+    async def validate_user(cls, user_id: str, token: str = None) -> bool:
+        """Validate if user exists in User Service."""
+        return await cls.get_user(user_id, token) is not None
+    
+    @classmethod
+    async def validate_user_exists(cls, user_id: str, token: str = None) -> bool:
+        """Alias for validate_user."""
+        return await cls.validate_user(user_id, token)
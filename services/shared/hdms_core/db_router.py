@@ -0,0 +1,303 @@
+"""
+Read-replica routing for read-heavy endpoints.
+
+Replicas are the database aliases listed in DATABASE_REPLICAS. Reads only
+go to a replica inside views decorated with @replica_reads (list and
+history endpoints); everything else, and every write, uses the primary
+('default'), so existing read-modify-write code paths keep seeing their own
+data.
+
+Within a replica_reads view the primary is still used when:
+- the request (or an earlier request of the same user within
+  REPLICA_STICKY_SECONDS) wrote to the database (read-your-writes);
+- a transaction is open on the primary;
+- no replica's lag is within REPLICA_MAX_LAG seconds. Lag is measured on
+  the replica itself at most every REPLICA_LAG_CHECK_INTERVAL seconds per
+  process; an unreachable replica counts as infinitely lagged.
+
+Setup: add ReplicaRoutingMiddleware to MIDDLEWARE and ReadReplicaRouter to
+DATABASE_ROUTERS. With no replicas configured the router is a no-op.
+Routing decisions and replica lag are available from router_stats().
+"""
+import functools
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = 'default'
+
+STICKY_PREFIX = 'hdms:db:sticky:'
+
+# Seconds behind the primary, 0 when fully replayed (NULL when nothing was ever replayed)
+LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+class _RoutingState:
+    """Per-request routing state."""
+
+    __slots__ = ('request', 'replica_reads', 'wrote', 'sticky', 'user_id')
+
+    def __init__(self, request=None):
+        self.request = request
+        self.replica_reads = False
+        self.wrote = False
+        self.sticky = None  # Looked up once per request
+        self.user_id = None  # Set by reads_for_user()
+
+
+_state: ContextVar[Optional[_RoutingState]] = ContextVar('hdms_db_routing_state', default=None)
+
+
+def _user_id(request) -> Optional[str]:
+    """Id of the authenticated user of a request, if any."""
+    user = getattr(request, 'auth', None) or getattr(request, 'user', None)
+    if user is None or not getattr(user, 'is_authenticated', False):
+        return None
+    return str(user.pk)
+
+
+def _sticky_seconds() -> int:
+    return getattr(settings, 'REPLICA_STICKY_SECONDS', 10)
+
+
+def pin_to_primary(user_id) -> None:
+    """Send the user's replica reads to the primary for REPLICA_STICKY_SECONDS."""
+    if not get_replicas() or not user_id:
+        return
+    try:
+        cache.set(f'{STICKY_PREFIX}{user_id}', 1, timeout=_sticky_seconds())
+    except Exception as e:
+        logger.warning(f"Could not pin user {user_id} to the primary: {e}")
+
+
+def reads_for_user(user_id) -> None:
+    """
+    Treat the request's replica reads as reads of the given user's data.
+
+    For endpoints that take the user as a parameter instead of from
+    authentication: their reads stay on the primary while that user is
+    pinned (see pin_to_primary).
+    """
+    state = _state.get()
+    if state is not None and user_id:
+        state.user_id = str(user_id)
+        state.sticky = None
+
+
+def _is_pinned(user_id: str) -> bool:
+    try:
+        return cache.get(f'{STICKY_PREFIX}{user_id}') is not None
+    except Exception as e:
+        # Cannot tell: reading the primary is always correct
+        logger.warning(f"Replica stickiness unavailable: {e}")
+        return True
+
+
+def get_replicas() -> List[str]:
+    """Configured replica aliases."""
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+class ReplicaMonitor:
+    """Per-process replica lag measurements and routing counters."""
+
+    def __init__(self):
+        self.lag: Dict[str, float] = {}
+        self.checked_at: Dict[str, float] = {}
+        self.errors: Dict[str, int] = {}
+        self.decisions = {
+            'replica': 0,
+            'primary_sticky': 0,
+            'primary_transaction': 0,
+            'primary_lag': 0,
+        }
+        self._round_robin = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def max_lag(self) -> float:
+        return getattr(settings, 'REPLICA_MAX_LAG', 5.0)
+
+    @property
+    def check_interval(self) -> float:
+        return getattr(settings, 'REPLICA_LAG_CHECK_INTERVAL', 5.0)
+
+    def count(self, decision: str):
+        with self._lock:
+            self.decisions[decision] += 1
+
+    def measure(self, alias: str) -> float:
+        """Query the replica for its replay lag in seconds (inf if unknown or unreachable)."""
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(LAG_QUERY)
+                lag = cursor.fetchone()[0]
+        except Exception as e:
+            logger.warning(f"Replica {alias} lag check failed: {e}")
+            with self._lock:
+                self.errors[alias] = self.errors.get(alias, 0) + 1
+            return float('inf')
+        return float('inf') if lag is None else max(float(lag), 0.0)
+
+    def get_lag(self, alias: str) -> float:
+        """Last measured lag of a replica, re-measured when older than the check interval."""
+        now = time.monotonic()
+        with self._lock:
+            due = now - self.checked_at.get(alias, float('-inf')) >= self.check_interval
+            if due:
+                # Claim the check so concurrent requests keep using the last value
+                self.checked_at[alias] = now
+        if due:
+            lag = self.measure(alias)
+            with self._lock:
+                if self.lag.get(alias, 0.0) <= self.max_lag < lag:
+                    logger.warning(f"Replica {alias} is {lag:.1f}s behind, reading from the primary")
+                self.lag[alias] = lag
+        return self.lag.get(alias, float('inf'))
+
+    def pick(self, replicas: List[str]) -> Optional[str]:
+        """Next replica (round robin) whose lag is within REPLICA_MAX_LAG, or None."""
+        start = next(self._round_robin)
+        for offset in range(len(replicas)):
+            alias = replicas[(start + offset) % len(replicas)]
+            if self.get_lag(alias) <= self.max_lag:
+                return alias
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'decisions': dict(self.decisions),
+                'replicas': {
+                    alias: {
+                        # Unreachable (infinite lag) reported as None, so stats stay valid JSON
+                        'lag': self.lag.get(alias) if self.lag.get(alias, 0) != float('inf') else None,
+                        'healthy': self.lag.get(alias, float('inf')) <= self.max_lag,
+                        'checked_ago': round(now - self.checked_at[alias], 3) if alias in self.checked_at else None,
+                        'errors': self.errors.get(alias, 0),
+                    }
+                    for alias in get_replicas()
+                },
+            }
+
+
+monitor = ReplicaMonitor()
+
+
+def router_stats() -> Dict[str, Any]:
+    """Routing decisions and replica lag in this process."""
+    return monitor.stats()
+
+
+class ReadReplicaRouter:
+    """Database router sending reads in replica_reads views to a healthy replica."""
+
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.replica_reads:
+            return None
+        replicas = get_replicas()
+        if not replicas:
+            return None
+
+        if state.wrote or self._is_sticky(state):
+            monitor.count('primary_sticky')
+            return PRIMARY
+        if connections[PRIMARY].in_atomic_block:
+            monitor.count('primary_transaction')
+            return PRIMARY
+
+        alias = monitor.pick(replicas)
+        if alias is None:
+            monitor.count('primary_lag')
+            return PRIMARY
+        monitor.count('replica')
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {PRIMARY, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive schema changes through replication
+        if db in get_replicas():
+            return False
+        return None
+
+    @staticmethod
+    def _is_sticky(state: _RoutingState) -> bool:
+        if state.sticky is None:
+            user_id = state.user_id or _user_id(state.request)
+            state.sticky = user_id is not None and _is_pinned(user_id)
+        return state.sticky
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Tracks writes per request for ReadReplicaRouter.
+
+    A request that wrote to the database pins its user to the primary for
+    REPLICA_STICKY_SECONDS, in every process sharing the cache.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        state = _RoutingState(request)
+        token = _state.set(state)
+        try:
+            return self.get_response(request)
+        finally:
+            _state.reset(token)
+            if state.wrote:
+                pin_to_primary(_user_id(request))
+
+
+def replica_reads(view):
+    """
+    Allow the view's reads to go to a replica.
+
+    Applies to the rest of the request, so querysets returned by the view
+    and evaluated during response serialization are routed as well.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        state = _state.get()
+        if state is not None:
+            state.replica_reads = True
+            return view(request, *args, **kwargs)
+
+        # Not behind ReplicaRoutingMiddleware: scope to the view call
+        state = _RoutingState(request)
+        state.replica_reads = True
+        token = _state.set(state)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _state.reset(token)
+    return wrapper
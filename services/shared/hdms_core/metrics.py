@@ -0,0 +1,45 @@
+"""
+Runtime metrics of the shared service components, per process.
+
+Collects the hit/miss counters of the JWT and client caches, the state of
+the circuit breakers and bulkheads, and the replica routing decisions and
+lag. Served by stats_view at /internal/stats/ of each service to callers
+presenting METRICS_TOKEN as a bearer token; every request reaches one
+worker process, so the numbers are that process's.
+"""
+import hmac
+from typing import Any, Dict
+
+from django.conf import settings
+from django.http import Http404, JsonResponse
+
+from .authentication import RemoteJWTAuthentication
+from .clients.cache import cache_stats
+from .clients.resilience import resilience_stats
+from .db_router import router_stats
+
+
+def process_stats() -> Dict[str, Any]:
+    """Metrics of this process's caches, circuit breakers and replica router."""
+    return {
+        'jwt_cache': RemoteJWTAuthentication.cache_stats(),
+        'client_cache': cache_stats(),
+        'resilience': resilience_stats(),
+        'db_router': router_stats(),
+    }
+
+
+def stats_view(request):
+    """
+    Serve process_stats() to internal callers.
+
+    Disabled (404) unless METRICS_TOKEN is set; requests must send it as
+    "Authorization: Bearer <token>".
+    """
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if not token:
+        raise Http404
+    scheme, _, credentials = request.headers.get('Authorization', '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(credentials.encode(), token.encode()):
+        return JsonResponse({'detail': 'Unauthorized'}, status=401)
+    return JsonResponse(process_stats())
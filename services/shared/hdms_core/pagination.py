@@ -0,0 +1,161 @@
+"""
+Shared keyset (cursor) pagination helpers for all Django services.
+
+Pages are ordered on (created_at, id). Each page continues from the last row
+of the previous one with a single index range scan, so fetching page N costs
+the same as fetching page 1 (no OFFSET walking over earlier rows).
+
+Ranked listings (search results) are ordered on (rank, created_at, id) with
+the rank of the last row carried in the cursor.
+"""
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple, List
+
+from django.db.models import Q, QuerySet
+
+
+def encode_cursor(created_at: datetime, pk) -> str:
+    """
+    Build an opaque cursor pointing at a row.
+
+    Args:
+        created_at: Row creation timestamp
+        pk: Row primary key (UUID)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({'c': created_at.isoformat(), 'i': str(pk)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Opaque cursor string
+
+    Returns:
+        Tuple of (created_at, pk)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data['c']), uuid.UUID(data['i'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_paginate(
+    queryset: QuerySet,
+    cursor: Optional[str] = None,
+    page_size: int = 50,
+    descending: bool = True,
+) -> Tuple[List, Optional[str]]:
+    """
+    Fetch one page of a queryset ordered on (created_at, id).
+
+    Args:
+        queryset: Filtered queryset (prefetches are preserved)
+        cursor: Cursor returned with the previous page, None for the first page
+        page_size: Maximum number of rows to return
+        descending: Newest first when True
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        if descending:
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+            )
+        else:
+            queryset = queryset.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            )
+
+    ordering = ('-created_at', '-id') if descending else ('created_at', 'id')
+    # Fetch one extra row to know whether another page exists
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].pk)
+
+    return rows, next_cursor
+
+
+def encode_ranked_cursor(rank: float, created_at: datetime, pk) -> str:
+    """Build an opaque cursor pointing at a row of a ranked listing."""
+    payload = json.dumps({'r': rank, 'c': created_at.isoformat(), 'i': str(pk)}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_ranked_cursor(cursor: str) -> Tuple[float, datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by encode_ranked_cursor().
+
+    Returns:
+        Tuple of (rank, created_at, pk)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(data['r']), datetime.fromisoformat(data['c']), uuid.UUID(data['i'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def ranked_keyset_paginate(
+    queryset: QuerySet,
+    rank_field: str = 'rank',
+    cursor: Optional[str] = None,
+    page_size: int = 50,
+) -> Tuple[List, Optional[str]]:
+    """
+    Fetch one page of a queryset ordered on (rank, created_at, id), highest rank first.
+
+    Args:
+        queryset: Filtered queryset annotated with rank_field
+        rank_field: Name of the rank annotation
+        cursor: Cursor returned with the previous page, None for the first page
+        page_size: Maximum number of rows to return
+
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if cursor:
+        rank, created_at, pk = decode_ranked_cursor(cursor)
+        queryset = queryset.filter(
+            Q(**{f'{rank_field}__lt': rank})
+            | Q(**{rank_field: rank, 'created_at__lt': created_at})
+            | Q(**{rank_field: rank, 'created_at': created_at, 'id__lt': pk})
+        )
+
+    rows = list(queryset.order_by(f'-{rank_field}', '-created_at', '-id')[:page_size + 1])
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_ranked_cursor(getattr(last, rank_field), last.created_at, last.pk)
+
+    return rows, next_cursor
@@ -0,0 +1,188 @@
+"""
+Write-behind base for buffered, batched database writers.
+
+Used by apps.audit.services.AuditLogWriter (ticket service) and
+apps.chat.writer.ChatMessageWriter (communication service). Callers queue
+items without waiting for the INSERT; a background thread, started lazily
+in each process, writes them in batches of batch_size when that many are
+waiting or every flush_interval seconds.
+
+A batch that cannot be written is saved by the writer as a JSON lines file
+of model instances in spool_dir and replayed by the next flush of any
+worker, oldest file first and each file in its own transaction. A file that
+fails for any reason but an unavailable database is moved to the quarantine
+subdirectory, so one bad row cannot hold up everything written after it.
+"""
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Iterable, List
+
+from django.core import serializers
+from django.db import InterfaceError, OperationalError, close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindWriter(ABC):
+    """
+    FIFO buffer, flush thread and spool shared by write-behind writers.
+
+    Subclasses set name and implement the abstract batch_size,
+    flush_interval, spool_dir, _persist() (write one batch of buffered
+    items, spooling it on failure) and _replay() (write the model instances
+    of one spool file in one transaction).
+    """
+
+    name = 'write-behind'
+
+    def __init__(self):
+        self._buffer = deque()
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._writing = []
+
+    @property
+    @abstractmethod
+    def batch_size(self) -> int:
+        """Items written per batch; a flush starts early once this many are waiting."""
+
+    @property
+    @abstractmethod
+    def flush_interval(self) -> float:
+        """Seconds between flushes of the background thread."""
+
+    @property
+    @abstractmethod
+    def spool_dir(self) -> Path:
+        """Directory of batches waiting to be replayed."""
+
+    @property
+    def quarantine_dir(self) -> Path:
+        return self.spool_dir / 'quarantine'
+
+    def _enqueue(self, item):
+        self._buffer.append(item)
+        self._ensure_worker()
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def buffered(self) -> list:
+        """Items queued (or being written) but not yet written, oldest first."""
+        return list(self._writing) + list(self._buffer)
+
+    def _ensure_worker(self):
+        """Start the flush thread lazily (after any fork by the app server)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                name = f"{self.name.replace(' ', '-')}-writer"
+                self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if not self._buffer and not self._spool_files():
+                continue
+            close_old_connections()
+            try:
+                self._before_flush()
+                self.flush()
+            except Exception as e:
+                logger.error(f"{self.name.capitalize()} flush failed: {e}")
+            finally:
+                close_old_connections()
+
+    def _before_flush(self):
+        """Hook run by the flush thread before each flush."""
+
+    def flush(self) -> int:
+        """
+        Write all spooled and buffered items now.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            written = self._replay_spool()
+            while self._buffer:
+                batch = []
+                while self._buffer and len(batch) < self.batch_size:
+                    batch.append(self._buffer.popleft())
+                self._writing = batch
+                try:
+                    written += self._persist(batch)
+                finally:
+                    self._writing = []
+            return written
+
+    @abstractmethod
+    def _persist(self, batch: list) -> int:
+        """Write a batch of buffered items, spooling it if that fails; returns rows written."""
+
+    @abstractmethod
+    def _replay(self, objects: List) -> int:
+        """Write the model instances of one spool file in one transaction; returns rows written."""
+
+    def _replay_spool(self) -> int:
+        """Write previously spooled rows, one file per transaction."""
+        written = 0
+        for path in self._spool_files():
+            try:
+                with path.open() as spool:
+                    objects = [obj.object for obj in serializers.deserialize('jsonl', spool)]
+                count = self._replay(objects)
+            except FileNotFoundError:
+                # Replayed and removed by another worker in the meantime
+                continue
+            except (OperationalError, InterfaceError) as e:
+                # Database unavailable: keep the files for the next flush
+                logger.error(f"{self.name.capitalize()} spool replay stopped at {path.name}: {e}")
+                break
+            except Exception as e:
+                self._quarantine(path, e)
+                continue
+            path.unlink(missing_ok=True)
+            written += count
+        return written
+
+    def _quarantine(self, path: Path, error: Exception):
+        """Set aside a spool file that cannot be replayed."""
+        try:
+            self.quarantine_dir.mkdir(parents=True, exist_ok=True)
+            path.replace(self.quarantine_dir / path.name)
+            logger.error(f"{self.name.capitalize()} spool file {path.name} cannot be replayed, moved to {self.quarantine_dir}: {error}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Could not quarantine {self.name} spool file {path.name} ({e}), replay failed: {error}")
+
+    def _spool_files(self) -> list:
+        if not self.spool_dir.is_dir():
+            return []
+        # File names start with a nanosecond timestamp, so name order is write order
+        return sorted(self.spool_dir.glob('*.jsonl'))
+
+    def _write_spool(self, objects: Iterable) -> bool:
+        """Save model instances for a later replay; False if they could not be saved."""
+        objects = list(objects)
+        if not objects:
+            return True
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with (self.spool_dir / f'{time.time_ns()}-{uuid.uuid4().hex}.jsonl').open('w') as spool:
+                spool.write(serializers.serialize('jsonl', objects))
+            return True
+        except OSError as e:
+            # Last resort: keep the data in the logs
+            logger.error(f"Could not spool {self.name} rows ({e}): {serializers.serialize('jsonl', objects)}")
+            return False
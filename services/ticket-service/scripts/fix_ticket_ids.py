@@ -1,15 +1,23 @@
 """
 Data migration to generate ticket_id for existing non-draft tickets.
 
+Also reseeds the per-year ticket_id sequence so it continues after the
+highest ticket_id already in the table (e.g. after an import or restore).
+
 Run this manually: python manage.py shell < scripts/fix_ticket_ids.py
 """
 from django.utils import timezone
 from apps.tickets.models.ticket import Ticket
+from apps.tickets.services.ticket_id_allocator import TicketIdAllocator
 
 def fix_ticket_ids():
     """Generate ticket_id for all non-draft tickets that don't have one."""
     year = timezone.now().year
     
+    # Make sure the sequence is past every ticket_id already issued this year
+    last_num = TicketIdAllocator.reseed(year)
+    print(f"Reseeded ticket_id sequence for {year} (last number: {last_num}).")
+    
     # Get tickets without ticket_id that are not drafts
     tickets = Ticket.objects.filter(ticket_id__isnull=True).exclude(status='draft').order_by('created_at')
     
@@ -17,23 +25,12 @@ def fix_ticket_ids():
         print("No tickets need fixing.")
         return
     
-    # Get the last used number
-    last_ticket = Ticket.objects.filter(
-        ticket_id__startswith=f'HD-{year}-'
-    ).order_by('-ticket_id').first()
-    
-    if last_ticket and last_ticket.ticket_id:
-        next_num = int(last_ticket.ticket_id.split('-')[-1]) + 1
-    else:
-        next_num = 1
-    
     # Update each ticket
     count = 0
     for ticket in tickets:
-        ticket.ticket_id = f'HD-{year}-{str(next_num).zfill(4)}'
+        ticket.ticket_id = TicketIdAllocator.next_ticket_id(year)
         ticket.save(update_fields=['ticket_id'])
         print(f"Updated: {ticket.id} -> {ticket.ticket_id}")
-        next_num += 1
         count += 1
     
     print(f"\nFixed {count} tickets.")
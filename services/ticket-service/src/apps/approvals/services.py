@@ -4,7 +4,7 @@ Business logic services for Approval app.
 from typing import Optional
 from django.db import transaction as db_transaction
 from .models import Approval, ApprovalStatus
-from core.clients.user_client import UserClient
+from hdms_core.clients.user_client import UserClient
 
 
 class ApprovalService:
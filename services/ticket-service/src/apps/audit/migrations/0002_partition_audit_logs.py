@@ -0,0 +1,93 @@
+# Converts audit_logs into a table range-partitioned by month on "timestamp"
+#
+# PostgreSQL requires the partition key in every unique constraint, so the
+# primary key becomes (id, timestamp). Django keeps treating id as the primary
+# key; ids are UUID4 and therefore still unique in practice. Existing indexes
+# are recreated on the partitioned table with their original names.
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.db import migrations
+
+TABLE = 'audit_logs'
+MONTHS_AHEAD = 3
+
+
+def _index_definitions(cursor, table):
+    cursor.execute(
+        """
+        SELECT indexname, indexdef FROM pg_indexes
+        WHERE schemaname = current_schema() AND tablename = %s AND indexname <> %s
+        """,
+        [table, f'{table}_pkey'],
+    )
+    return cursor.fetchall()
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        indexes = _index_definitions(cursor, TABLE)
+
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {TABLE}_legacy')
+        cursor.execute(
+            f'CREATE TABLE {TABLE} (LIKE {TABLE}_legacy INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")'
+        )
+        cursor.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+        # One partition per month from the oldest row up to MONTHS_AHEAD months from now
+        cursor.execute(f'SELECT min("timestamp") FROM {TABLE}_legacy')
+        oldest = cursor.fetchone()[0] or datetime.now(dt_timezone.utc)
+        oldest = oldest.astimezone(dt_timezone.utc)
+        month = datetime(oldest.year, oldest.month, 1, tzinfo=dt_timezone.utc)
+        now = datetime.now(dt_timezone.utc)
+        last = _add_months(datetime(now.year, now.month, 1, tzinfo=dt_timezone.utc), MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE {TABLE}_p{month.year:04d}_{month.month:02d} PARTITION OF {TABLE} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [month, _add_months(month, 1)],
+            )
+            month = _add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {TABLE}_legacy')
+        cursor.execute(f'DROP TABLE {TABLE}_legacy')
+
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, "timestamp")')
+        for _, definition in indexes:
+            cursor.execute(definition)
+
+
+def unpartition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        indexes = _index_definitions(cursor, TABLE)
+
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned')
+        cursor.execute(f'CREATE TABLE {TABLE} (LIKE {TABLE}_partitioned INCLUDING DEFAULTS)')
+        cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {TABLE}_partitioned')
+        cursor.execute(f'DROP TABLE {TABLE}_partitioned CASCADE')
+
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id)')
+        for _, definition in indexes:
+            cursor.execute(definition.replace(' ON ONLY ', ' ON '))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('audit', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_table, unpartition_table),
+    ]
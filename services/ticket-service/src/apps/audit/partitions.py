@@ -0,0 +1,178 @@
+"""
+Monthly range partitions for the audit_logs table (PostgreSQL).
+
+audit_logs is partitioned on "timestamp" with one partition per UTC month
+(audit_logs_pYYYY_MM) plus a DEFAULT partition that catches rows outside the
+pre-created range. Partitions are created ahead of time by ensure_partitions();
+old months are archived by detaching whole partitions instead of updating rows.
+"""
+import gzip
+import logging
+import re
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connections, router, transaction
+
+from .models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+TABLE = AuditLog._meta.db_table
+DEFAULT_PARTITION = f'{TABLE}_default'
+PARTITION_RE = re.compile(rf'^{TABLE}_p(\d{{4}})_(\d{{2}})$')
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant (UTC) of the month containing value."""
+    value = value.astimezone(dt_timezone.utc)
+    return datetime(value.year, value.month, 1, tzinfo=dt_timezone.utc)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months."""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition holding the month that starts at start."""
+    return f'{TABLE}_p{start.year:04d}_{start.month:02d}'
+
+
+def _connection():
+    return connections[router.db_for_write(AuditLog)]
+
+
+def is_partitioned() -> bool:
+    """Whether audit_logs is a partitioned table on this database."""
+    connection = _connection()
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == 'p'
+
+
+def list_partitions() -> List[str]:
+    """Names of the monthly partitions currently attached, oldest first."""
+    with _connection().cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s)
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    return sorted(name for name in names if PARTITION_RE.match(name))
+
+
+def create_partition(start: datetime) -> bool:
+    """
+    Create the partition for the month starting at start, if missing.
+
+    Rows for that month that already landed in the DEFAULT partition are moved
+    into the new partition in the same transaction.
+
+    Returns:
+        True if a partition was created
+    """
+    name = partition_name(start)
+    end = add_months(start, 1)
+    connection = _connection()
+
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0]:
+                return False
+
+            cursor.execute(f'CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)')
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE "timestamp" >= %s AND "timestamp" < %s
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """,
+                [start, end],
+            )
+            cursor.execute(
+                f'ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM (%s) TO (%s)',
+                [start, end],
+            )
+
+    logger.info(f"Created audit log partition {name}")
+    return True
+
+
+def ensure_partitions(months_ahead: Optional[int] = None, now: Optional[datetime] = None) -> List[str]:
+    """
+    Make sure partitions exist for the current month and the next months_ahead months.
+
+    Returns:
+        Names of the partitions that were created
+    """
+    if not is_partitioned():
+        return []
+
+    if months_ahead is None:
+        months_ahead = getattr(settings, 'AUDIT_PARTITION_MONTHS_AHEAD', 3)
+    start = month_start(now or datetime.now(dt_timezone.utc))
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(start, offset)
+        if create_partition(month):
+            created.append(partition_name(month))
+    return created
+
+
+def archive_partitions(older_than: datetime, export_dir: Optional[Path] = None) -> List[str]:
+    """
+    Detach every monthly partition that lies entirely before older_than.
+
+    Detaching is a metadata change, so archival no longer rewrites rows or
+    holds long locks. With export_dir, each detached partition is written to
+    <export_dir>/<partition>.csv.gz and dropped; otherwise it is kept as a
+    standalone table renamed to audit_logs_archived_pYYYY_MM.
+
+    Returns:
+        Names of the archived partitions
+    """
+    if not is_partitioned():
+        return []
+
+    connection = _connection()
+    archived = []
+    for name in list_partitions():
+        year, month = map(int, PARTITION_RE.match(name).groups())
+        end = add_months(datetime(year, month, 1, tzinfo=dt_timezone.utc), 1)
+        if end > older_than:
+            continue
+
+        if export_dir:
+            # Export before detaching: the month is closed, so nothing writes to it
+            export_dir = Path(export_dir)
+            export_dir.mkdir(parents=True, exist_ok=True)
+            with connection.cursor() as cursor, gzip.open(export_dir / f'{name}.csv.gz', 'wt') as archive:
+                cursor.copy_expert(f'COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)', archive)
+
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+                if export_dir:
+                    cursor.execute(f'DROP TABLE {name}')
+                else:
+                    cursor.execute(f'ALTER TABLE {name} RENAME TO {TABLE}_archived_p{year:04d}_{month:02d}')
+
+        logger.info(f"Archived audit log partition {name}")
+        archived.append(name)
+    return archived
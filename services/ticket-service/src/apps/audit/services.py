@@ -0,0 +1,117 @@
+"""
+Business logic services for Audit app.
+"""
+import atexit
+import logging
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from hdms_core.write_behind import WriteBehindWriter
+
+from .models import AuditLog
+from .partitions import ensure_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter(WriteBehindWriter):
+    """
+    Buffered, batched writer for AuditLog rows (see hdms_core.write_behind).
+
+    - Rows are built (id and timestamp assigned) when logged, queued once the
+      surrounding transaction commits, and written with bulk_create by a
+      background thread when AUDIT_BATCH_SIZE rows are waiting or every
+      AUDIT_FLUSH_INTERVAL seconds.
+    - One FIFO buffer and one flush at a time keep the rows of an object_id
+      in the order they were logged.
+    - A batch that cannot be written is saved as a JSON lines file in
+      AUDIT_SPOOL_DIR and replayed by the next flush of any worker; replays
+      are idempotent because primary keys are assigned up front. Spool files
+      that cannot be replayed are moved to its quarantine subdirectory.
+    - Entries not yet written can be read with buffered().
+    - Whatever is still buffered is flushed at interpreter exit.
+    - Once a day the flush thread creates upcoming monthly audit_logs
+      partitions (see apps.audit.partitions).
+    """
+
+    name = 'audit log'
+
+    def __init__(self):
+        super().__init__()
+        self._partitions_checked = None
+
+    @property
+    def batch_size(self) -> int:
+        return getattr(settings, 'AUDIT_BATCH_SIZE', 100)
+
+    @property
+    def flush_interval(self) -> float:
+        return getattr(settings, 'AUDIT_FLUSH_INTERVAL', 1.0)
+
+    @property
+    def spool_dir(self) -> Path:
+        return Path(getattr(settings, 'AUDIT_SPOOL_DIR', settings.BASE_DIR / 'audit_spool'))
+
+    def log(self, **fields) -> AuditLog:
+        """
+        Record an audit entry without blocking the caller on the INSERT.
+
+        Accepts the same keyword arguments as AuditLog.objects.create().
+        With AUDIT_ASYNC disabled the row is written immediately.
+        """
+        entry = AuditLog(**fields)
+        if not getattr(settings, 'AUDIT_ASYNC', True):
+            entry.save()
+            return entry
+
+        # Only audit changes that were actually committed
+        db_transaction.on_commit(lambda: self._enqueue(entry))
+        return entry
+
+    def buffered(self, **filters) -> list:
+        """
+        Entries of this process committed but not yet written, oldest first.
+
+        Args:
+            **filters: Field values the entries must have (compared as strings)
+        """
+        return [
+            entry for entry in super().buffered()
+            if all(str(getattr(entry, field)) == str(value) for field, value in filters.items())
+        ]
+
+    def _before_flush(self):
+        self._ensure_partitions()
+
+    def _ensure_partitions(self):
+        """Create upcoming monthly partitions, at most once a day per process."""
+        today = date.today()
+        if self._partitions_checked == today:
+            return
+        # Mark first: on failure rows still land in the DEFAULT partition, retry tomorrow
+        self._partitions_checked = today
+        try:
+            ensure_partitions()
+        except Exception as e:
+            logger.error(f"Could not create audit log partitions: {e}")
+
+    def _persist(self, batch: list) -> int:
+        try:
+            with db_transaction.atomic():
+                AuditLog.objects.bulk_create(batch, ignore_conflicts=True)
+        except Exception as e:
+            logger.error(f"Audit log bulk insert of {len(batch)} entries failed, spooling: {e}")
+            self._write_spool(batch)
+            return 0
+        return len(batch)
+
+    def _replay(self, entries: list) -> int:
+        with db_transaction.atomic():
+            AuditLog.objects.bulk_create(entries, batch_size=self.batch_size, ignore_conflicts=True)
+        return len(entries)
+
+
+audit_writer = AuditLogWriter()
+atexit.register(audit_writer.flush)
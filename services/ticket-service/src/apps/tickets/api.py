@@ -5,11 +5,12 @@ from ninja import Router, File, UploadedFile
 from ninja.security import HttpBearer
 from ninja.errors import HttpError
 from typing import List, Optional
-from django.utils import timezone
+from uuid import UUID
+from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.tickets.schemas import (
-    TicketOut, TicketIn, TicketUpdateIn, StatusUpdateIn, 
+    TicketOut, TicketPageOut, TicketSearchOut, TicketStatsOut, DepartmentLoadOut, TicketIn, TicketUpdateIn, StatusUpdateIn, 
     AttachmentOut, AttachmentCreateIn, TicketConfirmReviewIn,
     AssignTicketIn, RejectTicketIn, PostponeTicketIn,
     AuditLogOut, TicketProgressIn, TicketAcknowledgeIn, SLAUpdateIn
@@ -17,8 +18,15 @@ from apps.tickets.schemas import (
 from apps.tickets.models.ticket import Ticket
 from apps.tickets.models.sub_ticket import SubTicket
 from apps.tickets.models.attachment import Attachment
+from apps.tickets.selectors import TicketSelector
+from apps.tickets.services.ticket_counters import TicketCounterService, GROUP_FIELDS
+from apps.tickets.services.department_load import DepartmentLoadService
+from apps.tickets.services.sla_policy import SLAPolicyResolver
 from apps.audit.models import AuditLog, ActionType, AuditCategory
+from apps.audit.services import audit_writer
 from hdms_core.clients.user_client import UserClient
+from hdms_core.pagination import keyset_paginate
+from hdms_core.db_router import replica_reads
 
 from hdms_core.authentication import RemoteJWTAuthentication
 
@@ -45,17 +53,9 @@ def create_ticket(request, payload: TicketIn):
     return ticket
 
 
-@router.get("/", response=List[TicketOut])
-def list_tickets(request, status: Optional[str] = None, requestor_id: Optional[str] = None, assignee_id: Optional[str] = None, exclude_drafts: bool = True):
-    """List tickets with optional filters.
-    
-    Args:
-        status: Filter by specific status
-        requestor_id: Filter by requestor (if provided, shows drafts)
-        assignee_id: Filter by assignee
-        exclude_drafts: Exclude draft tickets (default True for moderator view)
-    """
-    queryset = Ticket.objects.all()
+def _filter_tickets(status: Optional[str], requestor_id: Optional[str], assignee_id: Optional[str], exclude_drafts: bool):
+    """Build the filtered ticket queryset shared by the list endpoints."""
+    queryset = TicketSelector.with_related(Ticket.objects.all())
     
     # Exclude drafts unless viewing own tickets (requestor or assignee)
     if exclude_drafts and not requestor_id and not assignee_id:
@@ -68,21 +68,163 @@ def list_tickets(request, status: Optional[str] = None, requestor_id: Optional[s
     if assignee_id:
         queryset = queryset.filter(assignee_id=assignee_id)
     
+    return queryset
+
+
+@router.get("/", response=List[TicketOut])
+@replica_reads
+def list_tickets(request, status: Optional[str] = None, requestor_id: Optional[str] = None, assignee_id: Optional[str] = None, exclude_drafts: bool = True):
+    """List tickets with optional filters.
+    
+    Args:
+        status: Filter by specific status
+        requestor_id: Filter by requestor (if provided, shows drafts)
+        assignee_id: Filter by assignee
+        exclude_drafts: Exclude draft tickets (default True for moderator view)
+    """
+    queryset = _filter_tickets(status, requestor_id, assignee_id, exclude_drafts)
     return [TicketOut.from_orm(ticket) for ticket in queryset]
 
 
+@router.get("/paged", response=TicketPageOut)
+@replica_reads
+def list_tickets_paged(
+    request,
+    status: Optional[str] = None,
+    requestor_id: Optional[str] = None,
+    assignee_id: Optional[str] = None,
+    exclude_drafts: bool = True,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+    include_total: bool = True,
+):
+    """List tickets one page at a time (keyset pagination, newest first).
+    
+    Takes the same filters as list_tickets. Pages are ordered on
+    (created_at, id), so every page is an index range scan regardless of depth.
+    
+    Args:
+        cursor: next_cursor from the previous page (omit for the first page)
+        page_size: Tickets per page (defaults to TICKET_PAGE_SIZE, capped at TICKET_MAX_PAGE_SIZE)
+        include_total: Also return the total number of matching tickets (extra COUNT query)
+    """
+    page_size = min(max(page_size or settings.TICKET_PAGE_SIZE, 1), settings.TICKET_MAX_PAGE_SIZE)
+    queryset = _filter_tickets(status, requestor_id, assignee_id, exclude_drafts)
+    
+    try:
+        tickets, next_cursor = keyset_paginate(queryset, cursor=cursor, page_size=page_size)
+    except ValueError:
+        raise HttpError(400, "Invalid cursor")
+    
+    return {
+        'items': [TicketOut.from_orm(ticket) for ticket in tickets],
+        'next_cursor': next_cursor,
+        'total': queryset.count() if include_total else None,
+    }
+
+
+@router.get("/search", response=TicketSearchOut)
+@replica_reads
+def search_tickets(
+    request,
+    q: str,
+    status: Optional[str] = None,
+    requestor_id: Optional[str] = None,
+    assignee_id: Optional[str] = None,
+    exclude_drafts: bool = True,
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+):
+    """Search tickets by ticket_id, title, description and category, best matches first.
+    
+    Takes the same filters as list_tickets. Partial ticket ids ("HD-2025-00")
+    are matched as substrings; other text uses full-text search with
+    websearch syntax ("exact phrase", -excluded, a or b).
+    
+    Args:
+        q: Search text
+        cursor: next_cursor from the previous page (omit for the first page)
+        page_size: Results per page (defaults to TICKET_PAGE_SIZE, capped at TICKET_MAX_PAGE_SIZE)
+    """
+    if not q.strip():
+        raise HttpError(400, "Search text is required")
+    page_size = min(max(page_size or settings.TICKET_PAGE_SIZE, 1), settings.TICKET_MAX_PAGE_SIZE)
+    queryset = _filter_tickets(status, requestor_id, assignee_id, exclude_drafts)
+    
+    try:
+        tickets, next_cursor = TicketSelector.search(
+            queryset, q, cursor=cursor, page_size=page_size,
+            max_candidates=settings.TICKET_SEARCH_MAX_CANDIDATES,
+        )
+    except ValueError:
+        raise HttpError(400, "Invalid cursor")
+    
+    return {'items': tickets, 'next_cursor': next_cursor}
+
+
+@router.get("/stats", response=TicketStatsOut)
+@replica_reads
+def ticket_stats(
+    request,
+    group_by: str = "status",
+    department_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee_id: Optional[UUID] = None,
+):
+    """Ticket counts for dashboards (deleted tickets excluded).
+    
+    Read from the precomputed ticket_counters table, so the cost depends on
+    the number of groups, not the number of tickets.
+    
+    Args:
+        group_by: Comma-separated subset of department_id, status, priority, assignee_id
+    """
+    fields = [field.strip() for field in group_by.split(',') if field.strip()]
+    invalid = [field for field in fields if field not in GROUP_FIELDS]
+    if invalid:
+        raise HttpError(400, f"Cannot group by {', '.join(invalid)}; use {', '.join(GROUP_FIELDS)}")
+    
+    filters = {
+        'department_id': department_id,
+        'status': status,
+        'priority': priority,
+        'assignee_id': assignee_id,
+    }
+    groups = TicketCounterService.get_stats(fields, **{name: value for name, value in filters.items() if value is not None})
+    return {'total': sum(group['count'] for group in groups), 'groups': groups}
+
+
+@router.get("/departments/{department_id}/load", response=DepartmentLoadOut)
+def department_load(request, department_id: UUID):
+    """Active tickets of a department against its capacity, for routing new tickets.
+    
+    Served from the event-maintained departments.active_tickets (cached), so
+    no tickets are counted.
+    """
+    load = DepartmentLoadService.get_load(department_id)
+    if load is None:
+        raise HttpError(404, "Department not found")
+    return load
+
 
 @router.get("/{ticket_id}", response=TicketOut)
 def get_ticket(request, ticket_id: str):
     """Get ticket by ID."""
-    ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+    try:
+        ticket = TicketSelector.with_related(Ticket.objects).get(id=ticket_id, is_deleted=False)
+    except Ticket.DoesNotExist:
+        raise HttpError(404, "Ticket not found")
     return TicketOut.from_orm(ticket)
 
 
 @router.patch("/{ticket_id}", response=TicketOut)
 def update_ticket(request, ticket_id: str, payload: TicketUpdateIn):
     """Update ticket."""
-    ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+    try:
+        ticket = TicketSelector.with_related(Ticket.objects).get(id=ticket_id, is_deleted=False)
+    except Ticket.DoesNotExist:
+        raise HttpError(404, "Ticket not found")
     
     for field, value in payload.dict(exclude_unset=True).items():
         setattr(ticket, field, value)
@@ -112,7 +254,7 @@ def update_status(request, ticket_id: str, payload: StatusUpdateIn):
         ticket.save()
         
         # Log action
-        AuditLog.objects.create(
+        audit_writer.log(
             action_type=ActionType.UPDATE,
             category=AuditCategory.TICKET,
             model_name='Ticket',
@@ -192,7 +334,7 @@ def assign_ticket(request, ticket_id: str, payload: AssignTicketIn):
     ticket.save()
     
     # Log assignment
-    AuditLog.objects.create(
+    audit_writer.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -236,7 +378,7 @@ def postpone_ticket(request, ticket_id: str, payload: PostponeTicketIn):
     ticket.save()
     
     # Log postponement
-    AuditLog.objects.create(
+    audit_writer.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -276,7 +418,7 @@ def acknowledge_ticket(request, ticket_id: str, payload: TicketAcknowledgeIn):
             'status': ticket.status
         }
         
-        AuditLog.objects.create(
+        audit_writer.log(
             action_type=ActionType.UPDATE,
             category=AuditCategory.TICKET,
             model_name='Ticket',
@@ -304,7 +446,7 @@ def update_progress(request, ticket_id: str, payload: TicketProgressIn):
     ticket.progress_percent = payload.progress_percent
     ticket.save()
     
-    AuditLog.objects.create(
+    audit_writer.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -326,10 +468,10 @@ def update_sla(request, ticket_id: str, payload: SLAUpdateIn):
         raise HttpError(404, "Ticket not found")
         
     old_due_at = ticket.due_at
-    ticket.due_at = payload.due_at
+    ticket.set_due_at(payload.due_at)
     ticket.save()
     
-    AuditLog.objects.create(
+    audit_writer.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
@@ -343,17 +485,34 @@ def update_sla(request, ticket_id: str, payload: SLAUpdateIn):
     return ticket
 
 @router.get("/{ticket_id}/history", response=List[AuditLogOut])
+@replica_reads
 def get_ticket_history(request, ticket_id: str):
     """Get ticket audit log history."""
-    return AuditLog.objects.filter(
+    queryset = AuditLog.objects.filter(
         model_name='Ticket', 
         object_id=ticket_id
-    ).order_by('-timestamp')
+    )
+    
+    # No entry predates the ticket: bounding timestamp lets PostgreSQL skip
+    # every monthly audit_logs partition older than the ticket
+    created_at = Ticket.objects.with_deleted().filter(id=ticket_id).values_list('created_at', flat=True).first()
+    if created_at:
+        queryset = queryset.filter(timestamp__gte=created_at)
+    
+    history = list(queryset.order_by('-timestamp'))
+    # Entries this worker has not written yet, so the caller sees its own changes
+    written = {entry.id for entry in history}
+    buffered = [
+        entry for entry in audit_writer.buffered(model_name='Ticket', object_id=ticket_id)
+        if entry.id not in written
+    ]
+    if buffered:
+        history = sorted(history + buffered, key=lambda entry: entry.timestamp, reverse=True)
+    return history
 
 @router.post("/{ticket_id}/confirm-review", response=TicketOut)
 def confirm_review_ticket(request, ticket_id: str, payload: TicketConfirmReviewIn):
     """Initial moderator review: update fields and assign."""
-    from datetime import timedelta
     try:
         ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
     except Ticket.DoesNotExist:
@@ -389,15 +548,8 @@ def confirm_review_ticket(request, ticket_id: str, payload: TicketConfirmReviewI
     except Exception as e:
         raise HttpError(400, f"Status transition failed: {str(e)}")
         
-    # 3. Calculate SLA (Due Date)
-    sla_hours = {
-        'urgent': 8,
-        'high': 24,
-        'medium': 48,
-        'low': 72
-    }.get(payload.priority.lower(), 48)
-    
-    ticket.due_at = timezone.now() + timedelta(hours=sla_hours)
+    # 3. Calculate SLA (Due Date) from the department's SLA template
+    SLAPolicyResolver.start_clock(ticket)
     
     ticket.save()
     
@@ -411,7 +563,7 @@ def confirm_review_ticket(request, ticket_id: str, payload: TicketConfirmReviewI
     if ticket.status != old_status:
         changes['status'] = {'old': old_status, 'new': ticket.status}
 
-    AuditLog.objects.create(
+    audit_writer.log(
         action_type=ActionType.UPDATE,
         category=AuditCategory.TICKET,
         model_name='Ticket',
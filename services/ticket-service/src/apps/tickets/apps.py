@@ -0,0 +1,13 @@
+"""
+App configuration for Ticket app.
+"""
+from django.apps import AppConfig
+
+
+class TicketsConfig(AppConfig):
+    name = 'apps.tickets'
+    label = 'tickets'
+
+    def ready(self):
+        # Register signal receivers
+        from . import signals  # noqa: F401
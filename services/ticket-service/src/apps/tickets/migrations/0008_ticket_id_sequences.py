@@ -0,0 +1,50 @@
+# Seeds the per-year ticket_id sequences used by TicketIdAllocator
+
+import string
+
+from django.db import migrations
+
+
+def seed_sequences(apps, schema_editor):
+    """Create a sequence per year already in use, starting after its highest number."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    Ticket = apps.get_model('tickets', 'Ticket')
+    last_numbers = {}
+    for ticket_id in Ticket.objects.filter(ticket_id__startswith='HD-').values_list('ticket_id', flat=True):
+        try:
+            _, year, number = ticket_id.split('-')
+            # Numbers past 9999 carry a width marker (HD-2025-A10000)
+            year, number = int(year), int(number.lstrip(string.ascii_uppercase))
+        except ValueError:
+            continue
+        last_numbers[year] = max(number, last_numbers.get(year, 0))
+
+    with schema_editor.connection.cursor() as cursor:
+        for year, last_num in last_numbers.items():
+            cursor.execute(
+                f'CREATE SEQUENCE IF NOT EXISTS ticket_id_seq_{year} AS bigint MINVALUE 1 START 1'
+            )
+            cursor.execute('SELECT setval(%s, %s, true)', [f'ticket_id_seq_{year}', last_num])
+
+
+def drop_sequences(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT relname FROM pg_class WHERE relkind = 'S' AND relname LIKE 'ticket\\_id\\_seq\\_%'")
+        for (name,) in cursor.fetchall():
+            cursor.execute(f'DROP SEQUENCE IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0007_alter_subticket_priority_alter_ticket_priority'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_sequences, drop_sequences),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:42
+
+from django.db import migrations, models
+
+
+# Initial counts; from here on TicketCounterService maintains them
+BACKFILL_COUNTERS = """
+    INSERT INTO ticket_counters (department_id, status, priority, assignee_id, ticket_count)
+    SELECT department_id, status, priority, assignee_id, count(*)
+    FROM tickets WHERE NOT is_deleted
+    GROUP BY department_id, status, priority, assignee_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0009_ticket_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department_id', models.UUIDField(blank=True, null=True)),
+                ('status', models.CharField(max_length=50)),
+                ('priority', models.CharField(max_length=20)),
+                ('assignee_id', models.UUIDField(blank=True, null=True)),
+                ('ticket_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Ticket Counter',
+                'verbose_name_plural': 'Ticket Counters',
+                'db_table': 'ticket_counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ticketcounter',
+            constraint=models.UniqueConstraint(fields=('department_id', 'status', 'priority', 'assignee_id'), name='ticket_counters_group_uniq', nulls_distinct=False),
+        ),
+        migrations.RunSQL(BACKFILL_COUNTERS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:50
+
+from django.db import migrations
+
+
+# departments.active_tickets was never maintained; from here on ticket
+# transitions keep it current (DepartmentLoadService)
+BACKFILL_ACTIVE_TICKETS = """
+    UPDATE departments d SET active_tickets = (
+        SELECT count(*) FROM tickets t
+        WHERE t.department_id = d.id AND NOT t.is_deleted
+          AND t.status NOT IN ('draft', 'rejected', 'resolved', 'closed')
+    )
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0010_ticket_counters'),
+        ('departments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_ACTIVE_TICKETS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-18 04:52
+
+from django.db import migrations, models
+
+
+# Deadlines missed before the scanner existed are not notified all at once
+MARK_OVERDUE = "UPDATE tickets SET sla_breached_at = due_at WHERE due_at < now()"
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0011_department_load_backfill'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_breached_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_reminded_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunSQL(MARK_OVERDUE, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('due_at__isnull', False), ('is_deleted', False), ('sla_breached_at__isnull', True), ('status__in', ('submitted', 'pending', 'under_review', 'assigned', 'in_progress', 'approved', 'reopened'))), fields=['due_at'], name='tickets_sla_due_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.1 on 2026-10-18 05:26
+
+from django.db import migrations, models
+
+
+# Deadlines so far came from the template at review (clock from creation) or
+# by hand (update_sla, audited as "SLA Change: ..."); reopened tickets' clock
+# start is unknown, so those are left alone like manual deadlines
+BACKFILL_STARTED_AT = """
+UPDATE tickets t SET sla_started_at = t.created_at
+WHERE t.due_at IS NOT NULL AND t.reopen_count = 0
+  AND NOT EXISTS (
+    SELECT 1 FROM audit_logs a
+    WHERE a.model_name = 'Ticket' AND a.object_id = t.id AND a.reason LIKE 'SLA Change:%'
+  )
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0012_ticket_sla_queue'),
+        ('audit', '0002_partition_audit_logs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_STARTED_AT, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-18 05:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0013_ticket_sla_started_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='tickets_ticket_id_prefix',
+        ),
+    ]
@@ -2,4 +2,5 @@ from .ticket import Ticket
 from .sub_ticket import SubTicket
 from .sla_template import SLATemplate
 from .attachment import Attachment
+from .ticket_counter import TicketCounter
 
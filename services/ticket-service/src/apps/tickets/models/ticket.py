@@ -3,7 +3,9 @@ Ticket model for Ticket Service.
 """
 import sys
 from pathlib import Path
-from django.db import models
+from django.db import models, router, transaction
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django_fsm import FSMField, transition
 from django.utils import timezone
@@ -36,6 +38,19 @@ class Priority(models.TextChoices):
     LOW = 'low', 'Low'
 
 
+# Statuses in which the SLA clock runs and due_at is watched (see SLAScanner);
+# postponed tickets and tickets waiting for an approver are paused
+SLA_STATUSES = (
+    TicketStatus.SUBMITTED,
+    TicketStatus.PENDING,
+    TicketStatus.UNDER_REVIEW,
+    TicketStatus.ASSIGNED,
+    TicketStatus.IN_PROGRESS,
+    TicketStatus.APPROVED,
+    TicketStatus.REOPENED,
+)
+
+
 class Ticket(BaseModel):
     """
     Ticket model with FSM for status management.
@@ -48,22 +63,25 @@ class Ticket(BaseModel):
     def save(self, *args, **kwargs):
         # Only generate ticket_id when status is not 'draft' AND ticket_id is empty
         if not self.ticket_id and self.status != 'draft':
-            # Generate ticket_id on first non-draft save
-            year = timezone.now().year
-            # Get the last ticket number for this year
-            last_ticket = Ticket.objects.filter(
-                ticket_id__startswith=f'HD-{year}-'
-            ).order_by('-ticket_id').first()
-            
-            if last_ticket and last_ticket.ticket_id:
-                last_num = int(last_ticket.ticket_id.split('-')[-1])
-                new_num = last_num + 1
-            else:
-                new_num = 1
-            
-            self.ticket_id = f'HD-{year}-{str(new_num).zfill(4)}'
+            # Generate ticket_id on first non-draft save from the per-year sequence
+            # (lazy import: the services package imports this module)
+            from ..services.ticket_id_allocator import TicketIdAllocator
+            self.ticket_id = TicketIdAllocator.next_ticket_id()
         
-        super().save(*args, **kwargs)
+        # One transaction with the post_save receivers (counters, department
+        # load, outbox events): they commit or roll back with the ticket row
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+        self._sla_reset = False
+    
+    def _do_update(self, base_qs, using, pk_val, values, update_fields, forced_update):
+        # The SLA flags are written by SLAScanner (queryset.update) and
+        # set_due_at() only: an instance loaded before a scan must not clear
+        # them when saved after it
+        if update_fields is None and not getattr(self, '_sla_reset', False):
+            values = [value for value in values if value[0].name not in self.SLA_FLAG_FIELDS]
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
     
     # Status with FSM
     status = FSMField(default=TicketStatus.DRAFT, protected=True, db_index=True)
@@ -77,6 +95,11 @@ class Ticket(BaseModel):
     
     # Dates
     due_at = models.DateTimeField(null=True, blank=True)
+    # Start of the SLA clock due_at was computed from; NULL for a deadline set by hand
+    sla_started_at = models.DateTimeField(null=True, blank=True)
+    # SLA notifications sent for the current due_at (reset by set_due_at)
+    sla_reminded_at = models.DateTimeField(null=True, blank=True)
+    sla_breached_at = models.DateTimeField(null=True, blank=True)
     
     # Version and Reopen
     version = models.IntegerField(default=1)
@@ -92,6 +115,17 @@ class Ticket(BaseModel):
     # Progress
     progress_percent = models.IntegerField(default=0, validators=[MinValueValidator(0), MaxValueValidator(100)])
     
+    # Full-text search document, maintained by PostgreSQL (see TicketSelector.search)
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('ticket_id', 'title', weight='A', config='english')
+            + SearchVector('category', weight='B', config='english')
+            + SearchVector('description', weight='C', config='english')
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    
     class Meta:
         db_table = 'tickets'
         verbose_name = 'Ticket'
@@ -103,12 +137,67 @@ class Ticket(BaseModel):
             models.Index(fields=['assignee_id']),
             models.Index(fields=['is_deleted', 'status']),
             models.Index(fields=['created_at']),
+            GinIndex(fields=['search_vector'], name='tickets_search_gin'),
+            # Partial ticket_id matches: infixes (LIKE '%2025-00%'); prefixes (LIKE 'HD-2025-00%')
+            # use the varchar_pattern_ops index Django creates for the unique ticket_id
+            GinIndex(fields=['ticket_id'], opclasses=['gin_trgm_ops'], name='tickets_ticket_id_trgm'),
+            # SLA due-time queue: only open tickets whose deadline has not been missed yet
+            models.Index(
+                fields=['due_at'],
+                name='tickets_sla_due_idx',
+                condition=models.Q(
+                    status__in=SLA_STATUSES, is_deleted=False, due_at__isnull=False, sla_breached_at__isnull=True
+                ),
+            ),
         ]
         ordering = ['-created_at']
     
     def __str__(self):
         return f"#{self.id} - {self.title}"
     
+    # Fields grouping tickets in the dashboard counters (ticket_counters)
+    COUNTER_FIELDS = ('department_id', 'status', 'priority', 'assignee_id')
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the counter group as loaded, so saves can move the ticket between groups
+        if set(cls.COUNTER_FIELDS).issubset(field_names) and 'is_deleted' in field_names:
+            instance._loaded_counter_key = instance.counter_key()
+        return instance
+    
+    def counter_key(self):
+        """Dashboard counter group of this ticket, None if it is not counted (deleted)."""
+        if self.is_deleted:
+            return None
+        return tuple(
+            self._meta.get_field(name).to_python(getattr(self, name))
+            for name in self.COUNTER_FIELDS
+        )
+    
+    # Reminder / breach markers of the current deadline (see _do_update())
+    SLA_FLAG_FIELDS = ('sla_reminded_at', 'sla_breached_at')
+    
+    def set_due_at(self, due_at, started_at=None):
+        """
+        Set a new SLA deadline; reminder and breach are notified again for it.
+
+        A plain save() leaves sla_reminded_at and sla_breached_at as they are
+        in the database (see _do_update); only the next save() after this
+        call, or one naming them in update_fields, writes them.
+
+        Args:
+            due_at: The deadline
+            started_at: Start of the SLA clock due_at was computed from (see
+                SLAPolicyResolver.start_clock); None for a deadline set by
+                hand, which template changes leave alone
+        """
+        self.due_at = due_at
+        self.sla_started_at = started_at
+        self.sla_reminded_at = None
+        self.sla_breached_at = None
+        self._sla_reset = True
+    
     def increment_version(self):
         """Increment version on reopen."""
         if self.pk:
@@ -161,6 +250,9 @@ class Ticket(BaseModel):
             raise ValueError("Maximum reopen limit reached")
         self.reopen_count += 1
         self.increment_version()
+        # SLA clock restarts with the reopen
+        from ..services.sla_policy import SLAPolicyResolver
+        SLAPolicyResolver.start_clock(self)
     
     @transition(field=status, source=[TicketStatus.SUBMITTED, TicketStatus.PENDING, TicketStatus.UNDER_REVIEW, TicketStatus.POSTPONED], target=TicketStatus.REJECTED)
     def reject(self, reason: str):
@@ -0,0 +1,34 @@
+"""
+TicketCounter model for Ticket Service.
+"""
+from django.db import models
+
+
+class TicketCounter(models.Model):
+    """
+    Number of live (not deleted) tickets per department, status, priority and assignee.
+
+    Maintained by TicketCounterService on every ticket save and delete, so
+    dashboards read one row per group instead of counting tickets.
+    """
+    department_id = models.UUIDField(null=True, blank=True)
+    status = models.CharField(max_length=50)
+    priority = models.CharField(max_length=20)
+    assignee_id = models.UUIDField(null=True, blank=True)
+    ticket_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'ticket_counters'
+        verbose_name = 'Ticket Counter'
+        verbose_name_plural = 'Ticket Counters'
+        constraints = [
+            # One row per group, unassigned / no department included
+            models.UniqueConstraint(
+                fields=['department_id', 'status', 'priority', 'assignee_id'],
+                name='ticket_counters_group_uniq',
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.department_id}/{self.status}/{self.priority}/{self.assignee_id}: {self.ticket_count}"
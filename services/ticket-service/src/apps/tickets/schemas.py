@@ -46,6 +46,51 @@ class TicketOut(Schema):
     attachments: List[AttachmentOut] = []
 
 
+class TicketPageOut(Schema):
+    """Cursor-paginated ticket list output schema."""
+    items: List[TicketOut]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+class TicketSearchHitOut(TicketOut):
+    """Ticket search result: ticket plus relevance and highlighted text."""
+    rank: float
+    title_highlight: str  # HTML-escaped, matches wrapped in <mark>
+    description_highlight: str  # HTML-escaped fragments around the matches
+
+
+class TicketSearchOut(Schema):
+    """Cursor-paginated ticket search output schema."""
+    items: List[TicketSearchHitOut]
+    next_cursor: Optional[str] = None
+
+
+class TicketCountOut(Schema):
+    """Ticket count of one dashboard group (fields not grouped on are null)."""
+    department_id: Optional[UUID] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    assignee_id: Optional[UUID] = None
+    count: int
+
+
+class TicketStatsOut(Schema):
+    """Dashboard ticket counts output schema."""
+    total: int
+    groups: List[TicketCountOut]
+
+
+class DepartmentLoadOut(Schema):
+    """Department load (active tickets against capacity) for routing."""
+    department_id: UUID
+    active_tickets: int
+    total_capacity: int
+    queue_enabled: bool
+    available: int
+    at_capacity: bool
+
+
 class TicketIn(Schema):
     """Ticket input schema."""
     title: str
@@ -1,13 +1,110 @@
 """
 Optimized query selectors for Ticket app.
 """
-from django.db.models import Q
+import html
+import re
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Cast, Coalesce
+
+from hdms_core.pagination import ranked_keyset_paginate
 from .models import Ticket
 
+# Text search configuration of Ticket.search_vector
+SEARCH_CONFIG = 'english'
+
+# Search terms that may be (part of) a ticket_id, e.g. "HD-2025-00" or "2025-0012"
+TICKET_ID_FRAGMENT = re.compile(r'[0-9A-Z-]*[0-9][0-9A-Z-]*')
+
+# Match markers for ts_headline, turned into <mark> after HTML-escaping
+_HIGHLIGHT_START = '\x02'
+_HIGHLIGHT_STOP = '\x03'
+
+
+def _mark(headline: str) -> str:
+    """HTML-escape a headline and wrap its matches in <mark>."""
+    return html.escape(headline).replace(_HIGHLIGHT_START, '<mark>').replace(_HIGHLIGHT_STOP, '</mark>')
+
 
 class TicketSelector:
     """Optimized queries for Ticket model."""
     
+    @staticmethod
+    def with_related(queryset):
+        """Prefetch what TicketOut serialises (attachments) in one query per page."""
+        # The search document is only used inside queries
+        return queryset.defer('search_vector').prefetch_related('attachments')
+    
+    @staticmethod
+    def search(queryset, text: str, cursor: str = None, page_size: int = 50, max_candidates: int = 500):
+        """
+        Full-text search over ticket_id, title, category and description.
+        
+        Matches the GIN-indexed search_vector; terms that look like a ticket
+        id also match ticket_id prefixes or substrings. Results
+        are ordered by relevance (ts_rank, plus trigram similarity for ids) and
+        paged on (rank, created_at, id). Only the newest max_candidates
+        matches are ranked, which bounds the cost of very common terms.
+        
+        Args:
+            queryset: Filtered ticket queryset
+            text: Search terms (websearch syntax: "quoted phrase", -exclude, or)
+            cursor: next_cursor from the previous page
+            page_size: Tickets per page
+            max_candidates: Number of newest matches to rank
+        
+        Returns:
+            Tuple of (tickets, next_cursor). Each ticket has rank,
+            title_highlight and description_highlight (HTML-escaped, matches
+            wrapped in <mark>).
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        text = text.strip()
+        query = SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+        matches = Q(search_vector=query)
+        rank = SearchRank(F('search_vector'), query)
+        
+        fragment = text.upper()
+        if len(fragment) >= 3 and TICKET_ID_FRAGMENT.fullmatch(fragment):
+            # Prefixes use the btree pattern index; the trigram index serves the rest
+            if fragment.startswith('HD-'):
+                matches |= Q(ticket_id__startswith=fragment)
+            else:
+                matches |= Q(ticket_id__contains=fragment)
+            rank = rank + Coalesce(TrigramSimilarity('ticket_id', fragment), Value(0.0))
+        
+        # Rank only the newest matches: a common term can match a large share
+        # of all tickets, and ranking every match would read each of them
+        candidates = queryset.filter(matches).order_by('-created_at').values('id')[:max_candidates]
+        # ts_rank is a float4; as float8 the cursor round-trips the exact value
+        queryset = queryset.filter(id__in=candidates).annotate(rank=Cast(rank, FloatField()))
+        tickets, next_cursor = ranked_keyset_paginate(queryset, 'rank', cursor=cursor, page_size=page_size)
+        TicketSelector._add_highlights(tickets, query)
+        return tickets, next_cursor
+    
+    @staticmethod
+    def _add_highlights(tickets, query):
+        """Highlight matches in title and description, for the given page only."""
+        if not tickets:
+            return
+        headline_options = {'config': SEARCH_CONFIG, 'start_sel': _HIGHLIGHT_START, 'stop_sel': _HIGHLIGHT_STOP}
+        headlines = Ticket.objects.filter(id__in=[ticket.id for ticket in tickets]).order_by().annotate(
+            title_headline=SearchHeadline('title', query, highlight_all=True, **headline_options),
+            description_headline=SearchHeadline(
+                'description', query, max_fragments=2, max_words=30, min_words=10,
+                fragment_delimiter=' … ', **headline_options
+            ),
+        ).values_list('id', 'title_headline', 'description_headline')
+        by_id = {pk: (title, description) for pk, title, description in headlines}
+        
+        for ticket in tickets:
+            title, description = by_id.get(ticket.id, (ticket.title, ticket.description))
+            ticket.title_highlight = _mark(title)
+            ticket.description_highlight = _mark(description)
+    
     @staticmethod
     def get_user_tickets(user_id: str, status: str = None):
         """Get tickets for a user (as requestor or assignee)."""
@@ -17,22 +114,22 @@ class TicketSelector:
         )
         if status:
             queryset = queryset.filter(status=status)
-        return queryset.select_related().order_by('-created_at')
+        return TicketSelector.with_related(queryset).order_by('-created_at')
     
     @staticmethod
     def get_department_tickets(department_id: str):
         """Get tickets for a department."""
-        return Ticket.objects.filter(
+        return TicketSelector.with_related(Ticket.objects.filter(
             department_id=department_id,
             is_deleted=False
-        ).select_related().order_by('-created_at')
+        )).order_by('-created_at')
     
     @staticmethod
     def get_tickets_by_status(status: str):
         """Get tickets by status."""
-        return Ticket.objects.filter(
+        return TicketSelector.with_related(Ticket.objects.filter(
             status=status,
             is_deleted=False
-        ).select_related().order_by('-created_at')
+        )).order_by('-created_at')
 
 
@@ -2,7 +2,13 @@
 Ticket services package.
 """
 from .ticket_service import TicketService
+from .ticket_id_allocator import TicketIdAllocator
+from .ticket_counters import TicketCounterService
+from .department_load import DepartmentLoadService
+from .ticket_events import TicketEventService
+from .sla_scanner import SLAScanner
+from .sla_policy import SLAPolicyResolver
 
-__all__ = ['TicketService']
+__all__ = ['TicketService', 'TicketIdAllocator', 'TicketCounterService', 'DepartmentLoadService', 'TicketEventService', 'SLAScanner', 'SLAPolicyResolver']
 
 
@@ -0,0 +1,155 @@
+"""
+Department load (active tickets against capacity) for routing decisions.
+
+departments.active_tickets is owned by the department model but only the
+ticket service knows when it changes: every ticket save or delete that moves
+a ticket into or out of an active status of a department sends
+department_load_changed, and the receiver (apps.tickets.signals) adjusts the
+department row in the same transaction as the ticket write. Departments are
+always adjusted in the same order, so concurrent transitions cannot deadlock.
+
+get_load() serves a department's load from the cache (dropped when the
+counter changes, expired after DEPARTMENT_LOAD_CACHE_TTL so capacity edits
+in the user service are picked up), so capacity and queue_enabled checks
+never count tickets. recount() rebuilds active_tickets from the tickets table
+and repairs drift (scripts/reconcile_ticket_counters.py runs it periodically).
+"""
+import logging
+from collections import defaultdict
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Count
+from django.dispatch import Signal
+
+from departments.models import Department
+from ..models.ticket import Ticket, TicketStatus
+
+logger = logging.getLogger(__name__)
+
+# Statuses that count towards a department's load (everything not draft or finished)
+ACTIVE_STATUSES = frozenset(
+    status for status in TicketStatus.values
+    if status not in (TicketStatus.DRAFT, TicketStatus.REJECTED, TicketStatus.RESOLVED, TicketStatus.CLOSED)
+)
+
+# Sent with department_id and delta when tickets enter (+) or leave (-) a department's load
+department_load_changed = Signal()
+
+CACHE_PREFIX = 'hdms:department_load:'
+
+
+def _active_department(counter_key: Optional[tuple]):
+    """Department whose load a ticket in this counter group adds to, if any."""
+    if counter_key is None:
+        return None
+    department_id, status = counter_key[0], counter_key[1]
+    if department_id is None or status not in ACTIVE_STATUSES:
+        return None
+    return department_id
+
+
+class DepartmentLoadService:
+    """Event-driven maintenance and cached reads of department load."""
+
+    @staticmethod
+    def cache_key(department_id) -> str:
+        return f'{CACHE_PREFIX}{department_id}'
+
+    @staticmethod
+    def ticket_moved(old_key: Optional[tuple], new_key: Optional[tuple]):
+        """
+        Send department_load_changed for a ticket moving between counter groups.
+
+        Args:
+            old_key: Counter group the ticket left (None if created)
+            new_key: Counter group the ticket is in now (None if deleted)
+        """
+        old_department = _active_department(old_key)
+        new_department = _active_department(new_key)
+        if old_department == new_department:
+            return
+
+        deltas = defaultdict(int)
+        if old_department is not None:
+            deltas[old_department] -= 1
+        if new_department is not None:
+            deltas[new_department] += 1
+        for department_id in sorted(deltas, key=str):
+            department_load_changed.send(sender=Ticket, department_id=department_id, delta=deltas[department_id])
+
+    @classmethod
+    def invalidate(cls, department_id):
+        cache.delete(cls.cache_key(department_id))
+
+    @classmethod
+    def get_load(cls, department_id) -> Optional[dict]:
+        """
+        Current load of a department.
+
+        Returns:
+            Dict with active_tickets, total_capacity, queue_enabled, available
+            and at_capacity, or None if the department does not exist
+        """
+        key = cls.cache_key(department_id)
+        load = cache.get(key)
+        if load is not None:
+            return load
+
+        row = Department.objects.filter(id=department_id).values(
+            'id', 'active_tickets', 'total_capacity', 'queue_enabled'
+        ).first()
+        if row is None:
+            return None
+
+        load = {
+            'department_id': row['id'],
+            'active_tickets': row['active_tickets'],
+            'total_capacity': row['total_capacity'],
+            'queue_enabled': row['queue_enabled'],
+            'available': max(row['total_capacity'] - row['active_tickets'], 0),
+            'at_capacity': row['active_tickets'] >= row['total_capacity'],
+        }
+        cache.set(key, load, getattr(settings, 'DEPARTMENT_LOAD_CACHE_TTL', 60))
+        return load
+
+    @classmethod
+    def should_queue(cls, department_id) -> bool:
+        """Whether a new ticket for this department waits in its queue (full and queueing enabled)."""
+        load = cls.get_load(department_id)
+        return bool(load and load['queue_enabled'] and load['at_capacity'])
+
+    @classmethod
+    def recount(cls) -> int:
+        """
+        Recount active_tickets of all departments from the tickets table.
+
+        The department rows are locked first, so a concurrent ticket
+        transition either commits before the count or waits for it.
+
+        Returns:
+            Number of departments corrected
+        """
+        using = router.db_for_write(Department)
+        corrected = {}
+        with transaction.atomic(using=using):
+            current = dict(
+                Department.objects.using(using).select_for_update().order_by('id').values_list('id', 'active_tickets')
+            )
+            actual = dict(
+                Ticket.objects.using(using)
+                .filter(status__in=ACTIVE_STATUSES, is_deleted=False, department_id__in=list(current))
+                .values_list('department_id').annotate(count=Count('id')).order_by()
+            )
+            for department_id, active_tickets in current.items():
+                count = actual.get(department_id, 0)
+                if active_tickets != count:
+                    Department.objects.using(using).filter(id=department_id).update(active_tickets=count)
+                    corrected[department_id] = (active_tickets, count)
+
+        for department_id, (was, now) in corrected.items():
+            logger.warning(f"Department {department_id} active_tickets corrected from {was} to {now}")
+            cls.invalidate(department_id)
+        return len(corrected)
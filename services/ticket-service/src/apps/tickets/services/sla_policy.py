@@ -0,0 +1,164 @@
+"""
+SLA policy: resolution hours per priority from the SLATemplate table.
+
+The active templates are loaded into an in-process index (department ->
+hours per priority), so computing a due date does not query the database.
+A department's own template takes precedence over the global one (no
+department); without any template the built-in DEFAULT_RESOLUTION_HOURS
+apply. Saving or deleting a template bumps a version in the shared cache;
+each process checks it at most every SLA_POLICY_CHECK_INTERVAL seconds and
+reloads the index when it changed (the saving process reloads at once).
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+from django.utils import timezone
+
+from ..models.sla_template import SLATemplate
+from ..models.ticket import SLA_STATUSES, Priority, Ticket
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'hdms:sla_templates:version'
+
+# Resolution hours when no template applies
+DEFAULT_RESOLUTION_HOURS = {
+    Priority.URGENT: 8,
+    Priority.HIGH: 24,
+    Priority.MEDIUM: 48,
+    Priority.LOW: 72,
+}
+
+
+def _resolution_hours(template: SLATemplate) -> Dict[str, int]:
+    """Resolution hours per priority of a template."""
+    return {
+        # Templates have no urgent column: urgent never gets longer than high
+        Priority.URGENT: min(template.resolution_time, template.high_priority_resolution),
+        Priority.HIGH: template.high_priority_resolution,
+        Priority.MEDIUM: template.medium_priority_resolution,
+        Priority.LOW: template.low_priority_resolution,
+    }
+
+
+class SLAPolicyResolver:
+    """Template-based due dates from an in-memory index."""
+
+    _lock = threading.Lock()
+    _index: Optional[Dict[Optional[str], Dict[str, int]]] = None
+    _version = None
+    _checked_at = 0.0
+
+    @classmethod
+    def _load(cls) -> Dict[Optional[str], Dict[str, int]]:
+        """Build the index: one entry per department with a template, None for the global one."""
+        index = {}
+        # Most recently changed template wins if a department has several
+        for template in SLATemplate.objects.filter(is_active=True).order_by('updated_at'):
+            key = str(template.department_id) if template.department_id else None
+            index[key] = _resolution_hours(template)
+        logger.debug(f"Loaded SLA policy index ({len(index)} templates)")
+        return index
+
+    @classmethod
+    def get_index(cls) -> Dict[Optional[str], Dict[str, int]]:
+        """Current index, reloaded if another process changed the templates."""
+        now = time.monotonic()
+        interval = getattr(settings, 'SLA_POLICY_CHECK_INTERVAL', 30)
+        index = cls._index
+        if index is not None and now - cls._checked_at < interval:
+            return index
+
+        with cls._lock:
+            if cls._index is not None and now - cls._checked_at < interval:
+                return cls._index
+            version = cache.get(VERSION_KEY)
+            if cls._index is None or version != cls._version:
+                cls._index = cls._load()
+                cls._version = version
+            cls._checked_at = now
+            return cls._index
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the index here and make every other process reload it on its next check."""
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, 1, None)
+        with cls._lock:
+            cls._index = None
+
+    @classmethod
+    def resolution_hours(cls, priority: str, department_id=None) -> int:
+        """Resolution hours for a priority, from the department's template, else the global one."""
+        index = cls.get_index()
+        hours = index.get(str(department_id)) if department_id else None
+        if hours is None:
+            hours = index.get(None, DEFAULT_RESOLUTION_HOURS)
+        return hours.get(priority, hours[Priority.MEDIUM])
+
+    @classmethod
+    def due_at(cls, priority: str, department_id=None, start: datetime = None) -> datetime:
+        """Due date of a ticket whose SLA clock starts at start (default: now)."""
+        return (start or timezone.now()) + timedelta(hours=cls.resolution_hours(priority, department_id))
+
+    @classmethod
+    def start_clock(cls, ticket: Ticket, start: datetime = None):
+        """Set a ticket's deadline from an SLA clock starting at start (default: now); not saved."""
+        start = start or timezone.now()
+        ticket.set_due_at(cls.due_at(ticket.priority.lower(), ticket.department_id, start=start), started_at=start)
+
+    @classmethod
+    def recompute(cls, department_id=None, batch_size: int = 1000) -> int:
+        """
+        Recompute due_at of open tickets after a template change.
+
+        The SLA clock of each ticket keeps its start (sla_started_at: review
+        or latest reopen); deadlines set by hand are left alone. Updated
+        tickets are reminded and escalated again for their new deadline.
+
+        Args:
+            department_id: Only tickets of this department (default: all)
+
+        Returns:
+            Number of tickets updated
+        """
+        queryset = Ticket.objects.filter(
+            status__in=SLA_STATUSES, is_deleted=False, due_at__isnull=False, sla_started_at__isnull=False
+        )
+        if department_id:
+            queryset = queryset.filter(department_id=department_id)
+        using = router.db_for_write(Ticket)
+
+        updated = 0
+        last_id = None
+        while True:
+            page = queryset.order_by('id')
+            if last_id is not None:
+                page = page.filter(id__gt=last_id)
+            rows = list(page.values_list('id', 'priority', 'department_id', 'sla_started_at', 'due_at')[:batch_size])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            changed = []
+            for ticket_id, priority, ticket_department_id, started_at, due_at in rows:
+                new_due_at = cls.due_at(priority, ticket_department_id, start=started_at)
+                if new_due_at != due_at:
+                    changed.append(Ticket(
+                        id=ticket_id, due_at=new_due_at, sla_reminded_at=None, sla_breached_at=None
+                    ))
+            if changed:
+                with transaction.atomic(using=using):
+                    Ticket.objects.using(using).bulk_update(changed, ['due_at', 'sla_reminded_at', 'sla_breached_at'])
+                updated += len(changed)
+        if updated:
+            logger.info(f"Recomputed due dates of {updated} tickets")
+        return updated
@@ -0,0 +1,165 @@
+"""
+Precomputed ticket counts for dashboards.
+
+ticket_counters holds the number of live tickets per (department_id, status,
+priority, assignee_id) group. Every ticket save or delete - FSM transitions
+(submit, assign, resolve, close, ...) as well as reassignments and priority
+changes - moves the ticket between groups with a single upsert in the same
+transaction. Groups are always updated in the same order, so concurrent
+transitions cannot deadlock on the counter rows.
+
+Changes that bypass Model.save() (queryset.update(), raw SQL) or a failure
+between the ticket write and the counter update leave the counters off;
+reconcile() recounts them from the tickets table and repairs any drift
+(scripts/reconcile_ticket_counters.py runs it periodically).
+"""
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connections, router, transaction
+from django.db.models import Sum
+
+from ..models.ticket import Ticket
+from ..models.ticket_counter import TicketCounter
+
+logger = logging.getLogger(__name__)
+
+GROUP_FIELDS = Ticket.COUNTER_FIELDS
+
+
+def _sort_key(item):
+    # Fixed lock order for the counter rows of one upsert (None first)
+    return tuple('' if value is None else str(value) for value in item[0])
+
+
+class TicketCounterService:
+    """Incremental maintenance and reads of the dashboard counters."""
+
+    @staticmethod
+    def _connection():
+        return connections[router.db_for_write(TicketCounter)]
+
+    @classmethod
+    def apply(cls, deltas: Dict[tuple, int]):
+        """
+        Add deltas to counter groups.
+
+        Args:
+            deltas: Change in ticket count per group key (see Ticket.counter_key)
+        """
+        rows = sorted(((key, delta) for key, delta in deltas.items() if delta), key=_sort_key)
+        if not rows:
+            return
+
+        table = TicketCounter._meta.db_table
+        placeholders = ', '.join(['(%s::uuid, %s, %s, %s::uuid, %s)'] * len(rows))
+        params = []
+        for key, delta in rows:
+            params.extend(key)
+            params.append(delta)
+
+        with cls._connection().cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} (department_id, status, priority, assignee_id, ticket_count) '
+                f'VALUES {placeholders} '
+                f'ON CONFLICT (department_id, status, priority, assignee_id) '
+                f'DO UPDATE SET ticket_count = {table}.ticket_count + EXCLUDED.ticket_count',
+                params,
+            )
+
+    @classmethod
+    def record_save(cls, ticket: Ticket, created: bool) -> Optional[Tuple[Optional[tuple], Optional[tuple]]]:
+        """
+        Move a saved ticket from the group it was loaded in to its current group.
+
+        Returns:
+            (old_key, new_key) if the ticket changed groups, else None
+        """
+        new_key = ticket.counter_key()
+        if created:
+            old_key = None
+        elif hasattr(ticket, '_loaded_counter_key'):
+            old_key = ticket._loaded_counter_key
+        else:
+            # Not loaded from the database (or with deferred fields): previous
+            # group unknown, left to reconcile()
+            logger.debug(f"Ticket {ticket.pk} saved without a loaded counter group")
+            ticket._loaded_counter_key = new_key
+            return None
+
+        if old_key == new_key:
+            return None
+        deltas = defaultdict(int)
+        if old_key is not None:
+            deltas[old_key] -= 1
+        if new_key is not None:
+            deltas[new_key] += 1
+        cls.apply(deltas)
+        ticket._loaded_counter_key = new_key
+        return old_key, new_key
+
+    @classmethod
+    def record_delete(cls, ticket: Ticket) -> Optional[tuple]:
+        """Remove a hard-deleted ticket from its group and return that group's key."""
+        old_key = getattr(ticket, '_loaded_counter_key', ticket.counter_key())
+        if old_key is not None:
+            cls.apply({old_key: -1})
+        return old_key
+
+    @staticmethod
+    def get_stats(group_by: Iterable[str] = GROUP_FIELDS, **filters) -> List[dict]:
+        """
+        Ticket counts aggregated over the counter groups.
+
+        Args:
+            group_by: Subset of GROUP_FIELDS to group on
+            **filters: Exact-match filters on GROUP_FIELDS
+
+        Returns:
+            One dict per non-empty group: the group_by fields plus count
+        """
+        group_by = list(group_by)
+        queryset = TicketCounter.objects.filter(**filters)
+        if not group_by:
+            total = queryset.aggregate(count=Sum('ticket_count'))['count']
+            return [{'count': total}] if total else []
+        return list(
+            queryset.values(*group_by).annotate(count=Sum('ticket_count')).filter(count__gt=0).order_by(*group_by)
+        )
+
+    @classmethod
+    def reconcile(cls) -> int:
+        """
+        Recount all groups from the tickets table and fix drifted counters.
+
+        The drift of every group is computed by one statement, so tickets
+        and counters are compared in the same snapshot (a ticket write and
+        its counter update commit together) without blocking counter
+        writes. The corrections are then added as deltas, which commute
+        with the changes committed meanwhile.
+
+        Returns:
+            Number of counter rows corrected
+        """
+        table = TicketCounter._meta.db_table
+        tickets = Ticket._meta.db_table
+        group = ', '.join(GROUP_FIELDS)
+        connection = cls._connection()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT {group}, sum(ticket_count) FROM ('
+                f'SELECT {group}, count(*) AS ticket_count FROM {tickets} WHERE NOT is_deleted GROUP BY {group} '
+                f'UNION ALL SELECT {group}, -ticket_count FROM {table}'
+                f') drift GROUP BY {group} HAVING sum(ticket_count) <> 0'
+            )
+            deltas = {tuple(row[:-1]): int(row[-1]) for row in cursor.fetchall()}
+
+        if deltas:
+            with transaction.atomic(using=connection.alias):
+                cls.apply(deltas)
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DELETE FROM {table} WHERE ticket_count = 0')
+            logger.warning(f"Ticket counters reconciled: {len(deltas)} groups corrected")
+        return len(deltas)
@@ -0,0 +1,73 @@
+"""
+Ticket domain events for the event bus.
+
+Derived from the counter group move of a save (see TicketCounterService):
+the loaded and new (department_id, status, priority, assignee_id) tell what
+changed without another query. Events are written to the outbox in the
+ticket's transaction (Ticket.save is atomic) and fan out to the other
+services (notifications, chat) after commit.
+"""
+from typing import Optional
+
+from events.services import EventOutbox
+
+from ..models.ticket import Ticket
+
+# Ticket event types
+TICKET_CREATED = 'ticket.created'
+TICKET_STATUS_CHANGED = 'ticket.status_changed'
+TICKET_ASSIGNED = 'ticket.assigned'
+TICKET_DELETED = 'ticket.deleted'
+
+
+def ticket_payload(ticket: Ticket) -> dict:
+    """Ticket fields carried by every ticket event."""
+    return {
+        'id': ticket.id,
+        'ticket_id': ticket.ticket_id,
+        'title': ticket.title,
+        'status': ticket.status,
+        'priority': ticket.priority,
+        'requestor_id': ticket.requestor_id,
+        'department_id': ticket.department_id,
+        'assignee_id': ticket.assignee_id,
+    }
+
+
+class TicketEventService:
+    """Publishes ticket events to the outbox."""
+
+    @staticmethod
+    def record_save(ticket: Ticket, created: bool, old_key: Optional[tuple], new_key: Optional[tuple]):
+        """
+        Publish the events of a ticket save that moved it between counter groups.
+
+        Args:
+            old_key: Counter group before the save (None if created or restored)
+            new_key: Counter group after the save (None if soft-deleted)
+        """
+        if created:
+            EventOutbox.publish(TICKET_CREATED, ticket_payload(ticket), aggregate_id=ticket.id)
+            return
+        if new_key is None:
+            EventOutbox.publish(TICKET_DELETED, ticket_payload(ticket), aggregate_id=ticket.id)
+            return
+        if old_key is None:
+            # Restored from soft delete
+            return
+
+        old_status, old_assignee = old_key[1], old_key[3]
+        new_status, new_assignee = new_key[1], new_key[3]
+        if new_assignee is not None and new_assignee != old_assignee:
+            payload = ticket_payload(ticket)
+            payload['old_assignee_id'] = old_assignee
+            EventOutbox.publish(TICKET_ASSIGNED, payload, aggregate_id=ticket.id)
+        if new_status != old_status:
+            payload = ticket_payload(ticket)
+            payload['old_status'] = old_status
+            EventOutbox.publish(TICKET_STATUS_CHANGED, payload, aggregate_id=ticket.id)
+
+    @staticmethod
+    def record_delete(ticket: Ticket):
+        """Publish the deletion of a hard-deleted ticket."""
+        EventOutbox.publish(TICKET_DELETED, ticket_payload(ticket), aggregate_id=ticket.id)
@@ -0,0 +1,137 @@
+"""
+Allocation of human-readable ticket IDs (HD-YYYY-NNNN).
+
+Numbers come from one PostgreSQL sequence per year (ticket_id_seq_<year>).
+nextval() is O(1), never blocks and is not rolled back with the surrounding
+transaction, so concurrent submits can neither collide nor queue behind each
+other. With TICKET_ID_SEQUENCE_CACHE > 1 every database session pre-allocates
+a small range of numbers, at the cost of gaps and IDs that are not strictly
+chronological across workers.
+"""
+import string
+from typing import Optional
+
+from django.conf import settings
+from django.db import connections, router, transaction, IntegrityError, ProgrammingError
+from django.utils import timezone
+from psycopg2 import errorcodes
+
+TICKET_ID_PREFIX = 'HD'
+MIN_DIGITS = 4
+
+
+def sequence_name(year: int) -> str:
+    """Name of the sequence backing ticket numbers for a year."""
+    return f'ticket_id_seq_{int(year)}'
+
+
+def format_ticket_id(year: int, number: int) -> str:
+    """
+    Format a ticket number as HD-YYYY-NNNN.
+
+    Numbers up to 9999 keep the original zero-padded form. Wider numbers get a
+    width marker (A = 5 digits, B = 6, ...) so that IDs keep sorting correctly
+    as plain strings: HD-2025-9999 < HD-2025-A10000 < HD-2025-B100000.
+    """
+    digits = str(number)
+    if len(digits) <= MIN_DIGITS:
+        return f'{TICKET_ID_PREFIX}-{year}-{digits.zfill(MIN_DIGITS)}'
+    marker = string.ascii_uppercase[len(digits) - MIN_DIGITS - 1]
+    return f'{TICKET_ID_PREFIX}-{year}-{marker}{digits}'
+
+
+def parse_ticket_number(ticket_id: str) -> int:
+    """Extract the numeric part of a ticket ID produced by format_ticket_id()."""
+    return int(ticket_id.rsplit('-', 1)[-1].lstrip(string.ascii_uppercase))
+
+
+class TicketIdAllocator:
+    """Allocates ticket IDs from per-year PostgreSQL sequences."""
+
+    # Years whose sequence is known to exist (per process)
+    _known_years = set()
+
+    @staticmethod
+    def _connection():
+        from ..models.ticket import Ticket
+        return connections[router.db_for_write(Ticket)]
+
+    @classmethod
+    def ensure_sequence(cls, year: int):
+        """
+        Create the sequence for a year if it does not exist yet.
+
+        An existing sequence (e.g. seeded by migration 0008, or created
+        before TICKET_ID_SEQUENCE_CACHE changed) gets the configured CACHE.
+        """
+        if year in cls._known_years:
+            return
+
+        cache = int(max(getattr(settings, 'TICKET_ID_SEQUENCE_CACHE', 1), 1))
+        name = sequence_name(year)
+        connection = cls._connection()
+        try:
+            # Savepoint: a concurrent CREATE may still race on the catalog
+            with transaction.atomic(using=connection.alias):
+                with connection.cursor() as cursor:
+                    cursor.execute(f'CREATE SEQUENCE IF NOT EXISTS {name} AS bigint MINVALUE 1 START 1 CACHE {cache}')
+        except (IntegrityError, ProgrammingError) as e:
+            # Another worker created it first (duplicate catalog row or relation)
+            if getattr(e.__cause__, 'pgcode', None) not in (errorcodes.UNIQUE_VIOLATION, errorcodes.DUPLICATE_TABLE):
+                raise
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT cache_size FROM pg_sequences WHERE schemaname = current_schema() AND sequencename = %s',
+                [name],
+            )
+            row = cursor.fetchone()
+            if row and row[0] != cache:
+                cursor.execute(f'ALTER SEQUENCE {name} CACHE {cache}')
+
+        # Inside a transaction (e.g. Ticket.save) the sequence exists only once it commits
+        transaction.on_commit(lambda: cls._known_years.add(year), using=connection.alias)
+
+    @classmethod
+    def next_number(cls, year: Optional[int] = None) -> int:
+        """Allocate the next ticket number for a year (defaults to the current year)."""
+        year = year or timezone.now().year
+        cls.ensure_sequence(year)
+        with cls._connection().cursor() as cursor:
+            cursor.execute('SELECT nextval(%s)', [sequence_name(year)])
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def next_ticket_id(cls, year: Optional[int] = None) -> str:
+        """Allocate the next formatted ticket ID, e.g. HD-2025-0042."""
+        year = year or timezone.now().year
+        return format_ticket_id(year, cls.next_number(year))
+
+    @classmethod
+    def reseed(cls, year: Optional[int] = None) -> int:
+        """
+        Move a year's sequence past the highest ticket ID already issued.
+
+        Run during maintenance (e.g. after importing tickets): sessions that
+        already cached a range keep handing it out until it is used up.
+
+        Returns:
+            Highest existing ticket number for the year (0 if none)
+        """
+        from ..models.ticket import Ticket
+
+        year = year or timezone.now().year
+        cls.ensure_sequence(year)
+
+        # Width markers keep string order == numeric order, so this is an index lookup
+        last_ticket = Ticket.objects.with_deleted().filter(
+            ticket_id__startswith=f'{TICKET_ID_PREFIX}-{year}-'
+        ).order_by('-ticket_id').first()
+        last_num = parse_ticket_number(last_ticket.ticket_id) if last_ticket else 0
+
+        with cls._connection().cursor() as cursor:
+            if last_num:
+                cursor.execute('SELECT setval(%s, %s, true)', [sequence_name(year), last_num])
+            else:
+                cursor.execute('SELECT setval(%s, 1, false)', [sequence_name(year)])
+        return last_num
@@ -1,9 +1,16 @@
 """
 Signals for Ticket app.
 """
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.db import transaction
 from django.dispatch import receiver
-from .models import Ticket
+from departments.services import DepartmentService
+from hdms_core.clients.ticket_client import TicketClient
+from .models import SLATemplate, Ticket
+from .services.department_load import DepartmentLoadService, department_load_changed
+from .services.sla_policy import SLAPolicyResolver
+from .services.ticket_events import TicketEventService
+from .services.ticket_counters import TicketCounterService
 
 
 @receiver(pre_save, sender=Ticket)
@@ -17,6 +24,37 @@ def ticket_pre_save(sender, instance, **kwargs):
 def ticket_saved(sender, instance, created, **kwargs):
     """Handle ticket save signal."""
     # Add audit logging or notifications here
-    pass
+    # Dashboard counters follow every transition / reassignment in the same transaction
+    moved = TicketCounterService.record_save(instance, created)
+    if moved:
+        DepartmentLoadService.ticket_moved(*moved)
+        # Fanned out to the other services by the outbox relay after commit
+        TicketEventService.record_save(instance, created, *moved)
+    ticket_id = instance.id
+    transaction.on_commit(lambda: TicketClient.invalidate(ticket_id))
+
+
+@receiver(post_delete, sender=Ticket)
+def ticket_deleted(sender, instance, **kwargs):
+    """Handle ticket delete signal."""
+    old_key = TicketCounterService.record_delete(instance)
+    DepartmentLoadService.ticket_moved(old_key, None)
+    if old_key is not None:
+        # Soft-deleted tickets were announced when they were deleted
+        TicketEventService.record_delete(instance)
+    ticket_id = instance.id
+    transaction.on_commit(lambda: TicketClient.invalidate(ticket_id))
+
+
+@receiver(department_load_changed)
+def department_load_changed_handler(sender, department_id, delta, **kwargs):
+    """Keep departments.active_tickets in step with ticket transitions."""
+    DepartmentService.adjust_active_tickets(department_id, delta)
+    transaction.on_commit(lambda: DepartmentLoadService.invalidate(department_id))
 
 
+@receiver(post_save, sender=SLATemplate)
+@receiver(post_delete, sender=SLATemplate)
+def sla_template_changed(sender, instance, **kwargs):
+    """Reload the SLA policy index in every process once the change is committed."""
+    transaction.on_commit(SLAPolicyResolver.invalidate)
@@ -0,0 +1,87 @@
+"""
+Dashboard counters (TicketCounterService).
+
+Every ticket save moves the ticket between counter groups in the same
+transaction; reconcile() repairs changes that bypassed save().
+"""
+import uuid
+
+from django.test import TestCase
+
+from apps.tickets.models import Ticket
+from apps.tickets.models.ticket_counter import TicketCounter
+from apps.tickets.services.ticket_counters import TicketCounterService
+
+
+class TicketCounterTests(TestCase):
+    """Counter groups follow ticket saves and are repaired by reconcile()."""
+
+    def setUp(self):
+        self.department_id = uuid.uuid4()
+
+    def create_ticket(self, **fields):
+        fields = {
+            'title': 'Printer on fire', 'description': 'Smoke', 'requestor_id': uuid.uuid4(),
+            'department_id': self.department_id, 'status': 'submitted', 'priority': 'medium', **fields,
+        }
+        return Ticket.objects.create(**fields)
+
+    def counts(self):
+        """Ticket count per (status, priority, assignee_id) group of the department."""
+        return {
+            (row['status'], row['priority'], row['assignee_id']): row['count']
+            for row in TicketCounterService.get_stats(
+                group_by=['status', 'priority', 'assignee_id'], department_id=self.department_id,
+            )
+        }
+
+    def test_create_counts_ticket(self):
+        self.create_ticket()
+        self.create_ticket()
+
+        self.assertEqual(self.counts(), {('submitted', 'medium', None): 2})
+
+    def test_save_moves_ticket_between_groups(self):
+        ticket = Ticket.objects.get(pk=self.create_ticket().pk)
+        assignee_id = uuid.uuid4()
+
+        ticket.priority = 'high'
+        ticket.assignee_id = assignee_id
+        ticket.save()
+
+        self.assertEqual(self.counts(), {('submitted', 'high', assignee_id): 1})
+        self.assertEqual(ticket._loaded_counter_key, (self.department_id, 'submitted', 'high', assignee_id))
+        # Already moved: saving again changes nothing
+        self.assertIsNone(TicketCounterService.record_save(ticket, created=False))
+        self.assertEqual(self.counts(), {('submitted', 'high', assignee_id): 1})
+
+    def test_save_without_group_change_is_not_recorded(self):
+        ticket = Ticket.objects.get(pk=self.create_ticket().pk)
+
+        ticket.title = 'Printer fixed'
+        self.assertIsNone(TicketCounterService.record_save(ticket, created=False))
+        ticket.save()
+
+        self.assertEqual(self.counts(), {('submitted', 'medium', None): 1})
+
+    def test_soft_delete_removes_ticket(self):
+        ticket = Ticket.objects.get(pk=self.create_ticket().pk)
+
+        ticket.is_deleted = True
+        ticket.save()
+
+        self.assertEqual(self.counts(), {})
+
+    def test_reconcile_repairs_queryset_updates(self):
+        ticket = self.create_ticket()
+        self.create_ticket()
+        # queryset.update() bypasses save(), so the counters drift
+        Ticket.objects.filter(pk=ticket.pk).update(priority='critical')
+        self.assertEqual(self.counts(), {('submitted', 'medium', None): 2})
+
+        corrected = TicketCounterService.reconcile()
+
+        self.assertEqual(corrected, 2)
+        self.assertEqual(self.counts(), {('submitted', 'medium', None): 1, ('submitted', 'critical', None): 1})
+        self.assertFalse(TicketCounter.objects.filter(ticket_count=0).exists())
+        self.assertEqual(TicketCounterService.reconcile(), 0)
@@ -0,0 +1,78 @@
+"""
+Query counts of the ticket read endpoints.
+
+TicketSelector.with_related prefetches the attachments TicketOut serialises,
+so the number of queries does not grow with the number of tickets or
+attachments.
+"""
+import uuid
+
+from django.test import RequestFactory, TestCase
+
+from apps.tickets import api
+from apps.tickets.models import Attachment, Ticket
+
+TICKETS = 5
+ATTACHMENTS_PER_TICKET = 3
+
+
+class TicketQueryCountTests(TestCase):
+    """Ticket list and detail endpoints run a fixed number of queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.requestor_id = uuid.uuid4()
+        cls.tickets = [
+            Ticket.objects.create(
+                title=f'Ticket {number}', description='Printer on fire',
+                requestor_id=cls.requestor_id, status='submitted',
+            )
+            for number in range(TICKETS)
+        ]
+        Attachment.objects.bulk_create([
+            Attachment(
+                ticket=ticket, file_id=uuid.uuid4(), filename=f'photo-{number}.png',
+                file_size=1024, content_type='image/png',
+            )
+            for ticket in cls.tickets
+            for number in range(ATTACHMENTS_PER_TICKET)
+        ])
+
+    def setUp(self):
+        self.request = RequestFactory().get('/api/v1/tickets/')
+
+    def test_list_tickets(self):
+        # Tickets, attachments
+        with self.assertNumQueries(2):
+            tickets = api.list_tickets(self.request, requestor_id=str(self.requestor_id))
+
+        self.assertEqual(len(tickets), TICKETS)
+        self.assertTrue(all(len(ticket.attachments) == ATTACHMENTS_PER_TICKET for ticket in tickets))
+
+    def test_list_tickets_paged(self):
+        # Page, attachments, total
+        with self.assertNumQueries(3):
+            page = api.list_tickets_paged(self.request, requestor_id=str(self.requestor_id), page_size=TICKETS - 1)
+
+        self.assertEqual(len(page['items']), TICKETS - 1)
+        self.assertEqual(page['total'], TICKETS)
+        self.assertTrue(all(len(ticket.attachments) == ATTACHMENTS_PER_TICKET for ticket in page['items']))
+
+        # Page, attachments
+        with self.assertNumQueries(2):
+            page = api.list_tickets_paged(
+                self.request, requestor_id=str(self.requestor_id), cursor=page['next_cursor'], include_total=False,
+            )
+
+        self.assertEqual(len(page['items']), 1)
+        self.assertIsNone(page['total'])
+
+    def test_get_ticket(self):
+        ticket = self.tickets[0]
+
+        # Ticket, attachments
+        with self.assertNumQueries(2):
+            result = api.get_ticket(self.request, str(ticket.id))
+
+        self.assertEqual(result.id, ticket.id)
+        self.assertEqual(len(result.attachments), ATTACHMENTS_PER_TICKET)
@@ -0,0 +1,92 @@
+"""
+SLA deadline scan (SLAScanner).
+
+A scan marks missed and upcoming deadlines batch by batch and publishes one
+event per ticket; marked tickets are not notified again until set_due_at()
+gives them a new deadline.
+"""
+import uuid
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from events.models import OutboxEvent
+
+from apps.tickets.models import Ticket
+from apps.tickets.services.sla_scanner import TICKET_SLA_BREACHED, TICKET_SLA_WARNING, SLAScanner
+
+BATCH_SIZE = 2
+
+
+@override_settings(SLA_SCAN_BATCH_SIZE=BATCH_SIZE, SLA_REMINDER_WINDOW_MINUTES=60)
+class SLAScannerTests(TestCase):
+    """Breaches and reminders are recorded once per deadline, in batches."""
+
+    def setUp(self):
+        self.now = timezone.now()
+
+    def create_ticket(self, due_in: timedelta, **fields):
+        fields = {
+            'title': 'Printer on fire', 'description': 'Smoke', 'requestor_id': uuid.uuid4(),
+            'status': 'submitted', 'due_at': self.now + due_in, **fields,
+        }
+        return Ticket.objects.create(**fields)
+
+    def events(self, event_type):
+        return set(OutboxEvent.objects.filter(event_type=event_type).values_list('aggregate_id', flat=True))
+
+    def test_scan_processes_every_batch(self):
+        overdue = [self.create_ticket(-timedelta(minutes=minutes)) for minutes in range(1, 2 * BATCH_SIZE + 2)]
+        upcoming = [self.create_ticket(timedelta(minutes=minutes)) for minutes in (10, 20, 30)]
+        later = self.create_ticket(timedelta(hours=5))
+
+        result = SLAScanner.scan(now=self.now)
+
+        self.assertEqual(result, {'breached': len(overdue), 'reminded': len(upcoming)})
+        self.assertEqual(self.events(TICKET_SLA_BREACHED), {ticket.id for ticket in overdue})
+        self.assertEqual(self.events(TICKET_SLA_WARNING), {ticket.id for ticket in upcoming})
+        self.assertEqual(Ticket.objects.filter(sla_breached_at=self.now).count(), len(overdue))
+        self.assertEqual(Ticket.objects.filter(sla_reminded_at=self.now).count(), len(upcoming))
+        later = Ticket.objects.get(pk=later.pk)
+        self.assertIsNone(later.sla_reminded_at)
+        self.assertIsNone(later.sla_breached_at)
+
+    def test_rescan_notifies_nothing_twice(self):
+        self.create_ticket(-timedelta(minutes=5))
+        self.create_ticket(timedelta(minutes=5))
+        SLAScanner.scan(now=self.now)
+
+        self.assertEqual(SLAScanner.scan(now=self.now + timedelta(seconds=30)), {'breached': 0, 'reminded': 0})
+        self.assertEqual(OutboxEvent.objects.filter(event_type__in=[TICKET_SLA_BREACHED, TICKET_SLA_WARNING]).count(), 2)
+
+    def test_closed_and_deleted_tickets_are_skipped(self):
+        self.create_ticket(-timedelta(minutes=5), status='closed')
+        self.create_ticket(-timedelta(minutes=5), is_deleted=True)
+        self.create_ticket(timedelta(minutes=5), status='draft')
+
+        self.assertEqual(SLAScanner.scan(now=self.now), {'breached': 0, 'reminded': 0})
+
+    def test_new_deadline_is_notified_again(self):
+        ticket = self.create_ticket(-timedelta(minutes=5))
+        SLAScanner.scan(now=self.now)
+        # Loaded after the scan, so the breach flag is set on the instance too
+        ticket = Ticket.objects.get(pk=ticket.pk)
+        self.assertIsNotNone(ticket.sla_breached_at)
+
+        ticket.set_due_at(self.now - timedelta(minutes=1))
+        ticket.save()
+
+        self.assertEqual(SLAScanner.scan(now=self.now), {'breached': 1, 'reminded': 0})
+        self.assertEqual(OutboxEvent.objects.filter(event_type=TICKET_SLA_BREACHED, aggregate_id=ticket.id).count(), 2)
+
+    def test_stale_instance_keeps_breach(self):
+        ticket = Ticket.objects.get(pk=self.create_ticket(-timedelta(minutes=5)).pk)
+        SLAScanner.scan(now=self.now)
+
+        # Loaded before the scan: saving it must not clear the flag the scan set
+        ticket.title = 'Printer still on fire'
+        ticket.save()
+
+        self.assertIsNotNone(Ticket.objects.get(pk=ticket.pk).sla_breached_at)
+        self.assertEqual(SLAScanner.scan(now=self.now), {'breached': 0, 'reminded': 0})
@@ -74,6 +74,7 @@ INSTALLED_APPS = [
     # Shared apps
     'users',  # Shared User model
     'departments',  # Referenced by User model
+    'events',  # Transactional outbox and event bus
     # Local apps
     'apps.tickets',
     'apps.approvals',
@@ -89,6 +90,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'hdms_core.db_router.ReplicaRoutingMiddleware',
 ]
 
 # CORS Configuration
@@ -141,7 +143,11 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
         'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
         'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
+        # Persistent connections to PgBouncer (0 closes the connection after every request)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        # Transaction pooling: server-side cursors cannot span transactions
+        'DISABLE_SERVER_SIDE_CURSORS': True,
         'OPTIONS': {
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
@@ -149,6 +155,24 @@ DATABASES = {
     }
 }
 
+# Read replicas (hdms_core.db_router): comma-separated host[:port] list serving
+# the same database with the same credentials. Empty = everything uses the primary.
+DATABASE_REPLICAS = []
+for index, replica in enumerate(filter(None, config('DB_REPLICA_HOSTS', default='').split(',')), start=1):
+    host, _, port = replica.strip().partition(':')
+    alias = f'replica{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': host,
+        'PORT': port or DATABASES['default']['PORT'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['hdms_core.db_router.ReadReplicaRouter']
+REPLICA_MAX_LAG = config('DB_REPLICA_MAX_LAG', default=5.0, cast=float)  # seconds
+REPLICA_LAG_CHECK_INTERVAL = config('DB_REPLICA_LAG_CHECK_INTERVAL', default=5.0, cast=float)  # seconds
+REPLICA_STICKY_SECONDS = config('DB_REPLICA_STICKY_SECONDS', default=10, cast=int)
+
 # Cache Configuration (Redis)
 REDIS_PASSWORD = config('REDIS_PASSWORD', default='')
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@redis:6379/0" if REDIS_PASSWORD else "redis://redis:6379/0"
@@ -204,6 +228,11 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# RemoteJWTAuthentication caches (hdms_core.authentication)
+JWT_USER_CACHE_TTL = config('JWT_USER_CACHE_TTL', default=60, cast=int)  # seconds
+JWT_USER_CACHE_SIZE = config('JWT_USER_CACHE_SIZE', default=10000, cast=int)
+JWT_TOKEN_CACHE_SIZE = config('JWT_TOKEN_CACHE_SIZE', default=10000, cast=int)
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -219,6 +248,63 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Inter-service client cache (hdms_core.clients.cache), in seconds
+CLIENT_CACHE_TTLS = {
+    'user': config('CLIENT_CACHE_USER_TTL', default=300, cast=int),
+    'ticket': config('CLIENT_CACHE_TICKET_TTL', default=60, cast=int),
+}
+CLIENT_CACHE_NEGATIVE_TTL = config('CLIENT_CACHE_NEGATIVE_TTL', default=30, cast=int)
+CLIENT_CACHE_LOCAL_TTL = config('CLIENT_CACHE_LOCAL_TTL', default=10, cast=int)
+CLIENT_CACHE_STALE_TTL = config('CLIENT_CACHE_STALE_TTL', default=86400, cast=int)
+
+# Inter-service HTTP connection pools (hdms_core.clients.HTTPClient)
+HTTP_CLIENT_POOL_CONNECTIONS = config('HTTP_CLIENT_POOL_CONNECTIONS', default=10, cast=int)
+HTTP_CLIENT_POOL_MAXSIZE = config('HTTP_CLIENT_POOL_MAXSIZE', default=10, cast=int)
+
+# Per-target circuit breaker and bulkhead (hdms_core.clients.resilience)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = config('CIRCUIT_BREAKER_FAILURE_THRESHOLD', default=5, cast=int)
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = config('CIRCUIT_BREAKER_RECOVERY_TIMEOUT', default=30, cast=int)  # seconds
+BULKHEAD_MAX_CONCURRENT = config('BULKHEAD_MAX_CONCURRENT', default=20, cast=int)
+
+# Bearer token for /internal/stats/ (hdms_core.metrics); the endpoint is disabled while empty
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Ticket list pagination (keyset / cursor based)
+TICKET_PAGE_SIZE = config('TICKET_PAGE_SIZE', default=50, cast=int)
+TICKET_MAX_PAGE_SIZE = config('TICKET_MAX_PAGE_SIZE', default=200, cast=int)
+# Ticket search: number of newest matches ranked by relevance
+TICKET_SEARCH_MAX_CANDIDATES = config('TICKET_SEARCH_MAX_CANDIDATES', default=500, cast=int)
+
+# Department load (active tickets vs capacity): cache lifetime of get_load() results
+DEPARTMENT_LOAD_CACHE_TTL = config('DEPARTMENT_LOAD_CACHE_TTL', default=60, cast=int)  # seconds
+
+# SLA scanner (scripts/scan_sla.py): reminder lead time and tickets per transaction
+SLA_REMINDER_WINDOW_MINUTES = config('SLA_REMINDER_WINDOW_MINUTES', default=60, cast=int)
+SLA_SCAN_BATCH_SIZE = config('SLA_SCAN_BATCH_SIZE', default=500, cast=int)
+# SLA templates: seconds between checks whether another process changed them
+SLA_POLICY_CHECK_INTERVAL = config('SLA_POLICY_CHECK_INTERVAL', default=30, cast=int)
+
+# Event bus (events app): outbox relay publishing to Redis Streams
+EVENT_BUS_URL = config('EVENT_BUS_URL', default=REDIS_URL)
+EVENT_STREAM_MAXLEN = config('EVENT_STREAM_MAXLEN', default=100000, cast=int)  # entries kept per stream
+OUTBOX_BATCH_SIZE = config('OUTBOX_BATCH_SIZE', default=100, cast=int)
+OUTBOX_POLL_INTERVAL = config('OUTBOX_POLL_INTERVAL', default=0.5, cast=float)  # seconds
+EVENT_RETENTION_HOURS = config('EVENT_RETENTION_HOURS', default=168, cast=int)
+
+# Ticket ID allocation: numbers each DB session pre-allocates from the per-year sequence
+TICKET_ID_SEQUENCE_CACHE = config('TICKET_ID_SEQUENCE_CACHE', default=1, cast=int)
+
+# Audit logging: buffered bulk writes (see apps.audit.services.AuditLogWriter)
+AUDIT_ASYNC = config('AUDIT_ASYNC', default=True, cast=bool)
+AUDIT_BATCH_SIZE = config('AUDIT_BATCH_SIZE', default=100, cast=int)
+AUDIT_FLUSH_INTERVAL = config('AUDIT_FLUSH_INTERVAL', default=1.0, cast=float)
+AUDIT_SPOOL_DIR = config('AUDIT_SPOOL_DIR', default=str(BASE_DIR / 'audit_spool'))
+
+# Audit log partitioning and archival (see apps.audit.partitions)
+AUDIT_PARTITION_MONTHS_AHEAD = config('AUDIT_PARTITION_MONTHS_AHEAD', default=3, cast=int)
+AUDIT_RETENTION_DAYS = config('AUDIT_RETENTION_DAYS', default=7 * 365, cast=int)
+AUDIT_ARCHIVE_DIR = config('AUDIT_ARCHIVE_DIR', default='')
+
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
 
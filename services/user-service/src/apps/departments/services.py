@@ -17,18 +17,19 @@ class DepartmentService:
             return None
     
     @staticmethod
-    def increment_active_tickets(department_id: str):
-        """Increment active tickets count for department."""
+    def adjust_active_tickets(department_id: str, delta: int):
+        """Add delta (positive or negative) to the active tickets count for department."""
         from django.db.models import F
         Department.objects.filter(id=department_id).update(
-            active_tickets=F('active_tickets') + 1
+            active_tickets=F('active_tickets') + delta
         )
     
+    @staticmethod
+    def increment_active_tickets(department_id: str):
+        """Increment active tickets count for department."""
+        DepartmentService.adjust_active_tickets(department_id, 1)
+    
     @staticmethod
     def decrement_active_tickets(department_id: str):
         """Decrement active tickets count for department."""
-        from django.db.models import F
-        Department.objects.filter(id=department_id).update(
-            active_tickets=F('active_tickets') - 1
-        )
-
+        DepartmentService.adjust_active_tickets(department_id, -1)
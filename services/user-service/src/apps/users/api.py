@@ -1,11 +1,14 @@
 """
 User Service API endpoints.
 """
+import uuid
 from ninja import Router
+from ninja.errors import HttpError
 from typing import List
+from django.conf import settings
 from django.contrib.auth import authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
-from apps.users.schemas import UserOut, UserIn, LoginIn, LoginOut, UserImportIn
+from apps.users.schemas import UserOut, UserIn, LoginIn, LoginOut, UserImportIn, UserBatchIn, UserBatchOut
 
 router = Router(tags=["users"])
 
@@ -36,10 +39,34 @@ def list_users(request):
 def get_user(request, user_id: str):
     """Get user by ID."""
     from apps.users.models import User
-    user = User.objects.get(id=user_id, is_deleted=False)
+    try:
+        user = User.objects.get(id=user_id, is_deleted=False)
+    except User.DoesNotExist:
+        raise HttpError(404, "User not found")
     return UserOut.from_orm(user)
 
 
+@router.post("/batch", response=UserBatchOut)
+def get_users_batch(request, payload: UserBatchIn):
+    """Get several users by ID in one call."""
+    from apps.users.selectors import UserSelector
+
+    max_ids = getattr(settings, 'USER_BATCH_MAX_IDS', 100)
+    try:
+        # Canonical form, as the keys of the response
+        ids = list(dict.fromkeys(str(uuid.UUID(user_id)) for user_id in payload.ids))
+    except ValueError:
+        raise HttpError(400, "Invalid user id")
+    if len(ids) > max_ids:
+        raise HttpError(400, f"At most {max_ids} ids per request")
+
+    users = {str(user.id): UserOut.from_orm(user) for user in UserSelector.get_users_by_ids(ids)}
+    return {
+        "users": users,
+        "missing": [user_id for user_id in ids if user_id not in users],
+    }
+
+
 @router.post("/users/import")
 def import_users(request, payload: UserImportIn):
     """Import users from CSV/Excel."""
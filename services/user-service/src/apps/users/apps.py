@@ -0,0 +1,13 @@
+"""
+App configuration for User app.
+"""
+from django.apps import AppConfig
+
+
+class UsersConfig(AppConfig):
+    name = 'apps.users'
+    label = 'users'
+
+    def ready(self):
+        # Register signal receivers
+        from . import signals  # noqa: F401
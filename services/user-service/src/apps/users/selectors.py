@@ -1,6 +1,7 @@
 """
 Optimized query selectors for User app.
 """
+import uuid
 from django.contrib.auth import get_user_model
 from django.db.models import Q
 
@@ -15,6 +16,17 @@ class UserSelector:
         """Get all active users."""
         return User.objects.filter(is_deleted=False, is_active=True).select_related()
     
+    @staticmethod
+    def get_users_by_ids(user_ids):
+        """Get non-deleted users by ID in one query (malformed ids are skipped)."""
+        valid_ids = []
+        for user_id in user_ids:
+            try:
+                valid_ids.append(uuid.UUID(str(user_id)))
+            except ValueError:
+                continue
+        return User.objects.filter(id__in=valid_ids, is_deleted=False)
+    
     @staticmethod
     def get_users_by_role(role: str):
         """Get users by role."""
@@ -19,6 +19,13 @@ SHARED_PATH = docker_shared_path if docker_shared_path.exists() else local_share
 if str(SHARED_PATH) not in sys.path:
     sys.path.insert(0, str(SHARED_PATH))
 
+# Shared hdms_core package (user cache invalidation in apps.users.signals)
+docker_shared_root = Path('/shared')
+local_shared_root = BASE_DIR.parent.parent / 'shared'
+SHARED_ROOT = docker_shared_root if (docker_shared_root / 'hdms_core').exists() else local_shared_root
+if str(SHARED_ROOT) not in sys.path:
+    sys.path.append(str(SHARED_ROOT))
+
 # Import shared logging configuration
 try:
     from logging_config import get_logging_config
@@ -116,7 +123,11 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default='hdms_pwd'),
         'HOST': config('DB_HOST', default='pgbouncer'),  # Connect through PgBouncer
         'PORT': config('DB_PORT', default='6432'),  # PgBouncer port
-        'CONN_MAX_AGE': 0,
+        # Persistent connections to PgBouncer (0 closes the connection after every request)
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool),
+        # Transaction pooling: server-side cursors cannot span transactions
+        'DISABLE_SERVER_SIDE_CURSORS': True,
         'OPTIONS': {
             'connect_timeout': int(config('DB_CONNECT_TIMEOUT', default=20))
             # Note: 'options' parameter not supported by PgBouncer in transaction pooling mode
@@ -192,6 +203,9 @@ TICKET_SERVICE_URL = config('TICKET_SERVICE_URL', default='http://ticket-service
 COMMUNICATION_SERVICE_URL = config('COMMUNICATION_SERVICE_URL', default='http://communication-service:8003')
 FILE_SERVICE_URL = config('FILE_SERVICE_URL', default='http://file-service:8005')
 
+# Upper bound on ids accepted by POST /api/v1/users/batch
+USER_BATCH_MAX_IDS = config('USER_BATCH_MAX_IDS', default=100, cast=int)
+
 # Logging - use shared logging configuration
 LOGGING = get_logging_config()
 